@@ -1,9 +1,12 @@
 from enum import Enum
+import concurrent.futures
+import contextlib
 import math
 import os
 import numpy as np
 import cv2
 import time
+from threading import Event
 from typing import Optional
 
 from ..io.storage import ImageWriter
@@ -12,7 +15,22 @@ class FocusMetric(str, Enum):
     LAPLACIAN = "LaplacianVar"
     TENENGRAD = "Tenengrad"
 
-def metric_value(img, metric: FocusMetric):
+class FocusSearch(str, Enum):
+    UNIFORM = "Coarse-to-fine"
+    GOLDEN = "Golden section"
+
+_INV_PHI = (math.sqrt(5) - 1) / 2
+
+def _buffer(bufs, name, shape, dtype):
+    """Return ``bufs[name]``, replaced first if it no longer fits."""
+    if bufs is None:
+        return None
+    buf = bufs.get(name)
+    if buf is None or buf.shape != shape or buf.dtype != dtype:
+        buf = bufs[name] = np.empty(shape, dtype=dtype)
+    return buf
+
+def metric_value(img, metric: FocusMetric, bufs=None):
     """Compute a focus metric for an image.
 
     Parameters
@@ -22,6 +40,10 @@ def metric_value(img, metric: FocusMetric):
         three-channel RGB image.
     metric : FocusMetric
         The metric to compute.
+    bufs : dict, optional
+        Scratch arrays for the CPU filters, kept between calls so a sweep
+        reuses them instead of allocating per frame.  Entries are replaced
+        when the frame size changes.
 
     Returns
     -------
@@ -37,7 +59,10 @@ def metric_value(img, metric: FocusMetric):
         gray = img
     elif img.ndim == 3:
         if img.shape[2] == 3:
-            gray = cv2.cvtColor(img, cv2.COLOR_RGB2GRAY)
+            gray = cv2.cvtColor(
+                img, cv2.COLOR_RGB2GRAY,
+                dst=_buffer(bufs, "gray", img.shape[:2], img.dtype),
+            )
         elif img.shape[2] == 1:
             gray = img[..., 0]
         else:
@@ -62,8 +87,13 @@ def metric_value(img, metric: FocusMetric):
             lap_gpu = lap_filter.apply(gpu_mat)
             lap = lap_gpu.download()
         else:
-            lap = cv2.Laplacian(gray, cv2.CV_64F)
-        return float(lap.var())
+            # float32 keeps OpenCV on its vectorised filter path; the
+            # statistics below still accumulate in double
+            lap = cv2.Laplacian(
+                gray, cv2.CV_32F, dst=_buffer(bufs, "lap", gray.shape, np.float32)
+            )
+        _, std = cv2.meanStdDev(lap)
+        return float(std[0, 0]) ** 2
     elif metric == FocusMetric.TENENGRAD:
         if use_cuda:
             gpu_mat = cv2.cuda_GpuMat()
@@ -79,16 +109,88 @@ def metric_value(img, metric: FocusMetric):
             gx = gx_gpu.download()
             gy = gy_gpu.download()
         else:
-            gx = cv2.Sobel(gray, cv2.CV_64F, 1, 0, ksize=3)
-            gy = cv2.Sobel(gray, cv2.CV_64F, 0, 1, ksize=3)
-        return float(np.mean(gx * gx + gy * gy))
+            gx = cv2.Sobel(
+                gray, cv2.CV_32F, 1, 0, ksize=3,
+                dst=_buffer(bufs, "gx", gray.shape, np.float32),
+            )
+            gy = cv2.Sobel(
+                gray, cv2.CV_32F, 0, 1, ksize=3,
+                dst=_buffer(bufs, "gy", gray.shape, np.float32),
+            )
+        # sum of squared gradients without building gx*gx + gy*gy temporaries
+        energy = cv2.norm(gx, cv2.NORM_L2SQR) + cv2.norm(gy, cv2.NORM_L2SQR)
+        return float(energy) / gx.size
     else:
         raise ValueError(metric)
 
+def _unimodal(scores, slack=0.05) -> bool:
+    """True if ``scores`` rise to a single peak and then fall.
+
+    Dips smaller than ``slack`` times the score span are taken as frame
+    noise rather than a second peak.  Missing frames (``-inf``) fail.
+    """
+    if not all(math.isfinite(x) for x in scores):
+        return False
+    tol = slack * (max(scores) - min(scores))
+    peak = int(np.argmax(scores))
+    rising = all(x <= y + tol for x, y in zip(scores[:peak], scores[1:peak + 1]))
+    falling = all(x + tol >= y for x, y in zip(scores[peak:], scores[peak + 1:]))
+    return rising and falling
+
+def downsample(img, factor: int, dst=None):
+    """Shrink ``img`` by an integer ``factor`` with area averaging.
+
+    Focus metrics only need to rank frames, and modest area reductions keep
+    that ranking on typical targets, so scoring a smaller image cuts the
+    per-step cost by roughly ``factor**2``.  ``factor <= 1`` returns ``img``.
+    The result is written into ``dst`` when it has the right shape and dtype.
+    """
+    if factor <= 1:
+        return img
+    h, w = img.shape[:2]
+    size = (max(1, w // factor), max(1, h // factor))
+    shape = (size[1], size[0]) + img.shape[2:]
+    if dst is None or dst.shape != shape or dst.dtype != img.dtype:
+        dst = None
+    return cv2.resize(img, size, dst=dst, interpolation=cv2.INTER_AREA)
+
+@contextlib.contextmanager
+def mono_frames(camera):
+    """Run a metric-only sweep with ``camera`` in its fast mono mode.
+
+    The sensor then sends one byte per pixel instead of three and frames
+    reach the metric already single-channel, so no colour conversion is
+    needed.  Cameras without the mode, or already in it, are left alone;
+    otherwise colour capture is restored on exit.
+    """
+    getter = getattr(camera, "get_raw_fast_mono", None)
+    setter = getattr(camera, "set_raw_fast_mono", None)
+    if getter is None or setter is None or getter():
+        yield camera
+        return
+    setter(True)
+    try:
+        wait_frame = getattr(camera, "get_frame_after", None)
+        if wait_frame is not None:
+            # skip frames still in flight in the colour format
+            wait_frame(time.monotonic())
+        yield camera
+    finally:
+        setter(False)
+
 class AutoFocus:
-    def __init__(self, stage, camera):
+    def __init__(self, stage, camera, metric_downsample: int = 1):
         self.stage = stage
         self.camera = camera
+        self.metric_downsample = metric_downsample
+        # scratch arrays reused across frames; frames are scored one at a time
+        self._bufs = {}
+
+    def _score(self, img, metric: FocusMetric) -> float:
+        small = downsample(img, self.metric_downsample, self._bufs.get("small"))
+        if small is not img:
+            self._bufs["small"] = small
+        return metric_value(small, metric, bufs=self._bufs)
 
     def coarse_to_fine(
         self,
@@ -97,46 +199,64 @@ class AutoFocus:
         coarse_step_mm=0.01,
         fine_step_mm=0.002,
         feed_mm_per_min=240,
+        center_z: Optional[float] = None,
+        search: FocusSearch = FocusSearch.UNIFORM,
+        stop_event: Optional[Event] = None,
     ):
+        """Sweep Z around the current position and stop at the sharpest frame.
+
+        ``center_z`` moves the stage to that absolute Z before sweeping, so a
+        caller that already knows roughly where focus is (e.g. the previous
+        leveling point) can run a narrower ``z_range_mm``.  Returns the best
+        offset relative to the sweep centre.
+
+        With ``search=FocusSearch.GOLDEN`` the peak is bracketed by a
+        golden-section search down to ``fine_step_mm`` (one frame per
+        iteration instead of a full sweep).  That assumes a single focus
+        peak; if the frames it grabbed say otherwise the uniform sweep runs
+        instead.
+
+        Setting ``stop_event`` cancels the search at its next step: the stage
+        returns to the sweep centre and a ``RuntimeError`` is raised.
+        """
         if coarse_step_mm <= 0 or fine_step_mm <= 0:
             raise ValueError("coarse_step_mm and fine_step_mm must be > 0")
-        samples = []
+        if center_z is not None:
+            self.stage.move_absolute(z=center_z, feed_mm_per_min=feed_mm_per_min)
+            self.stage.wait_for_moves()
+        if search == FocusSearch.GOLDEN:
+            best = self._golden_section(
+                -z_range_mm, z_range_mm, metric, fine_step_mm, feed_mm_per_min,
+                stop_event=stop_event,
+            )
+            if best is not None:
+                return best
         steps = int(max(1, round(z_range_mm / coarse_step_mm)))
         zs = [(-steps + i) * coarse_step_mm for i in range(2 * steps + 1)]
-        cumulative = 0.0
-        for dz in zs:
-            move = dz - cumulative
-            self.stage.move_relative(dz=move, feed_mm_per_min=feed_mm_per_min)
-            cumulative = dz
+        # one scoring thread: each frame is scored while the stage is already
+        # moving to the next step (OpenCV filters release the GIL)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            samples, cumulative = self._sweep(
+                zs, metric, feed_mm_per_min, 0.03, pool, stop_event
+            )
+            if stop_event and stop_event.is_set():
+                self._cancel(cumulative, feed_mm_per_min)
+            if not samples:
+                return 0.0
+            best_dz, _ = max(samples, key=lambda t: t[1])
+            # Go to coarse best position
+            self.stage.move_relative(dz=(best_dz - cumulative), feed_mm_per_min=feed_mm_per_min)
             self.stage.wait_for_moves()
-            time.sleep(0.03)
-            img = self.camera.snap()
-            if img is None:
-                continue
-            samples.append((dz, metric_value(img, metric)))
-        if not samples:
-            return 0.0
-        best_dz, _ = max(samples, key=lambda t: t[1])
-        # Go to coarse best position
-        self.stage.move_relative(dz=(best_dz - cumulative), feed_mm_per_min=feed_mm_per_min)
-        self.stage.wait_for_moves()
 
-        # Fine sweep around coarse best
-        fine_range = 0.1 * z_range_mm
-        fine_steps = int(max(1, math.floor(fine_range / fine_step_mm)))
-        offsets = [(-fine_steps + i) * fine_step_mm for i in range(2 * fine_steps + 1)]
-        fine_samples = []
-        cumulative = 0.0
-        for offset in offsets:
-            move = offset - cumulative
-            self.stage.move_relative(dz=move, feed_mm_per_min=feed_mm_per_min)
-            self.stage.wait_for_moves()
-            time.sleep(0.02)
-            img = self.camera.snap()
-            if img is None:
-                continue
-            fine_samples.append((best_dz + offset, metric_value(img, metric)))
-            cumulative = offset
+            # Fine sweep around coarse best
+            fine_range = 0.1 * z_range_mm
+            fine_steps = int(max(1, math.floor(fine_range / fine_step_mm)))
+            offsets = [(-fine_steps + i) * fine_step_mm for i in range(2 * fine_steps + 1)]
+            fine_samples, cumulative = self._sweep(
+                offsets, metric, feed_mm_per_min, 0.02, pool, stop_event
+            )
+            if stop_event and stop_event.is_set():
+                self._cancel(best_dz + cumulative, feed_mm_per_min)
 
         if not fine_samples:
             # Return to coarse best if no fine samples were collected
@@ -144,13 +264,92 @@ class AutoFocus:
             self.stage.wait_for_moves()
             return best_dz
 
-        best_fine_dz, _ = max(fine_samples, key=lambda t: t[1])
+        best_fine, _ = max(fine_samples, key=lambda t: t[1])
         # Move to the best fine position
         self.stage.move_relative(
-            dz=(best_fine_dz - (best_dz + cumulative)), feed_mm_per_min=feed_mm_per_min
+            dz=(best_fine - cumulative), feed_mm_per_min=feed_mm_per_min
         )
         self.stage.wait_for_moves()
-        return best_fine_dz
+        return best_dz + best_fine
+
+    def _cancel(self, position, feed_mm_per_min):
+        """Move back ``position`` to the sweep centre and report cancellation."""
+        self.stage.move_relative(dz=-position, feed_mm_per_min=feed_mm_per_min)
+        self.stage.wait_for_moves()
+        raise RuntimeError("operation cancelled")
+
+    def _golden_section(
+        self, lo, hi, metric, tol, feed_mm_per_min, settle_s=0.03, stop_event=None
+    ):
+        """Golden-section search for the sharpest offset in ``[lo, hi]``.
+
+        The two interior points are carried between iterations, so each one
+        costs a single move and frame.  Leaves the stage at the best offset
+        and returns it, or returns ``None`` with the stage back at the centre
+        when the sampled scores are not unimodal.
+        """
+        samples = []
+        position = 0.0
+
+        def evaluate(z):
+            nonlocal position
+            self.stage.move_relative(dz=z - position, feed_mm_per_min=feed_mm_per_min)
+            position = z
+            self.stage.wait_for_moves()
+            time.sleep(settle_s)
+            img = self.camera.snap()
+            score = float("-inf") if img is None else self._score(img, metric)
+            samples.append((z, score))
+            return score
+
+        a, b = lo, hi
+        c = b - _INV_PHI * (b - a)
+        d = a + _INV_PHI * (b - a)
+        fc, fd = evaluate(c), evaluate(d)
+        while b - a > tol:
+            if stop_event and stop_event.is_set():
+                self._cancel(position, feed_mm_per_min)
+            if fc >= fd:
+                b, d, fd = d, c, fc
+                c = b - _INV_PHI * (b - a)
+                fc = evaluate(c)
+            else:
+                a, c, fc = c, d, fd
+                d = a + _INV_PHI * (b - a)
+                fd = evaluate(d)
+
+        if not _unimodal([score for _, score in sorted(samples)]):
+            self.stage.move_relative(dz=-position, feed_mm_per_min=feed_mm_per_min)
+            self.stage.wait_for_moves()
+            return None
+        best, _ = max(samples, key=lambda t: t[1])
+        self.stage.move_relative(dz=best - position, feed_mm_per_min=feed_mm_per_min)
+        self.stage.wait_for_moves()
+        return best
+
+    def _sweep(self, offsets, metric, feed_mm_per_min, settle_s, pool, stop_event=None):
+        """Visit relative Z ``offsets`` in turn and score a frame at each.
+
+        Frames are scored on ``pool`` so the next move overlaps with the
+        metric; the sweep ends early once ``stop_event`` is set.
+
+        Returns ``(samples, position)``: ``(offset, score)`` pairs for the
+        frames grabbed and the offset the stage ended at.
+        """
+        pending = []
+        position = 0.0
+        for offset in offsets:
+            if stop_event and stop_event.is_set():
+                break
+            self.stage.move_relative(dz=offset - position, feed_mm_per_min=feed_mm_per_min)
+            position = offset
+            self.stage.wait_for_moves()
+            time.sleep(settle_s)
+            img = self.camera.snap()
+            if img is None:
+                continue
+            pending.append((offset, pool.submit(self._score, img, metric)))
+        return [(offset, fut.result()) for offset, fut in pending], position
 
     def focus_stack(
         self,
@@ -163,6 +362,8 @@ class AutoFocus:
         feed_mm_per_min: float = 240,
         fmt: str = "png",
         lens_name: Optional[str] = None,
+        stop_event: Optional[Event] = None,
+        background_writes: bool = False,
     ) -> Optional[int]:
         """Sweep Z over ``range_mm`` in ``step_mm`` increments and capture frames.
 
@@ -187,6 +388,14 @@ class AutoFocus:
             Image format passed to :meth:`ImageWriter.save_single`.
         lens_name : str, optional
             Name of the lens used for capture; included in image metadata.
+        stop_event : threading.Event, optional
+            Event used to signal cancellation. When set, the sweep stops, the
+            stage returns to its starting position and a ``RuntimeError`` is
+            raised.
+        background_writes : bool
+            If ``True``, frames are handed to the writer's encoder pool so the
+            next Z step does not wait on encoding. The caller is responsible
+            for flushing ``writer`` once the stack is done.
 
         Returns
         -------
@@ -200,12 +409,15 @@ class AutoFocus:
 
         directory = directory or writer.run_dir
         os.makedirs(directory, exist_ok=True)
+        save_kwargs = {"background": True} if background_writes else {}
 
         steps = int(max(1, round(range_mm / step_mm)))
         zs = [(-steps + i) * step_mm for i in range(2 * steps + 1)]
         cumulative = 0.0
         metrics = []
         for i, dz in enumerate(zs):
+            if stop_event and stop_event.is_set():
+                break
             move = dz - cumulative
             self.stage.move_relative(dz=move, feed_mm_per_min=feed_mm_per_min)
             self.stage.wait_for_moves()
@@ -228,14 +440,17 @@ class AutoFocus:
                 auto_number=False,
                 fmt=fmt,
                 metadata=metadata,
+                **save_kwargs,
             )
             if metric:
-                metrics.append(metric_value(img, metric))
+                metrics.append(self._score(img, metric))
             cumulative = dz
 
         # Return to starting position
         self.stage.move_relative(dz=-cumulative, feed_mm_per_min=feed_mm_per_min)
         self.stage.wait_for_moves()
+        if stop_event and stop_event.is_set():
+            raise RuntimeError("operation cancelled")
 
         if metric and metrics:
             best_idx = int(np.argmax(metrics))
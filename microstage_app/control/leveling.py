@@ -82,7 +82,7 @@ def three_point_level(
         if AutoFocus and camera is not None:  # pragma: no branch
             try:
                 af = AutoFocus(stage, camera)
-                af.coarse_to_fine(metric=FocusMetric.LAPLACIAN)
+                af.coarse_to_fine(metric=FocusMetric.LAPLACIAN, stop_event=stop_event)
                 stage.wait_for_moves()
             except Exception:
                 pass
@@ -103,6 +103,9 @@ def _grid_coords(
 ) -> Iterable[Tuple[float, float]]:
     """Generate XY coordinates for a regular grid within ``rect``.
 
+    Rows are visited in serpentine order (odd rows run right to left) so the
+    stage never travels back across the grid between rows.
+
     Parameters
     ----------
     rect : Tuple[float, float, float, float]
@@ -118,7 +121,8 @@ def _grid_coords(
     dy = (y2 - y1) / (rows - 1) if rows > 1 else 0.0
     for r in range(rows):
         y = y1 + r * dy
-        for c in range(cols):
+        order = range(cols) if r % 2 == 0 else range(cols - 1, -1, -1)
+        for c in order:
             x = x1 + c * dx
             yield x, y
 
@@ -171,7 +175,7 @@ def _probe_point(
         if AutoFocus and camera is not None:  # pragma: no branch
             try:
                 af = AutoFocus(stage, camera)
-                af.coarse_to_fine(metric=FocusMetric.LAPLACIAN)
+                af.coarse_to_fine(metric=FocusMetric.LAPLACIAN, stop_event=stop_event)
                 stage.wait_for_moves()
             except Exception:
                 pass
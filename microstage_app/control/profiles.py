@@ -1,4 +1,5 @@
 import yaml, os, copy
+import contextlib
 from ..utils.log import log
 
 DEFAULTS = {
@@ -168,6 +169,23 @@ class Profiles:
             cur = cur.setdefault(key, {})
         cur[keys[-1]] = value
 
+    @contextlib.contextmanager
+    def transaction(self):
+        """Group several :meth:`set` calls into a single write.
+
+        :meth:`save` calls inside the block are deferred; the profile is
+        written once when the outermost block exits without an error.
+        """
+        self._txn_depth = getattr(self, '_txn_depth', 0) + 1
+        try:
+            yield self
+        finally:
+            self._txn_depth -= 1
+        if not self._txn_depth:
+            self.save()
+
     def save(self):
+        if getattr(self, '_txn_depth', 0):
+            return
         with open(self.PATH, 'w') as f:
             yaml.safe_dump(self.data, f)
@@ -64,6 +64,7 @@ class RasterRunner:
         lens_name=None,
         lens_um_per_px: Optional[float] = None,
         scale_bar_um_per_px: Optional[float] = None,
+        background_writes: bool = False,
     ):
         self.stage = stage
         self.camera = camera
@@ -77,9 +78,10 @@ class RasterRunner:
         self.lens_name = lens_name
         self.lens_um_per_px = lens_um_per_px
         self.scale_bar_um_per_px = scale_bar_um_per_px
+        self.background_writes = background_writes
 
         self.coord_matrix = None
-        self._stop = False
+        self._stop = Event()
 
     def _build_coord_matrix(self):
         """Generate the coordinate matrix for the configured raster mode.
@@ -138,20 +140,55 @@ class RasterRunner:
         self.coord_matrix = matrix
         return matrix
 
+    def _tile_order(self, coord_matrix=None):
+        """Return ``(row, col, x, y)`` for every tile in visiting order.
+
+        Serpentine scans run odd rows backwards.  Built once from
+        ``coord_matrix`` (the runner's own matrix by default) so the scan
+        loop is a flat walk over the path.
+        """
+        if coord_matrix is None:
+            coord_matrix = self._build_coord_matrix()
+        order = []
+        for r, row in enumerate(coord_matrix):
+            forward = (r % 2 == 0) or (not self.cfg.serpentine)
+            cols = range(len(row)) if forward else range(len(row) - 1, -1, -1)
+            order.extend((r, c) + row[c] for c in cols)
+        return order
+
     def stop(self):
-        """Request that the raster scan stop after the current move."""
-        self._stop = True
+        """Request that the raster scan stop after the current move.
+
+        An autofocus or focus stack in progress is cancelled as well; the
+        stage returns to the tile's centre Z first.
+        """
+        self._stop.set()
 
     def run(self, stop_event: Optional[Event] = None):
         """Execute raster scan and capture images for each tile.
 
         The coordinate matrix is generated based on :class:`RasterConfig.mode`
-        and then traversed in either serpentine or raster order.
+        and then traversed in either serpentine or raster order. When
+        ``background_writes`` is set, tiles are encoded off-thread by the
+        writer and all pending writes are flushed before returning.
+        A ``stop_event`` given here becomes the runner's stop flag, so setting
+        it and calling :meth:`stop` are equivalent.
         """
 
+        if stop_event is not None:
+            self._stop = stop_event
+        try:
+            self._scan()
+        finally:
+            flush = getattr(self.writer, "flush", None)
+            if self.background_writes and flush:
+                flush()
+
+    def _scan(self):
         coord_matrix = self._build_coord_matrix()
+        stop = self._stop
 
-        if stop_event and stop_event.is_set():
+        if stop.is_set():
             return
 
         start_x, start_y = coord_matrix[0][0]
@@ -166,86 +203,104 @@ class RasterRunner:
                 and isclose(pos[1], start_y, abs_tol=1e-6)
             )
         ):
-            if stop_event and stop_event.is_set():
-                return
             self.stage.move_absolute(x=start_x, y=start_y)
             self.stage.wait_for_moves()
-            if self._stop:
+            if stop.is_set():
                 return
         current_x, current_y = start_x, start_y
+        save_kwargs = {"background": True} if self.background_writes else {}
+        # Ring-buffered cameras return the first frame exposed after a given
+        # time, which replaces the fixed settle delay after each move.
+        ring = hasattr(self.camera, "get_frame_after")
 
-        for r in range(self.cfg.rows):
-            forward = (r % 2 == 0) or (not self.cfg.serpentine)
-            cols = range(self.cfg.cols) if forward else range(self.cfg.cols - 1, -1, -1)
-            for c in cols:
-                target_x, target_y = coord_matrix[r][c]
-                dx = target_x - current_x
-                dy = target_y - current_y
-                if dx or dy:
-                    self.stage.move_relative(dx=dx, dy=dy)
-                    current_x, current_y = target_x, target_y
-
-                self.stage.wait_for_moves()
-                if self._stop:
-                    return
-                if self.position_cb:
-                    try:
-                        pos = self.stage.get_position()
-                    except Exception:
-                        pos = None
-                    self.position_cb(pos)
-                time.sleep(0.03)
+        # loop invariants: what to do at each tile and the focuser that
+        # does it, so the per-tile body is only moves, frames and writes
+        do_af = bool(self.cfg.autofocus and AutoFocus)
+        do_capture = bool(self.cfg.capture)
+        do_stack = bool(self.cfg.stack and AutoFocus)
+        af = AutoFocus(self.stage, self.camera) if (do_af or do_stack) else None
+
+        for r, c, target_x, target_y in self._tile_order(coord_matrix):
+            dx = target_x - current_x
+            dy = target_y - current_y
+            if dx or dy:
+                self.stage.move_relative(dx=dx, dy=dy)
+                current_x, current_y = target_x, target_y
 
-                do_af = bool(self.cfg.autofocus and AutoFocus)
-                do_capture = bool(self.cfg.capture)
-                do_stack = bool(self.cfg.stack and AutoFocus)
+            self.stage.wait_for_moves()
+            settled = time.monotonic()
+            if stop.is_set():
+                return
+            if self.position_cb:
+                try:
+                    pos = self.stage.get_position()
+                except Exception:
+                    pos = None
+                self.position_cb(pos)
+            if not ring:
+                time.sleep(0.03)
 
-                if do_af:
-                    af = AutoFocus(self.stage, self.camera)
-                    af.coarse_to_fine(metric=FocusMetric.LAPLACIAN)
-                    time.sleep(1)
+            if do_af:
+                try:
+                    af.coarse_to_fine(metric=FocusMetric.LAPLACIAN, stop_event=stop)
+                except RuntimeError:
+                    if stop.is_set():
+                        return
+                    raise
+                time.sleep(1)
+                settled = time.monotonic()
 
-                if do_capture:
+            if do_capture:
+                if ring:
+                    img = self.camera.snap(after=settled)
+                else:
                     img = self.camera.snap()
-                    if img is not None:
-                        if self.scale_bar_um_per_px is not None:
-                            img = draw_scale_bar(img, self.scale_bar_um_per_px)
-                        save_c = c
-                        fname = f"{self.base_name}_r{r:04d}_c{save_c:04d}"
-                        pos = self.stage.get_position()
-                        metadata = {
-                            "Camera": self.camera.name(),
-                            "Position": pos,
-                            "Lens": self.lens_name,
-                            "LensUmPerPx": self.lens_um_per_px,
-                            "Exposure_ms": getattr(self.camera, "get_exposure_ms", lambda: None)(),
-                            "Gain": getattr(self.camera, "get_gain", lambda: None)(),
-                            "Time": datetime.datetime.now().isoformat(),
-                            "Row": r,
-                            "Column": save_c,
-                        }
-                        self.writer.save_single(
-                            img,
-                            directory=self.directory,
-                            filename=fname,
-                            auto_number=self.auto_number,
-                            fmt=self.fmt,
-                            metadata=metadata,
-                        )
-                    time.sleep(1)
-
-                if do_stack:
-                    af = AutoFocus(self.stage, self.camera)
-                    stack_dir = os.path.join(
-                        self.directory or self.writer.run_dir,
-                        f"{self.base_name}_r{r:04d}_c{c:04d}_stack",
+                if img is not None:
+                    if self.scale_bar_um_per_px is not None:
+                        img = draw_scale_bar(img, self.scale_bar_um_per_px)
+                    save_c = c
+                    fname = f"{self.base_name}_r{r:04d}_c{save_c:04d}"
+                    pos = self.stage.get_position()
+                    metadata = {
+                        "Camera": self.camera.name(),
+                        "Position": pos,
+                        "Lens": self.lens_name,
+                        "LensUmPerPx": self.lens_um_per_px,
+                        "Exposure_ms": getattr(self.camera, "get_exposure_ms", lambda: None)(),
+                        "Gain": getattr(self.camera, "get_gain", lambda: None)(),
+                        "Time": datetime.datetime.now().isoformat(),
+                        "Row": r,
+                        "Column": save_c,
+                    }
+                    self.writer.save_single(
+                        img,
+                        directory=self.directory,
+                        filename=fname,
+                        auto_number=self.auto_number,
+                        fmt=self.fmt,
+                        metadata=metadata,
+                        **save_kwargs,
                     )
+                time.sleep(1)
+
+            if do_stack:
+                stack_dir = os.path.join(
+                    self.directory or self.writer.run_dir,
+                    f"{self.base_name}_r{r:04d}_c{c:04d}_stack",
+                )
+                try:
                     af.focus_stack(
                         range_mm=self.cfg.stack_range_mm,
                         step_mm=self.cfg.stack_step_mm,
                         writer=self.writer,
                         directory=stack_dir,
                         lens_name=self.lens_name,
+                        stop_event=stop,
+                        background_writes=self.background_writes,
                     )
-                    time.sleep(1)
+                except RuntimeError:
+                    if stop.is_set():
+                        return
+                    raise
+                time.sleep(1)
 
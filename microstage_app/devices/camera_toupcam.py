@@ -1,4 +1,5 @@
 from __future__ import annotations
+import collections
 import importlib
 import threading
 import time
@@ -147,7 +148,10 @@ class ToupcamCamera:
         self._color_depth = 8
 
         self._last = None     # np.uint8 HxWx(3)
+        # recent (monotonic arrival time, frame) pairs for get_frame_after()
+        self._ring = collections.deque(maxlen=8)
         self._lock = threading.Lock()
+        self._frame_cond = threading.Condition(self._lock)
         self._first_logged = False
         self._cb_thread = None
 
@@ -371,8 +375,10 @@ class ToupcamCamera:
                 self._pull_acc += (t1 - t0)
                 self._proc_acc += (t2 - t1)
 
-                with self._lock:
+                with self._frame_cond:
                     self._last = img
+                    self._ring.append((time.monotonic(), img))
+                    self._frame_cond.notify_all()
 
                 if not self._first_logged:
                     log(f"Camera: first frame {self._w}x{self._h}")
@@ -436,8 +442,36 @@ class ToupcamCamera:
         with self._lock:
             return None if self._last is None else self._last.copy()
 
-    def snap(self, use_cuda: bool = False):
-        frame = self.get_latest_frame()
+    def get_frame_after(self, t0: float, timeout: float = 1.0):
+        """Return the first frame whose exposure started after ``t0``.
+
+        ``t0`` is a :func:`time.monotonic` timestamp, typically taken right
+        after the stage reports its moves as finished.  Frames are kept in a
+        small ring buffer filled by the capture callback, so this returns as
+        soon as a clean frame arrives instead of sleeping for a fixed settle
+        time.  Falls back to the latest frame if none arrives within
+        ``timeout`` seconds.
+        """
+        try:
+            t_min = t0 + max(0.0, self.get_exposure_ms()) / 1000.0
+        except Exception:
+            t_min = t0
+        deadline = time.monotonic() + timeout
+        with self._frame_cond:
+            while True:
+                for t, img in self._ring:
+                    if t >= t_min:
+                        return img.copy()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._is_streaming:
+                    return None if self._last is None else self._last.copy()
+                self._frame_cond.wait(remaining)
+
+    def snap(self, use_cuda: bool = False, after: float | None = None):
+        if after is None:
+            frame = self.get_latest_frame()
+        else:
+            frame = self.get_frame_after(after)
         if frame is None or cv2 is None:
             return frame
         if frame.ndim == 3 and frame.shape[2] == 3:
@@ -781,6 +815,9 @@ class ToupcamCamera:
                     self._cam.StartPullModeWithCallback(self._on_event)
                 self._is_streaming = True
 
+    def get_raw_fast_mono(self) -> bool:
+        return self._raw_mode
+
     def set_raw_fast_mono(self, enable: bool):
         self._raw_mode = bool(enable)
         self._bits = 16 if (self._raw_mode and self._color_depth > 8) else (
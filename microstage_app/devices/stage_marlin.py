@@ -113,6 +113,10 @@ def find_marlin_port(
     return None
 
 class StageMarlin:
+    # Marlin queues only a few incoming commands (BUFSIZE, 4 by default);
+    # batches keep fewer than that unacknowledged so none are dropped.
+    MAX_IN_FLIGHT = 3
+
     def __init__(self, port, baud=BAUD, timeout=1.0):
         from ..utils.log import log
         self._port = port
@@ -135,13 +139,16 @@ class StageMarlin:
         except Exception:
             pass
 
-    def _send_log(self, cmd):
+    def _send_log(self, cmd, reset_input=True):
         line = cmd.strip()
         log(f"TX >> {line}")
-        self._write(line)
+        self._write(line, reset_input)
 
-    def _write(self, cmd):
-        self.ser.reset_input_buffer()
+    def _write(self, cmd, reset_input=True):
+        # a batch resets once up front; resetting per line would throw away
+        # the acknowledgements of the commands already written
+        if reset_input:
+            self.ser.reset_input_buffer()
         self.ser.write((cmd.strip() + '\n').encode())
 
     def _read_until_ok(self):
@@ -158,6 +165,28 @@ class StageMarlin:
         self._send_log(cmd)
         return self._read_until_ok() if wait_ok else ""
 
+    def send_batch(self, cmds):
+        """Send ``cmds`` back to back and collect their acknowledgements.
+
+        Rather than one write/``ok`` round-trip per command, up to
+        ``MAX_IN_FLIGHT`` commands are written before waiting, so a short
+        batch (mode switch + move) costs a single round-trip.  Returns the
+        concatenated responses.
+        """
+        self.ser.reset_input_buffer()
+        out = []
+        pending = 0
+        for cmd in cmds:
+            self._send_log(cmd, reset_input=False)
+            pending += 1
+            if pending >= self.MAX_IN_FLIGHT:
+                out.append(self._read_until_ok())
+                pending -= 1
+        while pending:
+            out.append(self._read_until_ok())
+            pending -= 1
+        return ''.join(out)
+
     def home_all(self):
         """Home Z first, then X and Y to avoid crashing into optics."""
         self.send("G28 Z")
@@ -168,24 +197,26 @@ class StageMarlin:
     def absolute_mode(self):return self.send("G90", wait_ok=True)
     def relative_mode(self):return self.send("G91", wait_ok=True)
 
-    def move_relative(self, dx=0, dy=0, dz=0, feed_mm_per_min=600, wait_ok=False):
-        self.relative_mode()
+    # Moves go out as one batch with their mode switch.  The G1 is always
+    # acknowledged (Marlin answers once it is queued, not when it finishes).
+    # ``wait`` appends an M400 to the batch, so the call returns once the
+    # move has finished without a separate wait_for_moves() round-trip.
+
+    def move_relative(self, dx=0, dy=0, dz=0, feed_mm_per_min=600, wait=False):
         parts = ["G1"]
         if dx: parts.append(f"X{dx:.6f}")
         if dy: parts.append(f"Y{dy:.6f}")
         if dz: parts.append(f"Z{dz:.6f}")
         parts.append(f"F{feed_mm_per_min:.2f}")
-        self.send(" ".join(parts), wait_ok=wait_ok)
-        self.absolute_mode()
+        self.send_batch(["G91", " ".join(parts), "G90"] + (["M400"] if wait else []))
 
-    def move_absolute(self, x=None, y=None, z=None, feed_mm_per_min=600, wait_ok=False):
+    def move_absolute(self, x=None, y=None, z=None, feed_mm_per_min=600, wait=False):
         parts = ["G1"]
         if x is not None: parts.append(f"X{x:.6f}")
         if y is not None: parts.append(f"Y{y:.6f}")
         if z is not None: parts.append(f"Z{z:.6f}")
         parts.append(f"F{feed_mm_per_min:.2f}")
-        self.send("G90", wait_ok=True)
-        self.send(" ".join(parts), wait_ok=wait_ok)
+        self.send_batch(["G90", " ".join(parts)] + (["M400"] if wait else []))
 
     # --------------------------- QUERY ---------------------------
 
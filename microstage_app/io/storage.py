@@ -1,4 +1,11 @@
 import os, datetime, json
+import collections
+import concurrent.futures
+import multiprocessing
+import threading
+from multiprocessing import shared_memory
+
+import numpy as np
 import tifffile
 from PIL import Image, PngImagePlugin, ExifTags
 
@@ -6,6 +13,25 @@ EXIF_TAGS_REVERSE = {name.lower(): tag for tag, name in ExifTags.TAGS.items()}
 # Common alias for camera manufacturer
 EXIF_TAGS_REVERSE.setdefault("camera", EXIF_TAGS_REVERSE.get("make", 271))
 
+# Upper bound on background encodes in flight before ``save_single`` blocks
+# until one finishes; keeps memory bounded when the disk cannot keep up.
+MAX_PENDING_WRITES = 32
+
+
+def _encode_and_write(ext, path, shm_name, shape, dtype, metadata):
+    """Encode an image held in shared memory and write it to ``path``.
+
+    Runs in a worker process, so it must stay at module level to be picklable.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        img = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        _WRITERS.get(ext, _write_bmp)(path, img, metadata)
+        del img
+    finally:
+        shm.close()
+    return path
+
 class ImageWriter:
     def __init__(self, base_dir='runs'):
         self.base_dir = base_dir
@@ -13,6 +39,14 @@ class ImageWriter:
         ts = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
         self.run_dir = os.path.join(self.base_dir, ts)
         os.makedirs(self.run_dir, exist_ok=True)
+        self._pool = None
+        # background writes may be queued from several threads at once; the
+        # lock guards the pool, the in-flight paths and the unclaimed errors
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._slots = threading.BoundedSemaphore(MAX_PENDING_WRITES)
+        self._pending = collections.Counter()  # path -> writes in flight
+        self._errors = []
 
     def save_single(
         self,
@@ -22,6 +56,8 @@ class ImageWriter:
         auto_number=False,
         fmt="bmp",
         metadata=None,
+        background=False,
+        on_done=None,
     ):
         """Save a single image.
 
@@ -41,6 +77,14 @@ class ImageWriter:
             ``bmp``, ``tif``, ``png`` and ``jpg``.
         metadata : dict or None
             Optional metadata to embed in the image file when supported.
+        background : bool
+            If ``True``, encode and write the image in a worker process and
+            return immediately. Call :meth:`flush` to wait for pending writes.
+        on_done : callable or None
+            For background writes, called as ``on_done(path, error)`` from a
+            pool thread once this write has finished; ``error`` is ``None`` on
+            success. A write with ``on_done`` reports its error only there,
+            otherwise the error is raised by :meth:`flush`.
         """
 
         directory = directory or self.run_dir
@@ -55,17 +99,24 @@ class ImageWriter:
             "jpeg": "jpg",
         }.get(fmt, "bmp")
 
-        if auto_number:
-            n = 1
-            while True:
-                path = os.path.join(directory, f"{filename}_{n}.{ext}")
-                if not os.path.exists(path):
-                    break
-                n += 1
-        else:
-            path = os.path.join(directory, f"{filename}.{ext}")
+        # the number is picked and reserved in one step so concurrent saves
+        # cannot both claim it
+        with self._lock:
+            if auto_number:
+                n = 1
+                while True:
+                    path = os.path.join(directory, f"{filename}_{n}.{ext}")
+                    if path not in self._pending and not os.path.exists(path):
+                        break
+                    n += 1
+            else:
+                path = os.path.join(directory, f"{filename}.{ext}")
+            if background:
+                self._pending[path] += 1
 
-        if ext == "tif":
+        if background:
+            self._submit(ext, path, img_rgb, metadata, on_done)
+        elif ext == "tif":
             self._save_tiff(path, img_rgb, metadata)
         elif ext == "png":
             self._save_png(path, img_rgb, metadata)
@@ -75,6 +126,90 @@ class ImageWriter:
             self._save_bmp(path, img_rgb, metadata)
         else:
             self._save_bmp(path, img_rgb, metadata)
+        return path
+
+    def _submit(self, ext, path, img_rgb, metadata, on_done):
+        """Queue ``img_rgb`` for encoding in the writer process pool.
+
+        ``path`` is already reserved in ``_pending``.  Blocks while
+        ``MAX_PENDING_WRITES`` writes are in flight.
+        """
+        self._slots.acquire()
+        shm = None
+        try:
+            with self._lock:
+                if self._pool is None:
+                    workers = max(1, (os.cpu_count() or 2) - 1)
+                    # saves arrive from several threads, and a forked worker
+                    # can inherit a lock one of them held; spawn (the Windows
+                    # default) starts clean everywhere
+                    self._pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                pool = self._pool
+            img = np.ascontiguousarray(img_rgb)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, img.nbytes))
+            np.ndarray(img.shape, dtype=img.dtype, buffer=shm.buf)[...] = img
+            fut = pool.submit(
+                _encode_and_write, ext, path, shm.name, img.shape, img.dtype.str, metadata
+            )
+        except BaseException:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            self._release(path)
+            raise
+        fut.add_done_callback(lambda f: self._write_done(f, path, shm, on_done))
+
+    def _write_done(self, fut, path, shm, on_done):
+        """Free a finished background write and report its outcome."""
+        shm.close()
+        shm.unlink()
+        try:
+            err = fut.exception()
+        except concurrent.futures.CancelledError as e:
+            err = e
+        if err is not None and on_done is None:
+            with self._lock:
+                self._errors.append(err)
+        # released only after reporting, so flush() also waits for on_done
+        try:
+            if on_done is not None:
+                on_done(path, err)
+        finally:
+            self._release(path)
+
+    def _release(self, path):
+        with self._lock:
+            self._pending[path] -= 1
+            if not self._pending[path]:
+                del self._pending[path]
+            if not self._pending:
+                self._idle.notify_all()
+        self._slots.release()
+
+    def flush(self):
+        """Block until every background write has finished.
+
+        The first error from a write queued without ``on_done`` is re-raised
+        once all pending writes have completed.
+        """
+        with self._idle:
+            self._idle.wait_for(lambda: not self._pending)
+            errors, self._errors = self._errors, []
+        if errors:
+            raise errors[0]
+
+    def close(self):
+        """Flush pending writes and shut down the worker pool."""
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                pool, self._pool = self._pool, None
+            if pool is not None:
+                pool.shutdown()
 
     def save_tile(self, img_rgb, row, col):
         path = os.path.join(self.run_dir, f'tile_r{row:04d}_c{col:04d}.tif')
@@ -82,49 +217,15 @@ class ImageWriter:
 
     def _save_tiff(self, path, img_rgb, metadata=None):
         """Save image as TIFF with optional metadata."""
-        tifffile.imwrite(path, img_rgb, photometric="rgb", metadata=metadata)
+        _write_tiff(path, img_rgb, metadata)
 
     def _save_png(self, path, img_rgb, metadata=None):
         """Save image as PNG, embedding metadata if provided."""
-        if metadata:
-            pnginfo = PngImagePlugin.PngInfo()
-            for key, value in metadata.items():
-                pnginfo.add_text(str(key), str(value))
-            Image.fromarray(img_rgb).save(path, format="PNG", pnginfo=pnginfo)
-        else:
-            Image.fromarray(img_rgb).save(path, format="PNG")
+        _write_png(path, img_rgb, metadata)
 
     def _save_jpg(self, path, img_rgb, metadata=None):
         """Save image as JPEG, embedding EXIF metadata if provided."""
-        if metadata:
-            exif = Image.Exif()
-            leftover = {}
-            for key, value in metadata.items():
-                tag = None
-                if isinstance(key, int):
-                    tag = key
-                else:
-                    key_str = str(key)
-                    if key_str.isdigit():
-                        tag = int(key_str)
-                    else:
-                        tag = EXIF_TAGS_REVERSE.get(key_str.lower())
-                if tag is not None:
-                    try:
-                        exif[int(tag)] = str(value)
-                    except Exception:
-                        continue
-                else:
-                    leftover[str(key)] = value
-            if leftover:
-                json_blob = json.dumps(leftover)
-                if 270 not in exif:
-                    exif[270] = json_blob
-                else:
-                    exif[0x9286] = json_blob
-            Image.fromarray(img_rgb).save(path, format="JPEG", exif=exif.tobytes())
-        else:
-            Image.fromarray(img_rgb).save(path, format="JPEG")
+        _write_jpg(path, img_rgb, metadata)
 
     def _save_bmp(self, path, img_rgb, metadata=None):
         """Save image as BMP.
@@ -132,4 +233,70 @@ class ImageWriter:
         The BMP format lacks a standard way to embed metadata, so any
         provided metadata is ignored.
         """
-        Image.fromarray(img_rgb).save(path, format="BMP")
+        _write_bmp(path, img_rgb, metadata)
+
+
+def _write_tiff(path, img_rgb, metadata=None):
+    """Save image as TIFF with optional metadata."""
+    tifffile.imwrite(path, img_rgb, photometric="rgb", metadata=metadata)
+
+
+def _write_png(path, img_rgb, metadata=None):
+    """Save image as PNG, embedding metadata if provided."""
+    if metadata:
+        pnginfo = PngImagePlugin.PngInfo()
+        for key, value in metadata.items():
+            pnginfo.add_text(str(key), str(value))
+        Image.fromarray(img_rgb).save(path, format="PNG", pnginfo=pnginfo)
+    else:
+        Image.fromarray(img_rgb).save(path, format="PNG")
+
+
+def _write_jpg(path, img_rgb, metadata=None):
+    """Save image as JPEG, embedding EXIF metadata if provided."""
+    if metadata:
+        exif = Image.Exif()
+        leftover = {}
+        for key, value in metadata.items():
+            tag = None
+            if isinstance(key, int):
+                tag = key
+            else:
+                key_str = str(key)
+                if key_str.isdigit():
+                    tag = int(key_str)
+                else:
+                    tag = EXIF_TAGS_REVERSE.get(key_str.lower())
+            if tag is not None:
+                try:
+                    exif[int(tag)] = str(value)
+                except Exception:
+                    continue
+            else:
+                leftover[str(key)] = value
+        if leftover:
+            json_blob = json.dumps(leftover)
+            if 270 not in exif:
+                exif[270] = json_blob
+            else:
+                exif[0x9286] = json_blob
+        Image.fromarray(img_rgb).save(path, format="JPEG", exif=exif.tobytes())
+    else:
+        Image.fromarray(img_rgb).save(path, format="JPEG")
+
+
+def _write_bmp(path, img_rgb, metadata=None):
+    """Save image as BMP.
+
+    The BMP format lacks a standard way to embed metadata, so any
+    provided metadata is ignored.
+    """
+    Image.fromarray(img_rgb).save(path, format="BMP")
+
+
+_WRITERS = {
+    "tif": _write_tiff,
+    "png": _write_png,
+    "jpg": _write_jpg,
+    "bmp": _write_bmp,
+}
@@ -1,8 +1,11 @@
 from PySide6 import QtWidgets, QtCore
 from .ui.main_window import MainWindow
+import multiprocessing
 import sys
 
 def main():
+    # Image encoding runs in a process pool; required for frozen builds.
+    multiprocessing.freeze_support()
     app = QtWidgets.QApplication(sys.argv)
     app.setApplicationName("MicroStage App")
     win = MainWindow()
@@ -54,7 +54,32 @@ def test_af_spinboxes_six_decimals(monkeypatch, qt_app):
         qt_app.processEvents()
         assert box.text() == "0.000500"
 
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
 
+
+
+def test_spinboxes_commit_on_enter_only(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    # painting is suspended only while the widgets are being built
+    assert win.updatesEnabled()
+    spins = win.findChildren(QtWidgets.QAbstractSpinBox)
+    assert spins
+    assert not any(sb.keyboardTracking() for sb in spins)
+
+    target = 12.5 if win.exp_spin.value() != 12.5 else 13.5
+    seen = []
+    win.exp_spin.valueChanged.connect(seen.append)
+    line = win.exp_spin.lineEdit()
+    line.selectAll()
+    QtTest.QTest.keyClicks(line, f"{target}")
+    qt_app.processEvents()
+    assert seen == []
+    QtTest.QTest.keyClick(line, QtCore.Qt.Key_Return)
+    qt_app.processEvents()
+    assert seen == [target]
+
+    win.fps_timer.stop()
+    win.close()
@@ -2,6 +2,7 @@ import microstage_app.control.autofocus as af
 from microstage_app.control.autofocus import AutoFocus, FocusMetric
 import pytest
 import numpy as np
+import cv2
 
 class StageMock:
     def __init__(self):
@@ -14,16 +15,22 @@ class StageMock:
         pass
 
 class CameraMock:
+    """Camera whose "frame" is the Z it was grabbed at (when given a stage).
+
+    Frames are scored while the stage is already moving on, so fake metrics
+    must read the frame rather than the stage."""
+    def __init__(self, stage=None):
+        self.stage = stage
     def snap(self):
-        return object()
+        return self.stage.z if self.stage is not None else object()
     def name(self):
         return "CameraMock"
 
 
 def test_autofocus_converges(monkeypatch):
     stage = StageMock()
-    cam = CameraMock()
-    monkeypatch.setattr(af, 'metric_value', lambda img, metric: -abs(stage.z))
+    cam = CameraMock(stage)
+    monkeypatch.setattr(af, 'metric_value', lambda img, metric, **_: -abs(img))
     autofocus = AutoFocus(stage, cam)
     best = autofocus.coarse_to_fine(
         FocusMetric.LAPLACIAN, z_range_mm=0.2, coarse_step_mm=0.1, fine_step_mm=0.05
@@ -43,12 +50,12 @@ def test_autofocus_zero_step_raises():
 
 def test_fine_pass_window_and_step(monkeypatch):
     stage = StageMock()
-    cam = CameraMock()
+    cam = CameraMock(stage)
     positions = []
 
-    def fake_metric(img, metric):
-        positions.append(stage.z)
-        return -abs(stage.z)
+    def fake_metric(img, metric, **_):
+        positions.append(img)
+        return -abs(img)
 
     monkeypatch.setattr(af, 'metric_value', fake_metric)
     autofocus = AutoFocus(stage, cam)
@@ -82,9 +89,9 @@ def test_fine_pass_window_and_step(monkeypatch):
 
 def test_feed_rate_passed_to_stage(monkeypatch):
     stage = StageMock()
-    cam = CameraMock()
-    def fake_metric(img, metric):
-        return -abs(stage.z)
+    cam = CameraMock(stage)
+    def fake_metric(img, metric, **_):
+        return -abs(img)
 
     monkeypatch.setattr(af, 'metric_value', fake_metric)
     af_inst = AutoFocus(stage, cam)
@@ -115,3 +122,274 @@ def test_metric_value_invalid_channels_raise():
     bad = np.zeros((4, 4, 2), dtype=np.uint8)
     with pytest.raises(ValueError):
         af.metric_value(bad, FocusMetric.LAPLACIAN)
+
+
+def test_center_z_moves_to_centre_before_sweep(monkeypatch):
+    stage = StageMock()
+    absolute = []
+
+    def move_absolute(z=None, feed_mm_per_min=0.0):
+        absolute.append(z)
+        stage.z = z
+
+    stage.move_absolute = move_absolute
+    cam = CameraMock(stage)
+    positions = []
+
+    def fake_metric(img, metric, **_):
+        positions.append(img)
+        return -abs(img - 1.05)
+
+    monkeypatch.setattr(af, 'metric_value', fake_metric)
+    best = AutoFocus(stage, cam).coarse_to_fine(
+        FocusMetric.LAPLACIAN,
+        z_range_mm=0.1,
+        coarse_step_mm=0.05,
+        fine_step_mm=0.01,
+        center_z=1.0,
+    )
+    assert absolute == [1.0]
+    assert min(positions) == pytest.approx(0.9)
+    assert max(positions) == pytest.approx(1.1)
+    assert best == pytest.approx(0.05)
+    assert stage.z == pytest.approx(1.05)
+
+
+def test_metric_downsample_scores_smaller_frames(monkeypatch):
+    stage = StageMock()
+    frame = np.zeros((64, 96, 3), dtype=np.uint8)
+    cam = CameraMock()
+    cam.snap = lambda: frame
+    shapes = []
+
+    def fake_metric(img, metric, **_):
+        shapes.append(img.shape)
+        return -abs(stage.z)
+
+    monkeypatch.setattr(af, 'metric_value', fake_metric)
+    AutoFocus(stage, cam, metric_downsample=4).coarse_to_fine(
+        FocusMetric.LAPLACIAN, z_range_mm=0.1, coarse_step_mm=0.05, fine_step_mm=0.01
+    )
+    assert shapes and all(s == (16, 24, 3) for s in shapes)
+
+
+def test_downsample_keeps_sharpest_frame():
+    rng = np.random.default_rng(0)
+    sharp = rng.integers(0, 256, (256, 256), dtype=np.uint8)
+    blurred = cv2.GaussianBlur(sharp, (9, 9), 3)
+    for metric in FocusMetric:
+        assert af.metric_value(af.downsample(sharp, 4), metric) > af.metric_value(
+            af.downsample(blurred, 4), metric
+        )
+
+
+def test_metric_value_matches_float64_reference():
+    img = np.random.default_rng(1).integers(0, 256, (48, 64), dtype=np.uint8)
+    lap = cv2.Laplacian(img, cv2.CV_64F)
+    gx = cv2.Sobel(img, cv2.CV_64F, 1, 0, ksize=3)
+    gy = cv2.Sobel(img, cv2.CV_64F, 0, 1, ksize=3)
+    assert af.metric_value(img, FocusMetric.LAPLACIAN) == pytest.approx(lap.var())
+    assert af.metric_value(img, FocusMetric.TENENGRAD) == pytest.approx(
+        np.mean(gx * gx + gy * gy)
+    )
+
+
+def test_scoring_overlaps_next_move(monkeypatch):
+    import threading
+    stage = StageMock()
+    cam = CameraMock(stage)
+    scored = threading.Event()
+    overlapped = []
+    orig_move = stage.move_relative
+
+    def move_relative(dz=0.0, feed_mm_per_min=0.0):
+        # the previous frame's score is still running when the next move starts
+        overlapped.append(not scored.is_set())
+        scored.clear()
+        orig_move(dz=dz, feed_mm_per_min=feed_mm_per_min)
+
+    def slow_metric(img, metric, **_):
+        threading.Event().wait(0.02)
+        scored.set()
+        return -abs(img)
+
+    stage.move_relative = move_relative
+    monkeypatch.setattr(af, 'metric_value', slow_metric)
+    monkeypatch.setattr(af.time, 'sleep', lambda s: None)
+    best = AutoFocus(stage, cam).coarse_to_fine(
+        FocusMetric.LAPLACIAN, z_range_mm=0.1, coarse_step_mm=0.05, fine_step_mm=0.01
+    )
+    assert abs(best) < 1e-6
+    # every move after the first within the coarse sweep overlapped scoring
+    assert all(overlapped[1:5])
+
+
+def test_focus_stack_stop_returns_to_start(monkeypatch, tmp_path):
+    import threading
+    from types import SimpleNamespace
+    stage = StageMock()
+    stage.get_position = lambda: (0.0, 0.0, stage.z)
+    stop = threading.Event()
+    saved = []
+
+    def save_single(img, **kwargs):
+        saved.append(img)
+        if len(saved) == 2:
+            stop.set()
+
+    writer = SimpleNamespace(run_dir=str(tmp_path), save_single=save_single)
+    monkeypatch.setattr(af.time, 'sleep', lambda s: None)
+    with pytest.raises(RuntimeError, match="cancelled"):
+        AutoFocus(stage, CameraMock(stage)).focus_stack(
+            0.1, 0.05, writer, stop_event=stop
+        )
+    assert len(saved) == 2
+    assert abs(stage.z) < 1e-9
+
+
+
+@pytest.mark.parametrize("search", [af.FocusSearch.UNIFORM, af.FocusSearch.GOLDEN])
+def test_autofocus_stop_returns_to_centre(monkeypatch, search):
+    import threading
+    stage = StageMock()
+    cam = CameraMock(stage)
+    stop = threading.Event()
+    snap = cam.snap
+
+    def snap_then_stop():
+        if len(stage.moves) >= 3:
+            stop.set()
+        return snap()
+
+    cam.snap = snap_then_stop
+    monkeypatch.setattr(af, 'metric_value', lambda img, metric, **_: -abs(img))
+    monkeypatch.setattr(af.time, 'sleep', lambda s: None)
+    with pytest.raises(RuntimeError, match="cancelled"):
+        AutoFocus(stage, cam).coarse_to_fine(
+            FocusMetric.LAPLACIAN, z_range_mm=0.2, coarse_step_mm=0.05,
+            fine_step_mm=0.01, search=search, stop_event=stop,
+        )
+    assert abs(stage.z) < 1e-9
+
+
+def test_focus_stack_background_writes(monkeypatch, tmp_path):
+    from types import SimpleNamespace
+    stage = StageMock()
+    stage.get_position = lambda: (0.0, 0.0, stage.z)
+    saved = []
+    writer = SimpleNamespace(
+        run_dir=str(tmp_path), save_single=lambda img, **kw: saved.append(kw)
+    )
+    monkeypatch.setattr(af.time, 'sleep', lambda s: None)
+    AutoFocus(stage, CameraMock(stage)).focus_stack(0.1, 0.05, writer)
+    AutoFocus(stage, CameraMock(stage)).focus_stack(
+        0.1, 0.05, writer, background_writes=True
+    )
+    assert ["background" in kw for kw in saved] == [False] * 5 + [True] * 5
+    assert all(kw["background"] for kw in saved[5:])
+
+
+def _counting_camera(stage):
+    cam = CameraMock(stage)
+    cam.snaps = 0
+    snap = cam.snap
+
+    def counted():
+        cam.snaps += 1
+        return snap()
+
+    cam.snap = counted
+    return cam
+
+
+def test_golden_section_finds_peak_with_few_frames(monkeypatch):
+    monkeypatch.setattr(af, 'metric_value', lambda img, metric, **_: -abs(img - 0.123))
+    monkeypatch.setattr(af.time, 'sleep', lambda s: None)
+    results = {}
+    for search in (af.FocusSearch.UNIFORM, af.FocusSearch.GOLDEN):
+        stage = StageMock()
+        cam = _counting_camera(stage)
+        best = AutoFocus(stage, cam).coarse_to_fine(
+            FocusMetric.LAPLACIAN, z_range_mm=0.5, coarse_step_mm=0.01,
+            fine_step_mm=0.002, search=search,
+        )
+        assert abs(best - 0.123) <= 0.002
+        assert stage.z == pytest.approx(best)
+        results[search] = cam.snaps
+    assert results[af.FocusSearch.GOLDEN] * 5 < results[af.FocusSearch.UNIFORM]
+
+
+def test_golden_section_falls_back_when_not_unimodal(monkeypatch):
+    import math
+
+    def two_peaks(z):
+        # a narrow peak the search samples early and a broad lower one
+        return 1.2 * math.exp(-((z + 0.118) / 0.03) ** 2) + math.exp(-((z - 0.2) / 0.15) ** 2)
+
+    monkeypatch.setattr(af, 'metric_value', lambda img, metric, **_: two_peaks(img))
+    monkeypatch.setattr(af.time, 'sleep', lambda s: None)
+    stage = StageMock()
+    best = AutoFocus(stage, CameraMock(stage)).coarse_to_fine(
+        FocusMetric.LAPLACIAN, z_range_mm=0.5, coarse_step_mm=0.01,
+        fine_step_mm=0.002, search=af.FocusSearch.GOLDEN,
+    )
+    assert abs(best + 0.118) <= 0.002
+    assert stage.z == pytest.approx(best)
+
+
+def test_unimodal_tolerates_small_dips():
+    assert af._unimodal([1.0, 2.0, 5.0, 3.0, 1.0])
+    assert af._unimodal([1.0, 2.0, 1.9, 5.0, 1.0])
+    assert not af._unimodal([4.0, 1.0, 5.0, 3.0])
+    assert not af._unimodal([1.0, float("-inf"), 5.0])
+
+
+def test_score_reuses_scratch_buffers():
+    rng = np.random.default_rng(1)
+    frames = [rng.integers(0, 255, (64, 80, 3), dtype=np.uint8) for _ in range(3)]
+    focus = AutoFocus(StageMock(), CameraMock(), metric_downsample=2)
+    for metric in (FocusMetric.LAPLACIAN, FocusMetric.TENENGRAD):
+        ids = None
+        for frame in frames:
+            expected = af.metric_value(af.downsample(frame, 2), metric)
+            assert focus._score(frame, metric) == pytest.approx(expected)
+            now = {k: id(v) for k, v in focus._bufs.items()}
+            assert ids is None or now == ids
+            ids = now
+    assert focus._bufs["small"].shape == (32, 40, 3)
+    assert focus._bufs["gray"].shape == (32, 40)
+    # a new frame size swaps the buffers out
+    focus._score(frames[0][:32], FocusMetric.LAPLACIAN)
+    assert focus._bufs["gray"].shape == (16, 40)
+
+
+def test_mono_frames_switches_and_restores(monkeypatch):
+    monkeypatch.setattr(af.time, 'monotonic', lambda: 5.0)
+    calls = []
+
+    class Cam:
+        raw = False
+        def get_raw_fast_mono(self):
+            return self.raw
+        def set_raw_fast_mono(self, on):
+            calls.append(on)
+            self.raw = on
+        def get_frame_after(self, t0):
+            calls.append(("fresh", t0))
+
+    cam = Cam()
+    with pytest.raises(RuntimeError):
+        with af.mono_frames(cam):
+            assert cam.raw
+            raise RuntimeError("sweep failed")
+    assert calls == [True, ("fresh", 5.0), False]
+    assert not cam.raw
+
+    # already mono (user's choice) or no such mode: left untouched
+    cam.raw = True
+    calls.clear()
+    with af.mono_frames(cam):
+        pass
+    with af.mono_frames(object()):
+        pass
+    assert calls == [] and cam.raw
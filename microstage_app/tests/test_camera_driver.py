@@ -46,3 +46,19 @@ def test_list_color_depths_from_flags(monkeypatch):
     monkeypatch.setattr(camera_toupcam.ToupcamCamera, "_query_binning_options", lambda self: None)
     cam = camera_toupcam.ToupcamCamera(tp, "id", "name", tp.TOUPCAM_FLAG_RAW10 | tp.TOUPCAM_FLAG_RAW14)
     assert cam.list_color_depths() == [8, 10, 14]
+
+
+def test_get_frame_after_skips_frames_before_settle(monkeypatch):
+    import numpy as np
+
+    monkeypatch.setattr(camera_toupcam.ToupcamCamera, "_open", lambda self: None)
+    monkeypatch.setattr(camera_toupcam.ToupcamCamera, "_query_binning_options", lambda self: None)
+    cam = camera_toupcam.ToupcamCamera(types.SimpleNamespace(), "id", "name")
+    monkeypatch.setattr(cam, "get_exposure_ms", lambda: 0.0)
+    old = np.zeros((2, 2), dtype=np.uint8)
+    new = np.ones((2, 2), dtype=np.uint8)
+    cam._ring.extend([(1.0, old), (2.0, new)])
+    cam._last = new
+    assert cam.get_frame_after(1.5, timeout=0).max() == 1
+    # nothing newer than t0 and not streaming: fall back to the latest frame
+    assert cam.get_frame_after(5.0, timeout=0.01).max() == 1
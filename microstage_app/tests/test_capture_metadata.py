@@ -23,8 +23,10 @@ def test_default_capture_preserves_metadata(monkeypatch, tmp_path, qt_app):
     monkeypatch.setattr(Profiles, "PATH", str(tmp_path / "profiles.yaml"))
 
     # stub ImageWriter to write into tmp_path
+    real_init = mw.ImageWriter.__init__
+
     def fake_init(self, base_dir='runs'):
-        self.base_dir = str(tmp_path)
+        real_init(self, str(tmp_path))
         self.run_dir = str(tmp_path)
     monkeypatch.setattr(mw.ImageWriter, "__init__", fake_init)
 
@@ -32,16 +34,16 @@ def test_default_capture_preserves_metadata(monkeypatch, tmp_path, qt_app):
     monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
 
     # run async immediately
-    def fake_run_async(fn, *args, **kwargs):
-        res = fn(*args, **kwargs)
-        class DummySignal:
-            def connect(self, cb):
-                cb(res, None)
-        return None, SimpleNamespace(finished=DummySignal())
-    monkeypatch.setattr(mw, "run_async", fake_run_async)
+    def fake_run_pooled(done, fn, *args, **kwargs):
+        done(fn(*args, **kwargs), None)
+    monkeypatch.setattr(mw, "run_pooled", fake_run_pooled)
 
     win = mw.MainWindow()
-    win.stage = SimpleNamespace(wait_for_moves=lambda: None, get_position=lambda: (1, 2, 3))
+    def no_query():
+        raise AssertionError("capture queried the stage position")
+
+    win.stage = SimpleNamespace(wait_for_moves=lambda: None, get_position=no_query)
+    win._last_pos = {"x": 1, "y": 2, "z": 3}
     win.camera = SimpleNamespace(
         snap=lambda: np.zeros((5, 5, 3), dtype=np.uint8),
         name=lambda: "MockCam",
@@ -54,6 +56,7 @@ def test_default_capture_preserves_metadata(monkeypatch, tmp_path, qt_app):
     win.current_lens = SimpleNamespace(name="LensMock", um_per_px=1.0)
 
     win._capture()
+    win.image_writer.flush()
 
     path = tmp_path / "meta_test.png"
     assert path.exists()
@@ -66,4 +69,4 @@ def test_default_capture_preserves_metadata(monkeypatch, tmp_path, qt_app):
     assert img.info.get("LensUmPerPx") == "1.0"
     assert "Time" in img.info
 
-    win.preview_timer.stop(); win.fps_timer.stop(); win.close()
+    win.fps_timer.stop(); win.close()
@@ -20,8 +20,10 @@ def test_capture_settings_persist(monkeypatch, tmp_path, qt_app):
     monkeypatch.setattr(Profiles, "PATH", str(tmp_path / "profiles.yaml"))
 
     # stub ImageWriter to avoid filesystem churn
+    real_init = mw.ImageWriter.__init__
+
     def fake_init(self, base_dir='runs'):
-        self.base_dir = base_dir
+        real_init(self, str(tmp_path / "runs"))
         self.run_dir = str(tmp_path / "runs")
     monkeypatch.setattr(mw.ImageWriter, "__init__", fake_init)
 
@@ -38,7 +40,7 @@ def test_capture_settings_persist(monkeypatch, tmp_path, qt_app):
     assert win1.format_combo.currentText() == "PNG"
     win1.format_combo.setCurrentText("BMP")
     qt_app.processEvents()
-    win1.preview_timer.stop(); win1.fps_timer.stop(); win1.close()
+    win1.fps_timer.stop(); win1.close()
 
     # second session: values should persist
     win2 = mw.MainWindow()
@@ -50,4 +52,29 @@ def test_capture_settings_persist(monkeypatch, tmp_path, qt_app):
     assert win2.autonumber_chk.isChecked()
     assert win2.capture_format == "bmp"
     assert win2.format_combo.currentText() == "BMP"
-    win2.preview_timer.stop(); win2.fps_timer.stop(); win2.close()
+    win2.fps_timer.stop(); win2.close()
+
+
+def test_typing_coalesces_profile_saves(monkeypatch, tmp_path, qt_app):
+    monkeypatch.setattr(Profiles, "PATH", str(tmp_path / "profiles.yaml"))
+
+    real_init = mw.ImageWriter.__init__
+
+    def fake_init(self, base_dir='runs'):
+        real_init(self, str(tmp_path / "runs"))
+        self.run_dir = str(tmp_path / "runs")
+    monkeypatch.setattr(mw.ImageWriter, "__init__", fake_init)
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    saves = []
+    monkeypatch.setattr(win.profiles, "save", lambda: saves.append(1))
+    for i in range(1, 11):
+        win.capture_name_edit.setText("n" * i)
+    assert saves == []
+    assert win._profile_save_timer.isActive()
+
+    win._profile_save_timer.timeout.emit()
+    assert saves == [1]
+    assert win.profiles.get("capture.name") == "n" * 10
+    win.fps_timer.stop(); win.close()
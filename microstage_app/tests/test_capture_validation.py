@@ -20,9 +20,8 @@ def win(monkeypatch, qt_app):
     w = mw.MainWindow()
     w.stage = object()
     w.camera = object()
-    monkeypatch.setattr(mw, "run_async", lambda fn: pytest.fail("run_async called"))
+    monkeypatch.setattr(mw, "run_pooled", lambda done, fn: pytest.fail("run_pooled called"))
     yield w
-    w.preview_timer.stop()
     w.fps_timer.stop()
     w.close()
 
@@ -1,6 +1,9 @@
 import os
+import threading
+from types import SimpleNamespace
+
 import pytest
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 import microstage_app.ui.main_window as mw
 
 
@@ -26,7 +29,6 @@ def test_dispatch_updates_stage_pos(monkeypatch, qt_app):
         txt = win.stage_pos.text()
         assert "X1.000000" in txt and "Y2.000000" in txt and "Z3.000000" in txt
     finally:
-        win.preview_timer.stop()
         win.fps_timer.stop()
         win.close()
 
@@ -45,6 +47,44 @@ def test_dispatch_partial_pos(monkeypatch, qt_app):
         txt = win.stage_pos.text()
         assert "X1.000000" in txt and "Y2.000000" in txt and "Z4.000000" in txt
     finally:
-        win.preview_timer.stop()
+        win.fps_timer.stop()
+        win.close()
+
+
+def test_stage_worker_callbacks_run_on_ui_thread(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+    logs = []
+    monkeypatch.setattr(mw, "log", logs.append)
+    stage = SimpleNamespace(home_x=None, home_y=None, home_z=None)
+    win = mw.MainWindow()
+    try:
+        win.stage = stage
+        win._attach_stage_worker()
+        calls = []
+
+        def fail():
+            raise RuntimeError("timeout")
+
+        win.stage_worker.enqueue(
+            threading.current_thread,
+            callback=lambda t: calls.append((t, threading.current_thread())),
+        )
+        win.stage_worker.enqueue(fail)
+        loop = QtCore.QEventLoop()
+        poll = QtCore.QTimer(interval=10)
+        poll.timeout.connect(lambda: calls and logs and loop.quit())
+        poll.start()
+        QtCore.QTimer.singleShot(5000, loop.quit)
+        loop.exec()
+        poll.stop()
+        # the job ran on the worker thread but its callback on the UI thread
+        assert calls[0][0] is not threading.main_thread()
+        assert calls[0][1] is threading.main_thread()
+        assert "Stage: command failed: timeout" in logs
+    finally:
+        win.stage_worker.stop()
+        win.stage_thread.quit()
+        win.stage_thread.wait(2000)
+        win.stage_thread = win.stage_worker = win.stage = None
         win.fps_timer.stop()
         win.close()
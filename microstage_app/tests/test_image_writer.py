@@ -1,8 +1,11 @@
+import pytest
 import numpy as np
 from microstage_app.io.storage import ImageWriter
 import tifffile
 from PIL import Image
 import json
+import os
+import threading
 
 
 def test_save_single_custom_dir_and_name(tmp_path):
@@ -59,3 +62,84 @@ def test_save_with_metadata(tmp_path):
         exif = im.getexif()
         assert exif[272] == "camera"
         assert exif[42037] == "lens"
+
+
+def test_background_save_and_flush(tmp_path):
+    writer = ImageWriter(base_dir=str(tmp_path / "runs"))
+    img = np.arange(4 * 5 * 3, dtype=np.uint8).reshape(4, 5, 3)
+    out_dir = tmp_path / "bg"
+    try:
+        paths = [
+            writer.save_single(
+                img, directory=str(out_dir), filename="foo",
+                auto_number=True, fmt="png", background=True,
+            )
+            for _ in range(3)
+        ]
+        writer.flush()
+    finally:
+        writer.close()
+    assert [p.rsplit("_", 1)[1] for p in paths] == ["1.png", "2.png", "3.png"]
+    with Image.open(out_dir / "foo_2.png") as im:
+        assert np.array_equal(np.asarray(im), img)
+
+
+def test_background_write_error_reported_to_its_own_save(tmp_path):
+    writer = ImageWriter(base_dir=str(tmp_path / "runs"))
+    img = np.zeros((4, 5, 3), dtype=np.uint8)
+    out_dir = tmp_path / "bg"
+    results = {}
+    try:
+        # the worker cannot create the missing sub-directory
+        for name in ("missing/foo", "ok"):
+            writer.save_single(
+                img, directory=str(out_dir), filename=name, fmt="png",
+                background=True, on_done=lambda p, e: results.setdefault(p, e),
+            )
+        writer.flush()
+    finally:
+        writer.close()
+    assert isinstance(results.pop(os.path.join(str(out_dir), "missing/foo.png")), OSError)
+    assert list(results.values()) == [None]
+    assert (out_dir / "ok.png").exists()
+
+
+def test_background_write_error_raised_by_flush(tmp_path):
+    writer = ImageWriter(base_dir=str(tmp_path / "runs"))
+    img = np.zeros((4, 5, 3), dtype=np.uint8)
+    try:
+        writer.save_single(
+            img, directory=str(tmp_path), filename="missing/foo",
+            fmt="png", background=True,
+        )
+        with pytest.raises(OSError):
+            writer.flush()
+        # the error is reported once
+        writer.flush()
+    finally:
+        writer.close()
+
+
+def test_background_saves_from_many_threads(tmp_path):
+    writer = ImageWriter(base_dir=str(tmp_path / "runs"))
+    img = np.zeros((4, 5, 3), dtype=np.uint8)
+    paths = []
+
+    def save():
+        for _ in range(4):
+            paths.append(writer.save_single(
+                img, directory=str(tmp_path / "bg"), filename="foo",
+                auto_number=True, fmt="png", background=True,
+            ))
+
+    try:
+        threads = [threading.Thread(target=save) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        writer.flush()
+    finally:
+        writer.close()
+    assert len(set(paths)) == 32
+    assert all(os.path.exists(p) for p in paths)
@@ -30,7 +30,7 @@ def test_lens_profile_persistence(monkeypatch, tmp_path, qt_app):
     qt_app.processEvents()
     win1._on_calibration_done(100.0)
     qt_app.processEvents()
-    win1.preview_timer.stop(); win1.fps_timer.stop(); win1.close()
+    win1.fps_timer.stop(); win1.close()
 
     data = yaml.safe_load(pfile.read_text())
     assert data["measurement"]["lenses"]["15x"]["um_per_px"] == pytest.approx(2.0)
@@ -40,4 +40,4 @@ def test_lens_profile_persistence(monkeypatch, tmp_path, qt_app):
     lens = win2.lenses["15x"]
     assert lens.um_per_px == pytest.approx(2.0)
     assert lens.calibrations["default"] == pytest.approx(2.0)
-    win2.preview_timer.stop(); win2.fps_timer.stop(); win2.close()
+    win2.fps_timer.stop(); win2.close()
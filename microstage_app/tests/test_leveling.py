@@ -87,7 +87,7 @@ def test_three_point_level_autofocus_called(monkeypatch):
         def __init__(self, stage, camera):
             DummyAF.calls += 1
 
-        def coarse_to_fine(self, metric=None):
+        def coarse_to_fine(self, metric=None, **kwargs):
             pass
 
     monkeypatch.setattr(leveling, "AutoFocus", DummyAF)
@@ -130,7 +130,7 @@ def test_grid_level_linear_autofocus(monkeypatch):
         def __init__(self, stage, camera):
             DummyAF.calls += 1
 
-        def coarse_to_fine(self, metric=None):
+        def coarse_to_fine(self, metric=None, **kwargs):
             pass
 
     monkeypatch.setattr(leveling, "AutoFocus", DummyAF)
@@ -155,7 +155,7 @@ def test_grid_level_manual_records_z(monkeypatch):
         def __init__(self, stage, camera):
             DummyAF.calls += 1
 
-        def coarse_to_fine(self, metric=None):
+        def coarse_to_fine(self, metric=None, **kwargs):
             pass
 
     monkeypatch.setattr(leveling, "AutoFocus", DummyAF)
@@ -180,8 +180,8 @@ def test_grid_level_manual_records_z(monkeypatch):
     expected = [
         (0.0, 0.0, plane(0, 0)),
         (1.0, 0.0, plane(1, 0)),
-        (0.0, 1.0, plane(0, 1)),
         (1.0, 1.0, plane(1, 1)),
+        (0.0, 1.0, plane(0, 1)),
     ]
     assert np.allclose(stage.positions, expected)
     assert np.isclose(model.predict(2, 3), plane(2, 3))
@@ -0,0 +1,126 @@
+import io
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from PySide6 import QtGui, QtWidgets
+
+import microstage_app.ui.main_window as mw
+from microstage_app.utils import log as log_mod
+from microstage_app.utils.log import log
+
+
+@pytest.fixture
+def qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    yield app
+
+
+def test_log_lines_are_batched(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    assert not win.log_view.isUndoRedoEnabled()
+    assert win.log_view.wordWrapMode() == QtGui.QTextOption.NoWrap
+    win._flush_log()
+    win.log_view.clear()
+    appended = []
+    orig = win.log_view.appendPlainText
+    monkeypatch.setattr(
+        win.log_view, "appendPlainText", lambda text: (appended.append(text), orig(text))
+    )
+
+    for i in range(250):
+        log(f"line {i}")
+    assert appended == []
+    qt_app.processEvents()
+    assert appended == []
+    assert win._log_flush_timer.isActive()
+
+    win._log_flush_timer.timeout.emit()
+    assert len(appended) == 1
+    lines = win.log_view.toPlainText().splitlines()
+    assert len(lines) == 250
+    assert lines[0].endswith("line 0") and lines[-1].endswith("line 249")
+    assert win.log_view.updatesEnabled()
+
+    win.fps_timer.stop()
+    win.close()
+
+
+def test_log_from_worker_thread_is_queued(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    win._flush_log()
+    win.log_view.clear()
+
+    t = threading.Thread(target=log, args=("from worker",))
+    t.start()
+    t.join()
+    # the line is delivered as a queued event on the UI thread
+    assert not win._log_buf
+    qt_app.processEvents()
+    assert win._log_buf[-1].endswith("from worker")
+    win._log_flush_timer.timeout.emit()
+
+    assert win.log_view.toPlainText().endswith("from worker")
+
+    win.fps_timer.stop()
+    win.close()
+
+
+
+def test_console_output_written_off_caller_thread(monkeypatch):
+    writes = []
+
+    class Out:
+        def write(self, text):
+            writes.append((text, threading.current_thread()))
+        def flush(self):
+            pass
+
+    monkeypatch.setattr(log_mod.sys, "stdout", Out())
+    log("to console")
+    deadline = time.monotonic() + 5
+    while not any("to console" in w[0] for w in writes) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    text, thread = next(w for w in writes if "to console" in w[0])
+    assert text.endswith("to console\n")
+    assert thread is log_mod._writer
+
+
+def test_timestamp_formats_seconds_once(monkeypatch):
+    now = [1_700_000_000.25]
+    formatted = []
+
+    def strftime(fmt, t):
+        formatted.append(t)
+        return time.strftime(fmt, t)
+
+    monkeypatch.setattr(
+        log_mod, "time",
+        SimpleNamespace(time=lambda: now[0], strftime=strftime, localtime=time.localtime),
+    )
+    monkeypatch.setattr(log_mod, "_stamp", (None, ""))
+    hms = time.strftime("%H:%M:%S", time.localtime(1_700_000_000))
+    assert log_mod._timestamp() == f"{hms}.250"
+    now[0] = 1_700_000_000.999
+    assert log_mod._timestamp() == f"{hms}.999"
+    assert len(formatted) == 1
+    now[0] = 1_700_000_001.0
+    assert log_mod._timestamp().endswith(".000")
+    assert len(formatted) == 2
+
+
+def test_console_batch_encoded_once_with_replacement(monkeypatch):
+    raw = io.BytesIO()
+    out = io.TextIOWrapper(raw, encoding="ascii")
+    monkeypatch.setattr(log_mod.sys, "stdout", out)
+    log_mod._write_console("[00:00:00.000] 5 µm\n")
+    assert raw.getvalue() == b"[00:00:00.000] 5 ?m\n"
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import microstage_app.ui.main_window as mw
+
+
+def test_marlin_config_read_once(monkeypatch, tmp_path):
+    cfg = tmp_path / "Configuration.h"
+    cfg.write_text(
+        "#define X_BED_SIZE 200\n"
+        "#define Y_BED_SIZE 150\n"
+        "#define Z_MAX_POS 50\n"
+        "#define DEFAULT_MAX_FEEDRATE { 5, 4, 2, 25 }\n"
+    )
+    reads = []
+    orig_read = Path.read_text
+
+    def fake_read(self, *args, **kwargs):
+        reads.append(self)
+        return orig_read(self, *args, **kwargs)
+
+    monkeypatch.setattr(mw, "_MARLIN_CONFIG", cfg)
+    monkeypatch.setattr(Path, "read_text", fake_read)
+    mw._load_marlin_config.cache_clear()
+    try:
+        bounds = mw._load_stage_bounds()
+        feeds = mw._load_feed_limits()
+    finally:
+        mw._load_marlin_config.cache_clear()
+
+    assert reads == [cfg]
+    assert bounds == {"xmin": 0.0, "xmax": 200.0, "ymin": 0.0, "ymax": 150.0,
+                      "zmin": 0.0, "zmax": 50.0}
+    assert feeds == [300.0, 240.0, 120.0]
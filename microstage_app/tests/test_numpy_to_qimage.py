@@ -0,0 +1,48 @@
+import numpy as np
+from PySide6 import QtGui
+
+from microstage_app.utils.img import numpy_to_qimage
+
+
+def test_uint16_mono_uses_grayscale16():
+    img = np.array([[0, 1000], [40000, 65535]], dtype=np.uint16)
+    qimg = numpy_to_qimage(img)
+    assert qimg.format() == QtGui.QImage.Format_Grayscale16
+    assert (qimg.width(), qimg.height()) == (2, 2)
+
+
+def test_uint8_mono_and_rgb_formats():
+    mono = np.zeros((3, 5), dtype=np.uint8)
+    rgb = np.zeros((3, 5, 3), dtype=np.uint8)
+    assert numpy_to_qimage(mono).format() == QtGui.QImage.Format_Grayscale8
+    assert numpy_to_qimage(rgb).format() == QtGui.QImage.Format_RGB888
+
+
+def test_no_copy_shares_array_memory():
+    rgb = np.zeros((3, 5, 3), dtype=np.uint8)
+    qimg = numpy_to_qimage(rgb, copy=False)
+    rgb[1, 2] = (10, 20, 30)
+    assert QtGui.QColor(qimg.pixel(2, 1)).getRgb()[:3] == (10, 20, 30)
+
+
+def test_bgr_frames_wrap_without_swap():
+    bgr = np.zeros((3, 5, 3), dtype=np.uint8)
+    bgr[1, 2] = (30, 20, 10)  # B, G, R
+    qimg = numpy_to_qimage(bgr, bgr=True)
+    assert qimg.format() == QtGui.QImage.Format_BGR888
+    assert QtGui.QColor(qimg.pixel(2, 1)).getRgb()[:3] == (10, 20, 30)
+
+
+def test_cropped_views_wrap_by_row_stride():
+    rgb = np.zeros((6, 10, 3), dtype=np.uint8)
+    rgb[3, 6] = (10, 20, 30)
+    crop = rgb[2:5, 4:9]
+    qimg = numpy_to_qimage(crop, copy=False)
+    assert qimg.bytesPerLine() == rgb.strides[0]
+    assert QtGui.QColor(qimg.pixel(2, 1)).getRgb()[:3] == (10, 20, 30)
+    assert qimg._backing.base is rgb
+
+    # pixels that are not packed within a row are copied first
+    mono = np.arange(40, dtype=np.uint8).reshape(4, 10)[:, ::2]
+    qimg = numpy_to_qimage(mono)
+    assert (qimg.width(), QtGui.QColor(qimg.pixel(1, 1)).red()) == (5, 12)
@@ -29,8 +29,10 @@ def test_invalid_profile_values(monkeypatch, tmp_path, qt_app):
     monkeypatch.setattr(Profiles, "PATH", str(pfile))
 
     # stub ImageWriter to avoid filesystem access
+    real_init = mw.ImageWriter.__init__
+
     def fake_init(self, base_dir="runs"):
-        self.base_dir = base_dir
+        real_init(self, str(tmp_path / "runs"))
         self.run_dir = str(tmp_path / "runs")
 
     monkeypatch.setattr(mw.ImageWriter, "__init__", fake_init)
@@ -46,5 +48,29 @@ def test_invalid_profile_values(monkeypatch, tmp_path, qt_app):
     assert win.capture_format == "png"
     assert win.format_combo.currentText() == "PNG"
 
-    win.preview_timer.stop(); win.fps_timer.stop(); win.close()
+    win.fps_timer.stop(); win.close()
+
+
+
+def test_profile_transaction_writes_once(monkeypatch, tmp_path):
+    pfile = tmp_path / "profiles.yaml"
+    monkeypatch.setattr(Profiles, "PATH", str(pfile))
+    prof = Profiles.load_or_create()
+    writes = []
+    real_dump = yaml.safe_dump
+    monkeypatch.setattr(yaml, "safe_dump", lambda data, f: (writes.append(1), real_dump(data, f)))
+
+    with prof.transaction():
+        prof.set("measurement.lenses.10x.um_per_px", 0.5)
+        with prof.transaction():
+            prof.set("measurement.lenses.10x.calibrations.default", 0.5)
+        prof.save()  # deferred to the end of the outer block
+        assert writes == []
+    assert len(writes) == 1
+    assert yaml.safe_load(pfile.read_text())["measurement"]["lenses"]["10x"]["um_per_px"] == 0.5
 
+    with pytest.raises(RuntimeError):
+        with prof.transaction():
+            prof.set("capture.name", "half-done")
+            raise RuntimeError("boom")
+    assert len(writes) == 1
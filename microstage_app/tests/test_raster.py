@@ -137,6 +137,33 @@ def test_raster_autofocus(monkeypatch):
     assert len(called) == cfg.rows * cfg.cols
 
 
+
+def test_raster_tile_order_and_single_autofocus(monkeypatch):
+    stage = StageMock()
+    cfg = RasterConfig(
+        rows=2, cols=3, x1_mm=0.0, y1_mm=0.0, x2_mm=2.0, y2_mm=0.0,
+        x3_mm=0.0, y3_mm=1.0,
+        autofocus=True, capture=False,
+    )
+    made = []
+
+    class DummyAF:
+        def __init__(self, stage, camera):
+            made.append(self)
+        def coarse_to_fine(self, metric=None, **kwargs):
+            return 0.0
+
+    monkeypatch.setattr(raster, "AutoFocus", DummyAF)
+    monkeypatch.setattr(raster.time, "sleep", lambda s: None)
+    runner = RasterRunner(stage, CameraMock(), WriterMock(), cfg)
+    assert [t[:2] for t in runner._tile_order()] == [
+        (0, 0), (0, 1), (0, 2), (1, 2), (1, 1), (1, 0),
+    ]
+    assert runner._tile_order()[3][2:] == (2.0, 1.0)
+    runner.run()
+    assert len(made) == 1
+
+
 def test_raster_initial_move():
     stage = StageMock(x=1.0, y=1.0)
     cam = CameraMock()
@@ -164,6 +191,32 @@ def test_raster_initial_move_cancelled():
     assert writer.saved == []
 
 
+
+def test_raster_stop_cancels_autofocus(monkeypatch):
+    stage = StageMock()
+    writer = WriterMock()
+    cfg = RasterConfig(
+        rows=1, cols=2, x1_mm=0.0, y1_mm=0.0, x2_mm=1.0, y2_mm=0.0,
+        autofocus=True, capture=True,
+    )
+    seen = []
+
+    class DummyAF:
+        def __init__(self, stage, camera):
+            pass
+        def coarse_to_fine(self, metric=None, stop_event=None):
+            seen.append(stop_event)
+            stop_event.set()
+            raise RuntimeError("operation cancelled")
+
+    monkeypatch.setattr(raster, "AutoFocus", DummyAF)
+    monkeypatch.setattr(raster.time, "sleep", lambda s: None)
+    stop_event = threading.Event()
+    RasterRunner(stage, CameraMock(), writer, cfg).run(stop_event=stop_event)
+
+    assert seen == [stop_event]
+    assert writer.saved == []
+
 @pytest.mark.parametrize(
     "autofocus,capture,expected",
     [
@@ -235,6 +288,8 @@ def test_raster_focus_stack_order(monkeypatch):
             writer=None,
             directory=None,
             lens_name=None,
+            stop_event=None,
+            background_writes=False,
         ):
             events.append("focus_stack")
 
@@ -53,6 +53,5 @@ def test_lens_calibration_scales_with_resolution(monkeypatch, qt_app):
     win._apply_resolution(1)
     assert win.current_lens.um_per_px == pytest.approx(0.5)
 
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
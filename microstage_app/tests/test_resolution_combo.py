@@ -55,7 +55,6 @@ def test_res_combo_lists_and_updates(monkeypatch, qt_app):
     win._apply_resolution(2)
     assert fake.current_idx == 2
 
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
 
@@ -94,7 +93,6 @@ def test_res_combo_repopulates_on_reconnect(monkeypatch, qt_app):
     items2 = [win.res_combo.itemText(i) for i in range(win.res_combo.count())]
     assert items2 == [f"{w}×{h}" for _, w, h in cam2.resolutions]
 
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
 
@@ -148,7 +146,6 @@ def test_toupcam_probe_resolutions(monkeypatch, qt_app):
     win._connect_camera()
     items = [win.res_combo.itemText(i) for i in range(win.res_combo.count())]
     assert items == [f"{w}×{h}" for _, w, h in expected]
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
 
@@ -202,3 +199,34 @@ def test_toupcam_dedup_and_halved(monkeypatch, qt_app):
         (1, 1232, 1232),
         (2, 616, 616),
     ]
+
+
+def test_res_combo_rebuilt_only_for_new_list(monkeypatch, qt_app):
+    class FakeCamera:
+        resolutions = [(0, 1920, 1080), (1, 640, 480)]
+
+        def list_resolutions(self):
+            return list(self.resolutions)
+
+        def get_resolution_index(self):
+            return 1
+
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+    win = mw.MainWindow()
+    win.camera = FakeCamera()
+    resets = []
+    win.res_combo.model().rowsRemoved.connect(lambda *a: resets.append(1))
+
+    win._populate_resolutions()
+    win._populate_resolutions()
+    assert resets == []
+    assert win.res_combo.count() == 2 and win.res_combo.currentIndex() == 1
+
+    win.camera.resolutions = [(0, 960, 540), (1, 320, 240)]
+    win._populate_resolutions()
+    assert resets
+    assert win.res_combo.itemText(0) == "960×540"
+
+    win.camera = None
+    win.fps_timer.stop()
+    win.close()
@@ -0,0 +1,50 @@
+import os
+import threading
+
+import pytest
+from PySide6 import QtCore, QtWidgets
+
+from microstage_app.utils import workers
+
+
+@pytest.fixture
+def qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    yield app
+
+
+def _wait_for(cond):
+    loop = QtCore.QEventLoop()
+    poll = QtCore.QTimer(interval=10)
+    poll.timeout.connect(lambda: cond() and loop.quit())
+    poll.start()
+    QtCore.QTimer.singleShot(5000, loop.quit)
+    loop.exec()
+    poll.stop()
+
+
+def test_run_pooled_delivers_on_calling_thread(qt_app):
+    ran_on = []
+    results = []
+
+    def job(x):
+        ran_on.append(threading.current_thread())
+        return x * 2
+
+    def fail():
+        raise ValueError("boom")
+
+    workers.run_pooled(lambda res, err: results.append((res, err, threading.current_thread())), job, 21)
+    workers.run_pooled(lambda res, err: results.append((res, err, threading.current_thread())), fail)
+    _wait_for(lambda: len(results) == 2 and not workers._pooled)
+
+    assert ran_on[0] is not threading.main_thread()
+    assert len(results) == 2
+    assert (42, None, threading.main_thread()) in results
+    err = next(r[1] for r in results if r[1] is not None)
+    assert isinstance(err, ValueError)
+    assert all(r[2] is threading.main_thread() for r in results)
+    assert not workers._pooled
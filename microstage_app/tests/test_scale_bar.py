@@ -10,6 +10,7 @@ from PySide6 import QtWidgets, QtGui, QtCore
 
 import microstage_app.ui.main_window as mw
 from microstage_app.analysis import Lens
+from microstage_app.utils import img as img_utils
 from microstage_app.utils.img import draw_scale_bar, VERT_SCALE, TEXT_SCALE
 
 
@@ -42,6 +43,7 @@ def test_draw_scale_bar_length_and_label(monkeypatch):
         return orig_truetype(font, size, *args, **kwargs)
 
     monkeypatch.setattr(ImageFont, "truetype", fake_truetype)
+    img_utils._label_mask.cache_clear()
 
     out = draw_scale_bar(img, 1.0)
 
@@ -75,14 +77,10 @@ def test_capture_contains_scale_bar(monkeypatch, tmp_path, qt_app):
     saved = {}
     win.image_writer = SimpleNamespace(save_single=lambda img, **kw: saved.setdefault("img", img))
 
-    def fake_run_async(fn, *args, **kwargs):
-        res = fn(*args, **kwargs)
-        class DummySignal:
-            def connect(self, cb):
-                cb(res, None)
-        return None, SimpleNamespace(finished=DummySignal())
+    def fake_run_pooled(done, fn, *args, **kwargs):
+        done(fn(*args, **kwargs), None)
 
-    monkeypatch.setattr(mw, "run_async", fake_run_async)
+    monkeypatch.setattr(mw, "run_pooled", fake_run_pooled)
 
     orig_truetype = ImageFont.truetype
 
@@ -104,7 +102,6 @@ def test_capture_contains_scale_bar(monkeypatch, tmp_path, qt_app):
     assert np.all(bar_row[:160] == 0)
     assert np.all(bar_row[181:] == 0)
 
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
 
@@ -153,6 +150,7 @@ def test_scale_bar_mu_character_renders(monkeypatch, tmp_path, qt_app):
         return orig_truetype(font, size, *args, **kwargs)
 
     monkeypatch.setattr(ImageFont, "truetype", spy_truetype)
+    img_utils._resolve_font.cache_clear()
 
     out = draw_scale_bar(img, 0.2)
     Image.fromarray(out).save(tmp_path / "scale.png")
@@ -195,6 +193,104 @@ def test_scale_bar_mu_character_renders(monkeypatch, tmp_path, qt_app):
     assert mu_region.size > 0 and np.any(mu_region == 255)
 
 
+def test_scale_bar_font_resolved_once(monkeypatch, qt_app):
+    runs = []
+
+    def fake_run(cmd, **kw):
+        runs.append(cmd)
+        raise OSError("no fc-match")
+
+    monkeypatch.setattr(img_utils.subprocess, "run", fake_run)
+    img_utils._resolve_font.cache_clear()
+    img = np.zeros((100, 200, 3), dtype=np.uint8)
+    try:
+        for _ in range(3):
+            draw_scale_bar(img, 1.0)
+    finally:
+        img_utils._resolve_font.cache_clear()
+    assert len(runs) == 1
+
+
+def test_scale_bar_label_rasterized_once(monkeypatch):
+    texts = []
+    orig_text = ImageDraw.ImageDraw.text
+
+    def spy_text(self, xy, text, *args, **kwargs):
+        texts.append(text)
+        return orig_text(self, xy, text, *args, **kwargs)
+
+    monkeypatch.setattr(ImageDraw.ImageDraw, "text", spy_text)
+    img_utils._label_mask.cache_clear()
+    img = np.zeros((100, 200, 3), dtype=np.uint8)
+    frames = [draw_scale_bar(img, 1.0) for _ in range(3)]
+    assert texts == ["20 µm"]
+    assert all(np.array_equal(frames[0], f) for f in frames[1:])
+
+
+def test_draw_scale_bar_leaves_input_frame_untouched():
+    img = np.full((100, 200, 3), 40, dtype=np.uint8)
+    out = draw_scale_bar(img, 1.0)
+    assert np.all(img == 40)
+    assert out is not img
+    # bar rows are y0 - 1 .. y0 + 2 for a 4 px line, as PIL draws it
+    assert np.all(out[79:83, 160:181] == 255)
+    assert np.all(out[78, 160:181] == 40) and np.all(out[83, 160:181] == 40)
+
+
+def test_draw_scale_bar_expands_grayscale():
+    img = np.arange(100 * 200, dtype=np.uint32).reshape(100, 200).astype(np.uint8)
+    out = draw_scale_bar(img, 1.0)
+    assert out.shape == (100, 200, 3)
+    assert np.array_equal(out[:20, :, 1], img[:20])
+    assert np.array_equal(out[..., 0], out[..., 2])
+    assert np.all(out[79:83, 160:181] == 255)
+
+
+def test_draw_scale_bar_rejects_non_host_frames():
+    with pytest.raises(TypeError):
+        draw_scale_bar(object(), 1.0)
+
+
+def test_draw_scale_bar_into_out_buffer():
+    img = np.zeros((100, 200, 3), dtype=np.uint8)
+    assert draw_scale_bar(img, 1.0, out=img) is img
+    assert np.all(img[79:83, 160:181] == 255)
+
+    gray = np.zeros((100, 200), dtype=np.uint8)
+    out = np.empty((100, 200, 3), dtype=np.uint8)
+    assert draw_scale_bar(gray, 1.0, out=out) is out
+    assert np.array_equal(out, img)
+
+
+def test_default_font_only_built_on_fallback(monkeypatch):
+    loads = []
+    orig_load = ImageFont.load_default
+    monkeypatch.setattr(
+        ImageFont, "load_default", lambda *a, **k: loads.append(1) or orig_load(*a, **k)
+    )
+    monkeypatch.setattr(
+        img_utils.subprocess,
+        "run",
+        lambda *a, **k: SimpleNamespace(stdout="/fonts/Sans.ttf\n"),
+    )
+    orig_truetype = ImageFont.truetype
+
+    def fake_truetype(font, size=10, *args, **kwargs):
+        if isinstance(font, str):
+            return ("tt", font, size)
+        return orig_truetype(font, size, *args, **kwargs)
+
+    monkeypatch.setattr(ImageFont, "truetype", fake_truetype)
+    img_utils._resolve_font.cache_clear()
+    try:
+        assert img_utils._resolve_font("Sans", 40) == ("tt", "/fonts/Sans.ttf", 40)
+        assert loads == []
+        img_utils._resolve_font(None, 40)
+        assert loads == [1]
+    finally:
+        img_utils._resolve_font.cache_clear()
+
+
 def test_selecting_lens_updates_scale_bar(monkeypatch, qt_app):
     """Changing the lens selection updates the scale bar calibration."""
     monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
@@ -221,6 +317,38 @@ def test_selecting_lens_updates_scale_bar(monkeypatch, qt_app):
     assert captured["enabled"] is True
     assert captured["um_per_px"] == pytest.approx(1.0)
 
-    win.preview_timer.stop()
+    win.fps_timer.stop()
+    win.close()
+
+
+def test_lens_combo_rebuilt_only_when_lenses_change(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+    win = mw.MainWindow()
+    # rebuilds must not re-measure every item
+    assert (
+        win.lens_combo.sizeAdjustPolicy()
+        == QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon
+    )
+
+    lens_a = Lens("5x", 2.0)
+    lens_b = Lens("custom", 0.5)
+    win.lenses = {lens_a.name: lens_a, lens_b.name: lens_b}
+    win.current_lens = lens_a
+    win._refresh_lens_combo()
+
+    clears = []
+    orig_clear = win.lens_combo.clear
+    monkeypatch.setattr(win.lens_combo, "clear", lambda: (clears.append(1), orig_clear()))
+
+    win.current_lens = lens_b
+    win._refresh_lens_combo()
+    assert clears == []
+    assert win.lens_combo.currentData() == "custom"
+
+    lens_b.um_per_px = 0.25
+    win._refresh_lens_combo()
+    assert clears == [1]
+    assert win.lens_combo.currentText() == "custom (0.250 µm/px)"
+
     win.fps_timer.stop()
     win.close()
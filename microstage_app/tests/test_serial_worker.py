@@ -0,0 +1,74 @@
+import threading
+import time
+
+from PySide6 import QtCore
+
+from microstage_app.utils.serial_worker import SerialWorker
+
+
+def test_stop_wakes_idle_loop_immediately():
+    worker = SerialWorker(stage=None)
+    ran = []
+    worker.enqueue(ran.append, 1)
+    t = threading.Thread(target=worker.loop)
+    t.start()
+    deadline = time.monotonic() + 5
+    while not ran and time.monotonic() < deadline:
+        time.sleep(0.005)
+    start = time.monotonic()
+    worker.stop()
+    t.join(1)
+    assert not t.is_alive()
+    assert ran == [1]
+    assert time.monotonic() - start < 0.05
+
+
+def test_dedup_key_keeps_latest_and_priority_jumps_queue():
+    worker = SerialWorker(stage=None)
+    ran = []
+    gate = threading.Event()
+    worker.enqueue(gate.wait, 5)
+    for i in range(5):
+        worker.enqueue(ran.append, ("poll", i), dedup_key="position")
+        worker.enqueue(ran.append, ("move", i))
+    worker.enqueue(ran.append, "halt", priority=1)
+    worker.enqueue(ran.append, "stop")
+    t = threading.Thread(target=worker.loop)
+    t.start()
+    gate.set()
+    deadline = time.monotonic() + 5
+    while "stop" not in ran and time.monotonic() < deadline:
+        time.sleep(0.005)
+    worker.stop()
+    t.join(1)
+    assert ran == [
+        "halt",
+        ("move", 0), ("move", 1), ("move", 2), ("move", 3),
+        ("poll", 4), ("move", 4),
+        "stop",
+    ]
+    assert worker._keyed == {}
+
+
+def test_worker_thread_callbacks_skip_the_signal():
+    worker = SerialWorker(stage=None)
+    emitted = []
+    worker.result.connect(
+        lambda cb, res: emitted.append(res), QtCore.Qt.DirectConnection
+    )
+    seen = []
+    worker.enqueue(
+        lambda: 7,
+        callback=lambda res: seen.append((res, threading.current_thread())),
+        callback_thread="worker",
+    )
+    worker.enqueue(lambda: 8, callback=seen.append)
+    done = threading.Event()
+    worker.enqueue(done.set)
+    t = threading.Thread(target=worker.loop)
+    t.start()
+    assert done.wait(5)
+    worker.stop()
+    t.join(1)
+    assert seen == [(7, t)]
+    assert emitted == [8]
@@ -1,6 +1,6 @@
 import os
 import pytest
-from PySide6 import QtWidgets
+from PySide6 import QtCore, QtWidgets
 import microstage_app.ui.main_window as mw
 
 
@@ -61,7 +61,88 @@ def test_slider_spin_alignment_and_sync(monkeypatch, qt_app):
         assert slider.value() == val
         assert spin.value() == val
 
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
 
+
+
+def test_slider_scrub_throttles_camera_writes(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    writes = []
+
+    class FakeCam:
+        def set_brightness(self, v):
+            writes.append(v)
+
+    win.camera = FakeCam()
+    for v in range(1, 31):
+        win.brightness_slider.setValue(v)
+    # leading call only; the rest are collapsed into one trailing write
+    assert writes == [1]
+
+    deadline = QtCore.QDeadlineTimer(1000)
+    while len(writes) < 2 and not deadline.hasExpired():
+        qt_app.processEvents(QtCore.QEventLoop.AllEvents, 20)
+    assert writes == [1, 30]
+
+    win.camera = None
+    win.fps_timer.stop()
+    win.close()
+
+
+def test_mirror_does_not_echo(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    spin_emits, slider_emits = [], []
+    win.hue_spin.valueChanged.connect(spin_emits.append)
+    win.hue_slider.valueChanged.connect(slider_emits.append)
+
+    win.hue_slider.setValue(1 if win.hue_slider.value() != 1 else 2)
+    assert len(slider_emits) == 1
+    assert spin_emits == []
+    assert win.hue_spin.value() == win.hue_slider.value()
+
+    win.hue_spin.setValue(-win.hue_spin.value())
+    assert len(spin_emits) == 1
+    assert len(slider_emits) == 1
+    assert win.hue_slider.value() == win.hue_spin.value()
+
+    win.fps_timer.stop()
+    win.close()
+
+
+def test_sync_cam_controls_does_not_write_back(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    writes = []
+
+    class FakeCam:
+        def get_brightness(self):
+            return win.brightness_spin.value() + 3
+
+        def set_brightness(self, v):
+            writes.append(v)
+
+    win.camera = FakeCam()
+    emits = []
+    win.brightness_spin.valueChanged.connect(emits.append)
+    win._sync_cam_controls()
+    assert win.brightness_slider.value() == win.brightness_spin.value()
+    assert emits == [] and writes == []
+
+    win.camera = None
+    win.fps_timer.stop()
+    win.close()
+
+
+def test_signals_blocked_restores_previous_state(qt_app):
+    a, b = QtWidgets.QSpinBox(), QtWidgets.QSpinBox()
+    b.blockSignals(True)
+    with mw._signals_blocked(a, b):
+        assert a.signalsBlocked() and b.signalsBlocked()
+    assert not a.signalsBlocked()
+    assert b.signalsBlocked()
@@ -0,0 +1,96 @@
+import os
+import threading
+
+import pytest
+from PySide6 import QtCore, QtWidgets
+import microstage_app.ui.main_window as mw
+
+
+@pytest.fixture
+def qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    yield app
+
+
+def test_stage_dialog_scans_ports_off_ui_thread(monkeypatch, qt_app):
+    release = threading.Event()
+    scan_threads = []
+
+    def scan():
+        scan_threads.append(threading.current_thread())
+        release.wait(5)
+        return ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+
+    monkeypatch.setattr(mw, "list_marlin_ports", scan)
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+    seen = {}
+
+    def fake_exec(dlg):
+        lst = dlg.findChild(QtWidgets.QListWidget)
+        status = dlg.findChild(QtWidgets.QLabel)
+        # the dialog is up before the scan has returned
+        seen["initial"] = (lst.count(), status.text())
+        release.set()
+        loop = QtCore.QEventLoop()
+        poll = QtCore.QTimer(interval=10)
+        poll.timeout.connect(lambda: win._port_scan_worker is None and loop.quit())
+        poll.start()
+        QtCore.QTimer.singleShot(5000, loop.quit)
+        loop.exec()
+        poll.stop()
+        seen["ports"] = [lst.item(i).text() for i in range(lst.count())]
+        seen["status_hidden"] = status.isHidden()
+        return 0
+
+    monkeypatch.setattr(QtWidgets.QDialog, "exec", fake_exec)
+    win = mw.MainWindow()
+    try:
+        win._show_stage_dialog()
+        assert seen["initial"] == (0, "Scanning for stages…")
+        assert seen["ports"] == ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+        assert seen["status_hidden"]
+        assert scan_threads[0] is not threading.main_thread()
+        assert win._port_scan_worker is None
+        assert win._stage_dialog is None
+    finally:
+        release.set()
+        win.fps_timer.stop()
+        win.close()
+
+
+def test_stage_dialog_reuses_last_scan_and_applies_diff(monkeypatch, qt_app):
+    monkeypatch.setattr(mw, "list_marlin_ports", lambda: ["/dev/ttyUSB1", "/dev/ttyUSB2"])
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+    seen = {}
+
+    def fake_exec(dlg):
+        lst = dlg.findChild(QtWidgets.QListWidget)
+        seen["initial"] = [lst.item(i).text() for i in range(lst.count())]
+        kept = lst.item(1)
+        loop = QtCore.QEventLoop()
+        poll = QtCore.QTimer(interval=10)
+        poll.timeout.connect(lambda: win._port_scan_worker is None and loop.quit())
+        poll.start()
+        QtCore.QTimer.singleShot(5000, loop.quit)
+        loop.exec()
+        poll.stop()
+        seen["ports"] = [lst.item(i).text() for i in range(lst.count())]
+        # ports still present keep their list item
+        seen["kept"] = lst.item(0) is kept
+        return 0
+
+    monkeypatch.setattr(QtWidgets.QDialog, "exec", fake_exec)
+    win = mw.MainWindow()
+    try:
+        win._last_ports = ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+        win._show_stage_dialog()
+        assert seen["initial"] == ["/dev/ttyUSB0", "/dev/ttyUSB1"]
+        assert seen["ports"] == ["/dev/ttyUSB1", "/dev/ttyUSB2"]
+        assert seen["kept"]
+        assert win._last_ports == ["/dev/ttyUSB1", "/dev/ttyUSB2"]
+    finally:
+        win.fps_timer.stop()
+        win.close()
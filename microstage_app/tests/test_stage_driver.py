@@ -1,4 +1,5 @@
 import serial
+from microstage_app.devices import stage_marlin
 from microstage_app.devices.stage_marlin import StageMarlin
 
 class DummySerial:
@@ -19,13 +20,73 @@ def test_move_commands(monkeypatch):
     monkeypatch.setattr(serial, 'Serial', lambda *a, **k: dummy)
     stage = StageMarlin('COMX')
     dummy.writes.clear()
-    stage.move_relative(dx=1.0, dy=-2.0, dz=0.5, feed_mm_per_min=123, wait_ok=True)
+    stage.move_relative(dx=1.0, dy=-2.0, dz=0.5, feed_mm_per_min=123)
     assert dummy.writes[0].strip() == 'G91'
     cmd = dummy.writes[1]
     assert 'X1.000000' in cmd and 'Y-2.000000' in cmd and 'Z0.500000' in cmd and 'F123.00' in cmd
     assert dummy.writes[2].strip() == 'G90'
     dummy.writes.clear()
-    stage.move_absolute(x=2.0, z=-1.0, feed_mm_per_min=150, wait_ok=True)
+    stage.move_absolute(x=2.0, z=-1.0, feed_mm_per_min=150)
     assert dummy.writes[0].strip() == 'G90'
     cmd = dummy.writes[1]
     assert cmd.startswith('G1') and 'X2.000000' in cmd and 'Z-1.000000' in cmd and 'F150.00' in cmd
+
+
+def test_move_is_one_round_trip(monkeypatch):
+    events = []
+
+    class LoggingSerial(DummySerial):
+        def write(self, data):
+            events.append(("w", data.decode().strip()))
+        def readline(self):
+            events.append(("r", None))
+            return b'ok\n'
+
+    dummy = LoggingSerial()
+    monkeypatch.setattr(serial, 'Serial', lambda *a, **k: dummy)
+    monkeypatch.setattr(stage_marlin.time, 'sleep', lambda s: None)
+    stage = StageMarlin('COMX')
+    events.clear()
+    stage.move_relative(dz=0.5)
+    # every command is written before the first acknowledgement is read
+    assert [e[0] for e in events] == ["w", "w", "w", "r", "r", "r"]
+    assert events[0][1] == 'G91' and events[2][1] == 'G90'
+
+
+def test_batches_keep_few_commands_in_flight(monkeypatch):
+    events = []
+
+    class LoggingSerial(DummySerial):
+        def write(self, data):
+            events.append("w")
+        def readline(self):
+            events.append("r")
+            return b'ok\n'
+
+    dummy = LoggingSerial()
+    monkeypatch.setattr(serial, 'Serial', lambda *a, **k: dummy)
+    monkeypatch.setattr(stage_marlin.time, 'sleep', lambda s: None)
+    stage = StageMarlin('COMX')
+    events.clear()
+    stage.send_batch([f"G1 X{i}" for i in range(6)])
+    in_flight = 0
+    for e in events:
+        in_flight += 1 if e == "w" else -1
+        assert in_flight <= StageMarlin.MAX_IN_FLIGHT
+    assert in_flight == 0 and events.count("w") == 6
+
+
+def test_move_with_wait_batches_m400(monkeypatch):
+    dummy = DummySerial()
+    monkeypatch.setattr(serial, 'Serial', lambda *a, **k: dummy)
+    monkeypatch.setattr(stage_marlin.time, 'sleep', lambda s: None)
+    stage = StageMarlin('COMX')
+    dummy.writes.clear()
+    stage.move_absolute(x=1.0, wait=True)
+    assert [w.split()[0] for w in dummy.writes] == ['G90', 'G1', 'M400']
+    dummy.writes.clear()
+    stage.move_relative(dz=0.1, wait=True)
+    assert [w.split()[0] for w in dummy.writes] == ['G91', 'G1', 'G90', 'M400']
+    dummy.writes.clear()
+    stage.move_absolute(x=1.0)
+    assert 'M400\n' not in dummy.writes
@@ -50,6 +50,5 @@ def test_get_position_and_label(monkeypatch, qt_app):
         txt = win.stage_pos.text()
         assert "X1.000000" in txt and "Z2.000000" in txt
     finally:
-        win.preview_timer.stop()
         win.fps_timer.stop()
         win.close()
@@ -0,0 +1,83 @@
+import os
+import pytest
+from PySide6 import QtWidgets
+
+import microstage_app.ui.main_window as mw
+
+
+@pytest.fixture
+def qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    yield app
+
+
+def _tab_index(tabs, text):
+    return next(i for i in range(tabs.count()) if tabs.tabText(i) == text)
+
+
+def test_system_tab_built_on_first_visit_and_polls_while_visible(monkeypatch, qt_app):
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    win.show()
+    assert win.system_tab is None
+    assert not win.findChildren(mw.SystemMonitorTab)
+
+    win.right_tabs.setCurrentIndex(_tab_index(win.right_tabs, "System"))
+    monitor = win.system_tab
+    assert isinstance(monitor, mw.SystemMonitorTab)
+    assert monitor.timer.isActive()
+
+    win.right_tabs.setCurrentIndex(_tab_index(win.right_tabs, "Camera"))
+    assert not monitor.timer.isActive()
+    win.right_tabs.setCurrentIndex(_tab_index(win.right_tabs, "System"))
+    assert win.system_tab is monitor
+    assert monitor.timer.isActive()
+    assert monitor.timer.interval() == 2000
+
+    # minimizing/hiding the window stops polling as well
+    win.hide()
+    assert not monitor.timer.isActive()
+    win.show()
+    assert monitor.timer.isActive()
+
+    win.fps_timer.stop()
+    win.close()
+    assert not monitor.timer.isActive()
+
+
+def test_gpu_memory_total_read_once(monkeypatch, qt_app):
+    import microstage_app.ui.system_monitor_tab as smt
+    from types import SimpleNamespace
+
+    calls = []
+
+    def mem_info(handle):
+        calls.append(handle)
+        return SimpleNamespace(used=512 * 1024**2, total=8192 * 1024**2)
+
+    monkeypatch.setattr(smt, "_NVML_AVAILABLE", True)
+    monkeypatch.setattr(smt, "_NVML_HANDLE", "gpu0", raising=False)
+    monkeypatch.setattr(smt, "NVMLError", RuntimeError, raising=False)
+    monkeypatch.setattr(smt, "nvmlDeviceGetMemoryInfo", mem_info, raising=False)
+    monkeypatch.setattr(
+        smt, "nvmlDeviceGetUtilizationRates",
+        lambda handle: SimpleNamespace(gpu=37), raising=False,
+    )
+    monkeypatch.setattr(smt.SystemMonitorTab, "isVisible", lambda self: True)
+
+    tab = smt.SystemMonitorTab()
+    assert tab.gpu_mem_bar.maximum() == 8192
+    monkeypatch.setattr(
+        tab.gpu_mem_bar, "setMaximum",
+        lambda *_: pytest.fail("total is fixed"), raising=False,
+    )
+    for _ in range(3):
+        tab.update_metrics()
+    assert len(calls) == 4
+    assert tab.gpu_mem_bar.value() == 512
+    assert tab.gpu_mem_label.text() == "GPU Memory: 512 MiB / 8192 MiB"
+    assert tab.gpu_label.text() == "GPU Usage: 37%"
@@ -18,8 +18,10 @@ def qt_app():
 def test_ui_field_persistence(monkeypatch, tmp_path, qt_app):
     monkeypatch.setattr(Profiles, "PATH", str(tmp_path / "profiles.yaml"))
 
+    real_init = mw.ImageWriter.__init__
+
     def fake_init(self, base_dir='runs'):
-        self.base_dir = base_dir
+        real_init(self, str(tmp_path / "runs"))
         self.run_dir = str(tmp_path / "runs")
     monkeypatch.setattr(mw.ImageWriter, "__init__", fake_init)
     monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
@@ -29,11 +31,93 @@ def test_ui_field_persistence(monkeypatch, tmp_path, qt_app):
     win1.feedy_spin.setValue(123.0)
     win1.absz_spin.setValue(9.876)
     qt_app.processEvents()
-    win1.preview_timer.stop(); win1.fps_timer.stop(); win1.close()
+    win1.fps_timer.stop(); win1.close()
 
     win2 = mw.MainWindow()
     assert win2.stepx_spin.value() == pytest.approx(1.234)
     assert win2.feedy_spin.value() == pytest.approx(123.0)
     assert win2.absz_spin.value() == pytest.approx(9.876)
-    win2.preview_timer.stop(); win2.fps_timer.stop(); win2.close()
+    win2.fps_timer.stop(); win2.close()
+
+
+
+def test_jog_field_typing_commits_once(monkeypatch, tmp_path, qt_app):
+    from PySide6 import QtCore, QtTest
+
+    monkeypatch.setattr(Profiles, "PATH", str(tmp_path / "profiles.yaml"))
+
+    real_init = mw.ImageWriter.__init__
+
+    def fake_init(self, base_dir='runs'):
+        real_init(self, str(tmp_path / "runs"))
+        self.run_dir = str(tmp_path / "runs")
+    monkeypatch.setattr(mw.ImageWriter, "__init__", fake_init)
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    win = mw.MainWindow()
+    saves, sets = [], []
+    orig_set = win.profiles.set
+    monkeypatch.setattr(win.profiles, "save", lambda: saves.append(1))
+    monkeypatch.setattr(
+        win.profiles, "set", lambda k, v: (sets.append(k), orig_set(k, v))
+    )
+
+    line = win.stepx_spin.lineEdit()
+    line.selectAll()
+    QtTest.QTest.keyClicks(line, "2.5")
+    assert sets == []
+    QtTest.QTest.keyClick(line, QtCore.Qt.Key_Return)
+    assert sets == ["jog.step.x"]
+    assert win.profiles.get("jog.step.x") == pytest.approx(2.5)
+    assert saves == []
+
+    win._profile_save_timer.timeout.emit()
+    assert saves == [1]
+    win.fps_timer.stop(); win.close()
+
+
+def test_splitter_layout_persists(monkeypatch, tmp_path, qt_app):
+    from PySide6 import QtCore
+
+    monkeypatch.setattr(Profiles, "PATH", str(tmp_path / "profiles.yaml"))
+
+    real_init = mw.ImageWriter.__init__
+
+    def fake_init(self, base_dir='runs'):
+        real_init(self, str(tmp_path / "runs"))
+        self.run_dir = str(tmp_path / "runs")
+    monkeypatch.setattr(mw.ImageWriter, "__init__", fake_init)
+    monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
+
+    def hsplit(win):
+        return next(
+            sp for sp in win.findChildren(QtWidgets.QSplitter)
+            if sp.orientation() == QtCore.Qt.Horizontal
+        )
+
+    win1 = mw.MainWindow()
+    sp1 = hsplit(win1)
+    sp1.setSizes([120, 500, 260])
+    sp1.splitterMoved.emit(120, 1)
+    state = win1.profiles.get("ui.splitter_h")
+    assert state
+    win1._profile_save_timer.timeout.emit()
+    win1.fps_timer.stop(); win1.close()
+
+    win2 = mw.MainWindow()
+    assert hsplit(win2).saveState().toBase64().data().decode("ascii") == state
+    win2.fps_timer.stop(); win2.close()
+
 
+def test_profile_getter_dispatches_by_widget_class(qt_app):
+    spin = QtWidgets.QDoubleSpinBox(); spin.setValue(2.5)
+    check = QtWidgets.QCheckBox(); check.setChecked(True)
+    combo = QtWidgets.QComboBox(); combo.addItem("Low", 1); combo.addItem("High", 2)
+    combo.setCurrentIndex(1)
+    plain = QtWidgets.QComboBox(); plain.addItems(["a", "b"])
+    edit = QtWidgets.QLineEdit("name")
+    values = [
+        mw._profile_getter(type(w))(w) for w in (spin, check, combo, plain, edit)
+    ]
+    assert values == [2.5, True, 2, "a", "name"]
+    assert mw._profile_getter(QtWidgets.QLabel) is None
@@ -32,6 +32,5 @@ def test_ui_connects_with_mock_camera(monkeypatch, qt_app):
     win.depth_combo.setCurrentIndex(1)
     assert called[-1] == 16
 
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
@@ -20,26 +20,15 @@ def qt_app():
 @pytest.fixture
 def make_window(monkeypatch, tmp_path, qt_app):
     monkeypatch.setattr(Profiles, "PATH", str(tmp_path / "profiles.yaml"))
+    real_init = mw.ImageWriter.__init__
+
     def fake_writer_init(self, base_dir='runs'):
-        self.base_dir = base_dir
+        real_init(self, str(tmp_path / "runs"))
         self.run_dir = str(tmp_path / "runs")
     monkeypatch.setattr(mw.ImageWriter, "__init__", fake_writer_init)
     monkeypatch.setattr(mw.MainWindow, "_auto_connect_async", lambda self: None)
 
-    class DummyThread:
-        def quit(self):
-            pass
-        def wait(self):
-            pass
-    class DummySignal:
-        def connect(self, *args, **kwargs):
-            pass
-    class DummyWorker:
-        def __init__(self):
-            self.finished = DummySignal()
-    def fake_run_async(fn, *args, **kwargs):
-        return DummyThread(), DummyWorker()
-    monkeypatch.setattr(mw, "run_async", fake_run_async)
+    monkeypatch.setattr(mw, "run_pooled", lambda done, fn, *a, **k: None)
 
     captured = {}
     class DummyRasterRunner:
@@ -62,7 +51,7 @@ def make_window(monkeypatch, tmp_path, qt_app):
     win.auto_number = False
     win.capture_format = "bmp"
     yield win, captured
-    win.preview_timer.stop(); win.fps_timer.stop(); win.close()
+    win.fps_timer.stop(); win.close()
 
 
 @pytest.mark.parametrize(
@@ -167,3 +156,19 @@ def test_raster_stack_config(make_window):
     assert cfg.stack is True
     assert cfg.stack_range_mm == pytest.approx(0.7)
     assert cfg.stack_step_mm == pytest.approx(0.02)
+
+
+def test_point_and_roi_buttons_pass_their_property(make_window, monkeypatch):
+    win, _ = make_window
+    calls = []
+    monkeypatch.setattr(win, "_set_raster_point", lambda i: calls.append(("raster", i)))
+    monkeypatch.setattr(win, "_set_level_point", lambda i: calls.append(("level", i)))
+    monkeypatch.setattr(win, "_apply_roi", lambda m: calls.append(("roi", m)))
+
+    win.raster_mode_combo.setCurrentText("3-point")
+    win.btn_raster_p3.click()
+    win.btn_level_p2.click()
+    win.btn_roi_1024.click()
+    win.btn_roi_full.click()
+
+    assert calls == [("raster", 3), ("level", 2), ("roi", 1024), ("roi", "full")]
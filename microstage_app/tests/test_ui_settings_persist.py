@@ -19,8 +19,10 @@ def qt_app():
 def test_ui_settings_persist(monkeypatch, tmp_path, qt_app):
     monkeypatch.setattr(Profiles, "PATH", str(tmp_path / "profiles.yaml"))
 
+    real_init = mw.ImageWriter.__init__
+
     def fake_init(self, base_dir="runs"):
-        self.base_dir = base_dir
+        real_init(self, str(tmp_path / "runs"))
         self.run_dir = str(tmp_path / "runs")
 
     monkeypatch.setattr(mw.ImageWriter, "__init__", fake_init)
@@ -32,11 +34,11 @@ def test_ui_settings_persist(monkeypatch, tmp_path, qt_app):
     win1.feedy_spin.setValue(45.6)
     win1.absz_spin.setValue(7.89)
     qt_app.processEvents()
-    win1.preview_timer.stop(); win1.fps_timer.stop(); win1.close()
+    win1.fps_timer.stop(); win1.close()
 
     win2 = mw.MainWindow()
     assert win2.stepx_spin.value() == pytest.approx(1.234)
     assert win2.feedy_spin.value() == pytest.approx(45.6)
     assert win2.absz_spin.value() == pytest.approx(7.89)
-    win2.preview_timer.stop(); win2.fps_timer.stop(); win2.close()
+    win2.fps_timer.stop(); win2.close()
 
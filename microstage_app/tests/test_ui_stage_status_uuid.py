@@ -29,6 +29,5 @@ def test_stage_status_multiline(monkeypatch, qt_app):
     win._on_stage_connect(DummyStage(), None)
     assert win.stage_status.text() == "Stage: MicroStageController\n1234-uuid"
 
-    win.preview_timer.stop()
     win.fps_timer.stop()
     win.close()
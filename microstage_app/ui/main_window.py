@@ -8,7 +8,7 @@ import cv2
 from ..devices.stage_marlin import StageMarlin, find_marlin_port, list_marlin_ports
 from ..devices.camera_toupcam import create_camera, list_cameras
 
-from ..control.autofocus import FocusMetric, AutoFocus
+from ..control.autofocus import FocusMetric, FocusSearch, AutoFocus, mono_frames
 from ..control.raster import RasterRunner, RasterConfig
 from ..control.profiles import Profiles
 from ..io.storage import ImageWriter
@@ -20,80 +20,412 @@ from ..control.focus_planes import (
     Area,
 )
 
-from ..utils.img import numpy_to_qimage, draw_scale_bar, VERT_SCALE, TEXT_SCALE
+from ..utils.img import draw_scale_bar, VERT_SCALE, TEXT_SCALE
 from ..utils.log import LOG, log
 from ..utils.serial_worker import SerialWorker
-from ..utils.workers import run_async
+from ..utils.workers import run_pooled, Throttle
+from ..utils.preview_worker import PreviewWorker
 
 from pathlib import Path
+import contextlib
+import functools
 import os
 import re
 import time
 import math
 import datetime
 import threading
+import zlib
 
 
 # Preferred lens display order
 PRESET_LENS_ORDER = ["5x", "10x", "20x", "50x"]
 
 
-def _load_stage_bounds():
-    cfg = Path(__file__).resolve().parents[2] / "marlin/Marlin-2.1.3-b3/Marlin/Configuration.h"
+_MARLIN_CONFIG = (
+    Path(__file__).resolve().parents[2] / "marlin/Marlin-2.1.3-b3/Marlin/Configuration.h"
+)
+_RE_X_BED_SIZE = re.compile(r"#define\s+X_BED_SIZE\s+(\d+)")
+_RE_Y_BED_SIZE = re.compile(r"#define\s+Y_BED_SIZE\s+(\d+)")
+_RE_Z_MAX_POS = re.compile(r"#define\s+Z_MAX_POS\s+(\d+)")
+_RE_MAX_FEEDRATE = re.compile(r"DEFAULT_MAX_FEEDRATE\s*{([^}]+)}")
+
+# camera image controls, each a <name>_spin/<name>_slider pair driving the
+# camera's set_<name>/get_<name>
+_IMAGE_CONTROLS = ("brightness", "contrast", "saturation", "hue", "gamma")
+
+# optional camera driver methods, probed once per camera (see _camera_caps)
+_CAMERA_CAPS = (
+    "get_binning",
+    "get_brightness",
+    "get_color_depth",
+    "get_contrast",
+    "get_frame_after",
+    "get_gamma",
+    "get_hue",
+    "get_resolution_index",
+    "get_saturation",
+    "get_speed_range",
+    "list_binning_factors",
+    "list_color_depths",
+    "set_brightness",
+    "set_center_roi",
+    "set_contrast",
+    "set_exposure_ms",
+    "set_gain",
+    "set_gamma",
+    "set_hue",
+    "set_raw_fast_mono",
+    "set_saturation",
+    "set_speed_level",
+)
+
+_BOUND_KEYS = ("xmin", "xmax", "ymin", "ymax", "zmin", "zmax")
+_LIMITS_FMT = (
+    "Limits: X[{:.6f},{:.6f}] Y[{:.6f},{:.6f}] Z[{:.6f},{:.6f}]"
+)
+
+# characters not allowed in capture/raster file names
+_RE_ILLEGAL_NAME = re.compile(r"[\\/:*?\"<>|]")
+
+# smallest XY step the stage is sent (moves are formatted to 6 decimals);
+# leveling points closer than this to the last one are probed in place
+_STAGE_RES_MM = 1e-6
+
+
+@functools.lru_cache(maxsize=1)
+def _load_marlin_config():
+    """Read ``Configuration.h`` once and parse stage bounds and feed limits.
+
+    Returns ``{"bounds": dict | None, "feeds": list | None}``; callers should
+    treat the result as read-only since it is shared between them.
+    """
     try:
-        text = cfg.read_text()
+        text = _MARLIN_CONFIG.read_text()
     except Exception as e:
-        LOG.warning("Failed to load stage bounds: %s", e)
-        return None
+        log(f"WARNING: Failed to load Marlin configuration: {e}")
+        return {"bounds": None, "feeds": None}
+    return {"bounds": _parse_stage_bounds(text), "feeds": _parse_feed_limits(text)}
+
+
+def _parse_stage_bounds(text):
     def _parse(pattern, name):
-        m = re.search(pattern, text)
+        m = pattern.search(text)
         if not m:
-            LOG.warning("Stage bounds: failed to parse %s", name)
+            log(f"WARNING: Stage bounds: failed to parse {name}")
             return None
         return float(m.group(1))
-    x = _parse(r"#define\s+X_BED_SIZE\s+(\d+)", "X_BED_SIZE")
-    y = _parse(r"#define\s+Y_BED_SIZE\s+(\d+)", "Y_BED_SIZE")
-    z = _parse(r"#define\s+Z_MAX_POS\s+(\d+)", "Z_MAX_POS")
+    x = _parse(_RE_X_BED_SIZE, "X_BED_SIZE")
+    y = _parse(_RE_Y_BED_SIZE, "Y_BED_SIZE")
+    z = _parse(_RE_Z_MAX_POS, "Z_MAX_POS")
     if x is None or y is None or z is None:
         return None
     return {"xmin": 0.0, "xmax": x, "ymin": 0.0, "ymax": y, "zmin": 0.0, "zmax": z}
 
 
-def _load_feed_limits():
-    cfg = Path(__file__).resolve().parents[2] / "marlin/Marlin-2.1.3-b3/Marlin/Configuration.h"
+def _parse_feed_limits(text):
     try:
-        text = cfg.read_text()
-        m = re.search(r"DEFAULT_MAX_FEEDRATE\s*{([^}]+)}", text)
+        m = _RE_MAX_FEEDRATE.search(text)
         if not m:
             return None
         vals = [float(v.strip()) for v in m.group(1).split(',')[:3]]
         return [v * 60.0 for v in vals]  # mm/min
     except Exception as e:
-        LOG.warning("Failed to load feed limits: %s", e)
+        log(f"WARNING: Failed to load feed limits: {e}")
         return None
 
 
+def _load_stage_bounds():
+    bounds = _load_marlin_config()["bounds"]
+    return dict(bounds) if bounds is not None else None
+
+
+def _load_feed_limits():
+    feeds = _load_marlin_config()["feeds"]
+    return list(feeds) if feeds is not None else None
+
+
+def _log_capture_write(path, err):
+    """Report a background capture write; called from the writer's pool."""
+    log(f"Capture saved: {path}" if err is None else f"Capture write error: {path}: {err}")
+
+
+def _display_refresh_hz(default: float = 60.0) -> float:
+    """Return the primary screen refresh rate, or ``default`` if unknown."""
+    app = QtGui.QGuiApplication.instance()
+    screen = app.primaryScreen() if app is not None else None
+    hz = screen.refreshRate() if screen is not None else 0.0
+    return hz if hz > 0 else default
+
+
+def _gl_viewport():
+    """Return a ``QOpenGLWidget`` for GPU compositing, or ``None``.
+
+    Headless platforms (offscreen/minimal, as used by the tests) have no GL
+    context, so the default raster viewport is kept there.
+    """
+    app = QtGui.QGuiApplication.instance()
+    if app is None or app.platformName() in ("offscreen", "minimal"):
+        return None
+    try:
+        from PySide6.QtOpenGLWidgets import QOpenGLWidget
+    except Exception:  # pragma: no cover - QtOpenGL is optional
+        return None
+    return QOpenGLWidget()
+
+
+def _load_spin(w, path, profiles):
+    val = profiles.get(path, w.value(), expected_type=(int, float),
+                       min_value=w.minimum(), max_value=w.maximum())
+    w.setValue(val)
+
+
+def _load_check(w, path, profiles):
+    w.setChecked(profiles.get(path, w.isChecked(), expected_type=bool))
+
+
+def _combo_value(w):
+    data = w.currentData()
+    return data if data is not None else w.currentText()
+
+
+def _load_combo(w, path, profiles):
+    default = _combo_value(w)
+    val = profiles.get(path, default, expected_type=(int, float, str))
+    pos = w.findData(val)
+    if pos >= 0:
+        w.setCurrentIndex(pos)
+    elif isinstance(val, str) and w.findText(val) >= 0:
+        w.setCurrentText(val)
+    else:
+        log(f"WARNING: profile '{path}' option {val!r} not valid; using default {default!r}")
+
+
+def _load_line_edit(w, path, profiles):
+    w.setText(profiles.get(path, w.text(), expected_type=str))
+
+
+# widget base class -> loader(widget, profile_path, profiles)
+_PROFILE_LOADERS = {
+    QtWidgets.QAbstractSpinBox: _load_spin,
+    QtWidgets.QCheckBox: _load_check,
+    QtWidgets.QComboBox: _load_combo,
+    QtWidgets.QLineEdit: _load_line_edit,
+}
+
+
+# widget base class -> getter(widget) for the value saved on close
+_PROFILE_GETTERS = {
+    QtWidgets.QAbstractSpinBox: lambda w: w.value(),
+    QtWidgets.QCheckBox: lambda w: w.isChecked(),
+    QtWidgets.QComboBox: _combo_value,
+    QtWidgets.QLineEdit: lambda w: w.text(),
+}
+
+
+def _lookup_by_mro(table, cls):
+    for base in cls.__mro__:
+        entry = table.get(base)
+        if entry is not None:
+            return entry
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _profile_loader(cls):
+    """Return the profile loader for widget class ``cls`` (or ``None``).
+
+    Resolved once per concrete class by walking its MRO, so each widget
+    costs a single cached lookup instead of an ``isinstance`` chain.
+    """
+    return _lookup_by_mro(_PROFILE_LOADERS, cls)
+
+
+@functools.lru_cache(maxsize=None)
+def _profile_getter(cls):
+    """Return the profile value getter for widget class ``cls`` (or ``None``).
+
+    Cached per concrete class like :func:`_profile_loader`.
+    """
+    return _lookup_by_mro(_PROFILE_GETTERS, cls)
+
+
+def _coord_spin(value: float = 0.0) -> QtWidgets.QDoubleSpinBox:
+    """Return a stage coordinate spin box (mm, 6 decimals, ±1000)."""
+    spin = QtWidgets.QDoubleSpinBox()
+    spin.setDecimals(6)
+    spin.setRange(-1000.0, 1000.0)
+    spin.setValue(value)
+    return spin
+
+
+@contextlib.contextmanager
+def _signals_blocked(*widgets):
+    """Block signals on all ``widgets`` for the duration of the block.
+
+    Each widget's previous blocking state is restored afterwards, so nested
+    uses compose.
+    """
+    prev = [w.blockSignals(True) for w in widgets]
+    try:
+        yield
+    finally:
+        for w, was in zip(widgets, prev):
+            w.blockSignals(was)
+
+
+def _mirror(dst, apply):
+    """Return a ``valueChanged`` handler copying the value to ``dst``.
+
+    ``dst`` is updated under a signal blocker so the paired widget does not
+    echo the change back, and ``apply`` runs once per user change.
+    """
+    def handler(v):
+        with QtCore.QSignalBlocker(dst):
+            dst.setValue(v)
+        apply(v)
+    return handler
+
+
+# log flushes larger than this repaint the pane once instead of per block
+_LOG_BULK_LINES = 100
+
+
+# events after which cached font metrics must be recomputed
+_FONT_METRIC_EVENTS = tuple(
+    getattr(QtCore.QEvent, name)
+    for name in ("FontChange", "ApplicationFontChange", "DevicePixelRatioChange")
+    if hasattr(QtCore.QEvent, name)
+)
+
+
+class RulerItem(QtWidgets.QGraphicsItem):
+    """Ruler line plus its tick marks drawn as a single scene item.
+
+    The ticks are kept in one cached :class:`QtGui.QPainterPath` that is only
+    rebuilt when the end point moves, so a drag touches one BSP entry and
+    issues one paint call regardless of the ruler length.
+    """
+
+    TICK_SPACING = 50
+    TICK_HALF = 5
+
+    def __init__(self, anchor, parent=None):
+        super().__init__(parent)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        self._line_pen = QtGui.QPen(QtCore.Qt.red, 2)
+        self._tick_pen = QtGui.QPen(QtCore.Qt.red, 1)
+        p = QtCore.QPointF(*anchor)
+        self._line = QtCore.QLineF(p, p)
+        self._ticks = QtGui.QPainterPath()
+        self._tick_count = 0
+        self._bounds = QtCore.QRectF()
+
+    def line(self) -> QtCore.QLineF:
+        return QtCore.QLineF(self._line)
+
+    def tick_count(self) -> int:
+        return self._tick_count
+
+    def set_end(self, end):
+        line = QtCore.QLineF(self._line.p1(), QtCore.QPointF(end[0], end[1]))
+        ticks = QtGui.QPainterPath()
+        length = line.length()
+        n = 0
+        if length > 0:
+            unit_x = line.dx() / length
+            unit_y = line.dy() / length
+            nx = -unit_y * self.TICK_HALF
+            ny = unit_x * self.TICK_HALF
+            d = np.arange(self.TICK_SPACING, int(length), self.TICK_SPACING, dtype=np.float64)
+            px = line.x1() + unit_x * d
+            py = line.y1() + unit_y * d
+            ends = np.column_stack((px + nx, py + ny, px - nx, py - ny)).tolist()
+            for x1, y1, x2, y2 in ends:
+                ticks.moveTo(x1, y1)
+                ticks.lineTo(x2, y2)
+            n = len(ends)
+        self.prepareGeometryChange()
+        self._line = line
+        self._ticks = ticks
+        self._tick_count = n
+        pad = self._line_pen.widthF() + self.TICK_HALF
+        self._bounds = (
+            QtCore.QRectF(line.p1(), line.p2()).normalized()
+            .united(ticks.boundingRect())
+            .adjusted(-pad, -pad, pad, pad)
+        )
+        self.update()
+
+    def boundingRect(self) -> QtCore.QRectF:
+        return self._bounds
+
+    def paint(self, painter, option, widget=None):
+        painter.setPen(self._line_pen)
+        painter.drawLine(self._line)
+        if self._tick_count:
+            painter.setPen(self._tick_pen)
+            painter.drawPath(self._ticks)
+
+
 class MeasureView(QtWidgets.QGraphicsView):
     calibration_measured = QtCore.Signal(float)
+    # device-pixel (w, h) of the viewport, see preview_size()
+    viewport_resized = QtCore.Signal(int, int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        gl = _gl_viewport()
+        if gl is not None:
+            self.setViewport(gl)
+        # repaint only the bounding rect of what changed instead of the whole
+        # viewport; the overlays are confined to the image rect anyway
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.BoundingRectViewportUpdate)
+        # the view paints every exposed pixel itself (image plus a solid
+        # background brush for the letterbox area), so skip Qt's pre-paint
+        # background erase
+        self.setBackgroundBrush(self.palette().brush(QtGui.QPalette.Base))
+        self.setAutoFillBackground(False)
+        vp = self.viewport()
+        vp.setAutoFillBackground(False)
+        vp.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, True)
+        vp.setAttribute(QtCore.Qt.WA_NoSystemBackground, True)
         self.setScene(QtWidgets.QGraphicsScene(self))
         self._pixmap = QtWidgets.QGraphicsPixmapItem()
+        # keep the fitted pixmap cached in device coordinates so overlay and
+        # ruler repaints don't rescale the full frame again
+        self._pixmap.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+        self._pixmap.setTransformationMode(QtCore.Qt.SmoothTransformation)
         self.scene().addItem(self._pixmap)
+        # (size, scale) of the last frame; the scene rect and view transform
+        # only need refreshing when this changes
+        self._last_geometry = None
+        # fingerprint of the last displayed frame, see _frame_key()
+        self._last_frame_key = None
         self._mode = None
         self._reticle_enabled = False
         self._scale_bar_enabled = False
         self._scale_um_per_px = 1.0
+        # (key, QPicture) of the last rendered scale bar overlay
+        self._scale_cache = None
+        self._update_scalebar_font()
+        # resize storms are collapsed into a single fit once they settle
+        self._fit_timer = QtCore.QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(16)
+        self._fit_timer.timeout.connect(self._fit_to_view)
 
         # ruler state
         self._anchor = None
         self._anchor_item = None
-        self._live_line = None
-        self._live_ticks = []
+        self._live_line = None  # RulerItem being dragged
         self._live_text = None
+        self._last_label_key = None
         self._lines = []
         self._um_per_px = 1.0
+        # latest pointer position awaiting _apply_move()
+        self._pending_move = None
+        self._move_scheduled = False
 
         # calibration state
         self._points = []
@@ -101,20 +433,26 @@ class MeasureView(QtWidgets.QGraphicsView):
 
     def set_reticle(self, enabled: bool):
         self._reticle_enabled = enabled
-        self.viewport().update()
+        self._update_image_rect()
 
     def set_scale_bar(self, enabled: bool, um_per_px: float):
         """Enable/disable the scale bar and set the current scale."""
         self._scale_bar_enabled = enabled
         self._scale_um_per_px = um_per_px
-        self.viewport().update()
+        self._scale_cache = None
+        self._update_image_rect()
+
+    def _update_image_rect(self):
+        """Schedule a repaint of the viewport area covered by the image."""
+        rect = self.mapFromScene(self._pixmap.sceneBoundingRect()).boundingRect()
+        self.viewport().update(rect.adjusted(-1, -1, 1, 1))
 
     def drawForeground(self, painter: QtGui.QPainter, rect: QtCore.QRectF) -> None:
         super().drawForeground(painter, rect)
         pix = self._pixmap.pixmap()
         if pix.isNull():
             return
-        br = self._pixmap.boundingRect()
+        br = self._pixmap.sceneBoundingRect()
         painter.save()
         if self._reticle_enabled:
             painter.save()
@@ -127,48 +465,124 @@ class MeasureView(QtWidgets.QGraphicsView):
             painter.restore()
 
         if self._scale_bar_enabled and self._scale_um_per_px > 0:
-            # compute a "nice" length that fits within ~20% of the image width
-            max_um = 0.2 * br.width() * self._scale_um_per_px
-            exp = math.floor(math.log10(max_um)) if max_um > 0 else 0
-            nice_um = 10 ** exp
-            for m in (5, 2, 1):
-                candidate = m * (10 ** exp)
-                if candidate <= max_um:
-                    nice_um = candidate
-                    break
-            length_px = nice_um / self._scale_um_per_px
-            margin = 20
-            x0 = br.right() - margin - length_px
-            y0 = br.bottom() - margin
-            painter.setPen(QtGui.QPen(QtCore.Qt.white, 2 * VERT_SCALE))
-            painter.drawLine(x0, y0, x0 + length_px, y0)
-            label = (
-                f"{nice_um/1000:.2f} mm" if nice_um >= 1000 else f"{nice_um:.0f} µm"
-            )
-            font = painter.font()
-            ps = font.pointSizeF()
-            if ps > 0:
-                font.setPointSizeF(ps * TEXT_SCALE)
-            else:
-                font.setPixelSize(font.pixelSize() * TEXT_SCALE)
-            painter.setFont(font)
-            fm = painter.fontMetrics()
-            painter.drawText(x0, y0 - (7 * TEXT_SCALE) - fm.descent(), label)
+            key = (br.x(), br.y(), br.width(), br.height(), self._scale_um_per_px)
+            if self._scale_cache is None or self._scale_cache[0] != key:
+                pic = QtGui.QPicture()
+                p = QtGui.QPainter(pic)
+                self._draw_scale_bar(p, br)
+                p.end()
+                self._scale_cache = (key, pic)
+            painter.drawPicture(0, 0, self._scale_cache[1])
         painter.restore()
 
-    def set_image(self, qimg: QtGui.QImage):
-        self._pixmap.setPixmap(QtGui.QPixmap.fromImage(qimg))
-        self.setSceneRect(self._pixmap.boundingRect())
-        self.fitInView(self._pixmap, QtCore.Qt.KeepAspectRatio)
-        self.viewport().update()
+    def _draw_scale_bar(self, painter: QtGui.QPainter, br: QtCore.QRectF) -> None:
+        # compute a "nice" length that fits within ~20% of the image width
+        max_um = 0.2 * br.width() * self._scale_um_per_px
+        exp = math.floor(math.log10(max_um)) if max_um > 0 else 0
+        nice_um = 10 ** exp
+        for m in (5, 2, 1):
+            candidate = m * (10 ** exp)
+            if candidate <= max_um:
+                nice_um = candidate
+                break
+        length_px = nice_um / self._scale_um_per_px
+        margin = 20
+        x0 = br.right() - margin - length_px
+        y0 = br.bottom() - margin
+        painter.setPen(QtGui.QPen(QtCore.Qt.white, 2 * VERT_SCALE))
+        painter.drawLine(x0, y0, x0 + length_px, y0)
+        label = (
+            f"{nice_um/1000:.2f} mm" if nice_um >= 1000 else f"{nice_um:.0f} µm"
+        )
+        painter.setFont(self._scalebar_font)
+        painter.drawText(
+            x0, y0 - (7 * TEXT_SCALE) - self._scalebar_descent, label
+        )
+
+    def _update_scalebar_font(self):
+        """Derive the scale bar label font and its descent from the view font."""
+        font = QtGui.QFont(self.font())
+        ps = font.pointSizeF()
+        if ps > 0:
+            font.setPointSizeF(ps * TEXT_SCALE)
+        else:
+            font.setPixelSize(font.pixelSize() * TEXT_SCALE)
+        self._scalebar_font = font
+        self._scalebar_descent = QtGui.QFontMetrics(font).descent()
+        self._scale_cache = None
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() in _FONT_METRIC_EVENTS:
+            self._update_scalebar_font()
+
+    def set_image(self, qimg: QtGui.QImage, source_size=None):
+        """Show ``qimg`` in the view.
+
+        ``source_size`` is the ``(w, h)`` of the camera frame when ``qimg`` is
+        a downscaled preview; the pixmap item is scaled back up so scene
+        coordinates (ruler, calibration, scale bar) stay in sensor pixels.
+
+        Frames identical to the one already shown (camera idle or slower
+        than the preview timer) are skipped without rebuilding the pixmap.
+        """
+        key = self._frame_key(qimg, source_size)
+        if key == self._last_frame_key:
+            return
+        self._last_frame_key = key
+        self._pixmap.setPixmap(
+            QtGui.QPixmap.fromImage(qimg, QtCore.Qt.NoFormatConversion)
+        )
+        if source_size and qimg.width() > 0:
+            scale = source_size[0] / qimg.width()
+        else:
+            scale = 1.0
+        geometry = (qimg.size(), scale)
+        if geometry != self._last_geometry:
+            self._pixmap.setScale(scale)
+            self.setSceneRect(self._pixmap.sceneBoundingRect())
+            self.fitInView(self._pixmap, QtCore.Qt.KeepAspectRatio)
+            self._last_geometry = geometry
+        # drawForeground paints over the image, so the image rect covers it
+        self._update_image_rect()
+
+    @staticmethod
+    def _frame_key(qimg: QtGui.QImage, source_size):
+        """Fingerprint of ``qimg``: geometry plus a CRC of the whole buffer.
+
+        Any row may be the only one that changed (clipped or blank regions
+        repeat exactly), so every byte is hashed; that is still far cheaper
+        than building the pixmap.
+        """
+        if qimg.isNull():
+            return None
+        crc = zlib.crc32(qimg.constBits())
+        return (qimg.size(), qimg.format(), source_size, crc)
 
     def clear_image(self):
+        self._update_image_rect()
         self._pixmap.setPixmap(QtGui.QPixmap())
+        self._last_geometry = None
+        self._last_frame_key = None
         self._clear_temp()
-        self.viewport().update()
 
     def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
         super().resizeEvent(event)
+        self._scale_cache = None
+        self._fit_timer.start()
+        self.viewport_resized.emit(*self.preview_size())
+
+    def preview_size(self):
+        """Return the viewport size in device pixels as ``(w, h)``.
+
+        Frames larger than this are downscaled before display; anything
+        beyond it would only be thrown away again when the pixmap is drawn.
+        """
+        vp = self.viewport()
+        dpr = vp.devicePixelRatioF()
+        return int(vp.width() * dpr), int(vp.height() * dpr)
+
+    def _fit_to_view(self):
         self.fitInView(self._pixmap, QtCore.Qt.KeepAspectRatio)
         self.viewport().update()
 
@@ -184,10 +598,18 @@ class MeasureView(QtWidgets.QGraphicsView):
     def _add_square(self, coord):
         size = 6
         rect = QtCore.QRectF(coord[0] - size / 2, coord[1] - size / 2, size, size)
-        return self.scene().addRect(
-            rect, QtGui.QPen(QtCore.Qt.red), QtGui.QBrush(QtCore.Qt.red)
+        return self._overlay(
+            self.scene().addRect(
+                rect, QtGui.QPen(QtCore.Qt.red), QtGui.QBrush(QtCore.Qt.red)
+            )
         )
 
+    @staticmethod
+    def _overlay(item):
+        """Have ``item`` paint only its exposed rect."""
+        item.setFlag(QtWidgets.QGraphicsItem.ItemUsesExtendedStyleOption, True)
+        return item
+
     def _clear_temp(self):
         # ruler temp items
         if self._anchor_item:
@@ -196,9 +618,6 @@ class MeasureView(QtWidgets.QGraphicsView):
         if self._live_line:
             self.scene().removeItem(self._live_line)
             self._live_line = None
-        for t in self._live_ticks:
-            self.scene().removeItem(t)
-        self._live_ticks = []
         if self._live_text:
             self.scene().removeItem(self._live_text)
             self._live_text = None
@@ -216,8 +635,6 @@ class MeasureView(QtWidgets.QGraphicsView):
             self.scene().removeItem(ln["start"])
             self.scene().removeItem(ln["end"])
             self.scene().removeItem(ln["line"])
-            for t in ln["ticks"]:
-                self.scene().removeItem(t)
             self.scene().removeItem(ln["text"])
         self._lines = []
         self._clear_temp()
@@ -225,43 +642,26 @@ class MeasureView(QtWidgets.QGraphicsView):
     def _update_live_line(self, end):
         if not self._live_line:
             return
-        line = QtCore.QLineF(
-            QtCore.QPointF(*self._anchor), QtCore.QPointF(end[0], end[1])
-        )
-        self._live_line.setLine(line)
-
-        # remove old ticks
-        for t in self._live_ticks:
-            self.scene().removeItem(t)
-        self._live_ticks = []
+        self._live_line.set_end(end)
+        line = self._live_line.line()
 
         length = line.length()
 
         pixels = length
         microns = pixels * self._um_per_px
-        self._live_text.setPlainText(f"{pixels:.1f} px / {microns:.1f} µm")
+        # the label shows 0.1 resolution; skip formatting and re-shaping the
+        # text while the pointer moves within the same displayed value
+        key = (round(pixels * 10), round(microns * 10))
+        if key != self._last_label_key:
+            self._live_text.setText("%.1f px / %.1f µm" % (pixels, microns))
+            self._last_label_key = key
 
         if length > 0:
             unit_x = line.dx() / length
             unit_y = line.dy() / length
-            norm_x = -unit_y
-            norm_y = unit_x
-            spacing = 50
-            for d in range(spacing, int(length), spacing):
-                px = self._anchor[0] + unit_x * d
-                py = self._anchor[1] + unit_y * d
-                tick = self.scene().addLine(
-                    px + norm_x * 5,
-                    py + norm_y * 5,
-                    px - norm_x * 5,
-                    py - norm_y * 5,
-                    QtGui.QPen(QtCore.Qt.red, 1),
-                )
-                self._live_ticks.append(tick)
-
             midx = self._anchor[0] + unit_x * length / 2
             midy = self._anchor[1] + unit_y * length / 2
-            self._live_text.setPos(midx + norm_x * 10, midy + norm_y * 10)
+            self._live_text.setPos(midx - unit_y * 10, midy + unit_x * 10)
         else:
             self._live_text.setPos(*self._anchor)
 
@@ -269,9 +669,20 @@ class MeasureView(QtWidgets.QGraphicsView):
         if self._mode == "ruler" and self._anchor is not None:
             pos = event.position().toPoint() if hasattr(event, "position") else event.pos()
             pt = self.mapToScene(pos)
-            self._update_live_line((pt.x(), pt.y()))
+            # coalesce bursts of pointer events into one scene update per
+            # event-loop pass
+            self._pending_move = (pt.x(), pt.y())
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                QtCore.QTimer.singleShot(0, self._apply_move)
         return super().mouseMoveEvent(event)
 
+    def _apply_move(self):
+        self._move_scheduled = False
+        end, self._pending_move = self._pending_move, None
+        if end is not None and self._mode == "ruler" and self._anchor is not None:
+            self._update_live_line(end)
+
     def mousePressEvent(self, event: QtGui.QMouseEvent) -> None:
         if not self._mode:
             return super().mousePressEvent(event)
@@ -283,11 +694,13 @@ class MeasureView(QtWidgets.QGraphicsView):
                 if self._anchor is None:
                     self._anchor = coord
                     self._anchor_item = self._add_square(coord)
-                    self._live_line = self.scene().addLine(
-                        QtCore.QLineF(pt, pt), QtGui.QPen(QtCore.Qt.red, 2)
-                    )
-                    self._live_text = self.scene().addText("")
-                    self._live_text.setDefaultTextColor(QtCore.Qt.red)
+                    self._live_line = RulerItem(coord)
+                    self.scene().addItem(self._live_line)
+                    # plain single-line label: setText() skips the rich-text
+                    # document layout QGraphicsTextItem does on every update
+                    self._live_text = self._overlay(self.scene().addSimpleText(""))
+                    self._last_label_key = None
+                    self._live_text.setBrush(QtCore.Qt.red)
                     font = self._live_text.font()
                     font.setPointSizeF(font.pointSizeF() * 4)
                     self._live_text.setFont(font)
@@ -302,8 +715,6 @@ class MeasureView(QtWidgets.QGraphicsView):
                     self.scene().removeItem(last["start"])
                     self.scene().removeItem(last["end"])
                     self.scene().removeItem(last["line"])
-                    for t in last["ticks"]:
-                        self.scene().removeItem(t)
                     self.scene().removeItem(last["text"])
                 else:
                     # No lines to remove; ignore the click
@@ -314,10 +725,11 @@ class MeasureView(QtWidgets.QGraphicsView):
                 line = QtCore.QLineF(
                     QtCore.QPointF(*self._points[0]), QtCore.QPointF(*self._points[1])
                 )
-                self._item = self.scene().addLine(line, QtGui.QPen(QtCore.Qt.blue, 2))
-                p1 = np.asarray(self._points[0])
-                p2 = np.asarray(self._points[1])
-                pixels = float(np.linalg.norm(p1 - p2))
+                self._item = self._overlay(
+                    self.scene().addLine(line, QtGui.QPen(QtCore.Qt.blue, 2))
+                )
+                p1, p2 = self._points
+                pixels = math.hypot(p1[0] - p2[0], p1[1] - p2[1])
                 self.calibration_measured.emit(pixels)
                 self._mode = None
                 self._points = []
@@ -336,20 +748,17 @@ class MeasureView(QtWidgets.QGraphicsView):
             term_item = self._add_square(coord)
             line_item = self._live_line
             text_item = self._live_text
-            ticks = list(self._live_ticks)
             self._lines.append(
                 {
                     "start": self._anchor_item,
                     "end": term_item,
                     "line": line_item,
-                    "ticks": ticks,
                     "text": text_item,
                 }
             )
             self._anchor = None
             self._anchor_item = None
             self._live_line = None
-            self._live_ticks = []
             self._live_text = None
             self._mode = None
         super().mouseReleaseEvent(event)
@@ -362,6 +771,10 @@ class MeasureView(QtWidgets.QGraphicsView):
 
 
 class MainWindow(QtWidgets.QMainWindow):
+    # emitted from the leveling job; delivered queued on the UI thread
+    leveling_status_changed = QtCore.Signal(str)
+    level_prompt_changed = QtCore.Signal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("MicroStage App v0.1")
@@ -377,33 +790,30 @@ class MainWindow(QtWidgets.QMainWindow):
         # persistent serial worker
         self.stage_thread = None
         self.stage_worker = None
+        self._home_fns = {}  # axis -> stage.home_<axis>, bound on attach
 
         # async connect helper refs
-        self._conn_thread = None
         self._conn_worker = None
-
-        # background op refs (prevent GC while running)
-        self._last_thread = None
-        self._last_worker = None
+        self._port_scan_worker = None
+        self._stage_dialog = None  # (list, status label) while the dialog is open
+        self._last_ports = []  # result of the last stage port scan
 
         # raster state
         self._raster_runner = None
-        self._raster_thread = None
-        self._raster_worker = None
 
-        # autofocus state
+        # autofocus state; one AutoFocus is kept for the session so its
+        # scratch buffers carry over between runs (see _session_autofocus)
         self._autofocusing = False
-        self._af_thread = None
-        self._af_worker = None
+        self._autofocus = None
+        self._af_stop = None
 
-        # focus stack state
-        self._stack_thread = None
-        self._stack_worker = None
+        # focus stack state; jobs run on the shared thread pool and are
+        # cancelled through their stop events
+        self._stack_stop = None
         self._last_stack_dir = None
 
         # leveling state
-        self._level_thread = None
-        self._level_worker = None
+        self._level_stop = None
         self._leveling = False
         self._level_continue_event = threading.Event()
 
@@ -461,45 +871,49 @@ class MainWindow(QtWidgets.QMainWindow):
         self.btn_cam_disconnect = None
 
         # timers
-        self.preview_timer = QtCore.QTimer(self)
-        self.preview_timer.setInterval(33)          # ~30 FPS poll
-        self.preview_timer.timeout.connect(self._on_preview)
+        # Preview frames are fetched and converted by a PreviewWorker on its
+        # own thread (see _sync_preview_timer), gated to the display refresh
+        # rate; the GUI thread only draws the finished QImage.
+        self._preview_target_hz = _display_refresh_hz()
+        self._preview_min_ms = max(16, int(1000 / self._preview_target_hz))
+        self._preview_thread = None
+        self._preview_worker = None
+        self._has_cuda = None  # probed on first use, see _cuda_available
         self.fps_timer = QtCore.QTimer(self)
         self.fps_timer.setInterval(500)             # update FPS label
         self.fps_timer.timeout.connect(self._update_fps)
-
-        # jog hold / repeat
-        self._jog_hold_timer = QtCore.QTimer(self)
-        self._jog_hold_timer.setSingleShot(True)
-        self._jog_hold_timer.timeout.connect(self._start_jog_repeat)
-        self._jog_dir = None
+        # while auto-exposure is on, poll its result at 2 Hz rather than
+        # per preview frame; each read is a device round-trip
+        self._auto_refresh_timer = QtCore.QTimer(self)
+        self._auto_refresh_timer.setInterval(500)
+        self._auto_refresh_timer.timeout.connect(self._refresh_auto_exposure)
+
+        # profile writes are coalesced: handlers restart this timer and the
+        # file is written once edits pause
+        self._profile_save_timer = QtCore.QTimer(self)
+        self._profile_save_timer.setSingleShot(True)
+        self._profile_save_timer.setInterval(400)
+        self._profile_save_timer.timeout.connect(self._save_profiles)
+
+        # log lines are buffered and appended to the pane in batches
+        self._log_buf: list[str] = []
+        self._log_flush_timer = QtCore.QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(50)
+        self._log_flush_timer.timeout.connect(self._flush_log)
+
+        # jog hold / repeat (see _setup_jog_button)
+        self._jog_in_flight = False
 
         # UI
         self._build_ui()
 
         # load persisted values; extend _persistent_widgets() to add more fields
-        for w, path in self._persistent_widgets():
-            if isinstance(w, QtWidgets.QAbstractSpinBox):
-                val = self.profiles.get(path, w.value(), expected_type=(int, float),
-                                        min_value=w.minimum(), max_value=w.maximum())
-                w.setValue(val)
-            elif isinstance(w, QtWidgets.QCheckBox):
-                val = self.profiles.get(path, w.isChecked(), expected_type=bool)
-                w.setChecked(val)
-            elif isinstance(w, QtWidgets.QComboBox):
-                data = w.currentData()
-                default = data if data is not None else w.currentText()
-                val = self.profiles.get(path, default, expected_type=(int, float, str))
-                pos = w.findData(val)
-                if pos >= 0:
-                    w.setCurrentIndex(pos)
-                elif isinstance(val, str) and val in [w.itemText(i) for i in range(w.count())]:
-                    w.setCurrentText(val)
-                else:
-                    log(f"WARNING: profile '{path}' option {val!r} not valid; using default {default!r}")
-            elif isinstance(w, QtWidgets.QLineEdit):
-                val = self.profiles.get(path, w.text(), expected_type=str)
-                w.setText(val)
+        self._persistent_widget_cache = tuple(self._persistent_widgets())
+        for w, path in self._persistent_widget_cache:
+            loader = _profile_loader(type(w))
+            if loader is not None:
+                loader(w, path, self.profiles)
 
         # ensure sliders match spins after loading persisted values
         self.brightness_slider.setValue(self.brightness_spin.value())
@@ -518,8 +932,10 @@ class MainWindow(QtWidgets.QMainWindow):
         # ensure raster UI reflects current mode after loading profiles
         self._update_raster_mode()
 
-        # mirror logs to the in-app log pane
-        LOG.message.connect(self._append_log)
+        # mirror logs to the in-app log pane; queued so log() from stage,
+        # camera or raster threads only posts an event and never waits on
+        # the UI thread (lines are then batched by _append_log)
+        LOG.message.connect(self._append_log, QtCore.Qt.QueuedConnection)
 
         # show window first, then connect devices asynchronously
         QtCore.QTimer.singleShot(0, self._auto_connect_async)
@@ -527,6 +943,39 @@ class MainWindow(QtWidgets.QMainWindow):
     # --------------------------- UI BUILD ---------------------------
 
     def _build_ui(self):
+        # populate with painting suspended so the bulk insert settles in a
+        # single layout/paint pass instead of one per added widget
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_widgets()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        # commit typed values on Enter/focus-out only, so typing "12.5" emits
+        # one valueChanged instead of one per keystroke (each of which would
+        # otherwise reach the camera, stage or profile file)
+        for sb in self.findChildren(QtWidgets.QAbstractSpinBox):
+            sb.setKeyboardTracking(False)
+
+        # combos repopulated at runtime get a fixed width hint so a rebuild
+        # never re-measures every item; static ones are measured once on show
+        dynamic = (
+            self.profile_combo, self.lens_combo,
+            self.depth_combo, self.bin_combo, self.res_combo,
+        )
+        for cb in self.findChildren(QtWidgets.QComboBox):
+            if cb in dynamic:
+                cb.setSizeAdjustPolicy(
+                    QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon
+                )
+                cb.setMinimumContentsLength(20)
+            else:
+                cb.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContentsOnFirstShow)
+
+        self._reload_profiles()
+        self._update_raster_mode()
+
+    def _build_widgets(self):
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
 
@@ -640,12 +1089,18 @@ class MainWindow(QtWidgets.QMainWindow):
         self.af_range = QtWidgets.QDoubleSpinBox(); self.af_range.setRange(0.01, 5.0); self.af_range.setValue(0.5)
         self.af_coarse = QtWidgets.QDoubleSpinBox(); self.af_coarse.setDecimals(6); self.af_coarse.setRange(0.000001, 1.0); self.af_coarse.setSingleStep(0.000001); self.af_coarse.setValue(0.01)
         self.af_fine = QtWidgets.QDoubleSpinBox(); self.af_fine.setDecimals(6); self.af_fine.setRange(0.0005, 0.2); self.af_fine.setValue(0.002)
+        self.af_downsample = QtWidgets.QSpinBox(); self.af_downsample.setRange(1, 8); self.af_downsample.setPrefix("1/"); self.af_downsample.setValue(4)
+        self.af_downsample.setToolTip("Score focus on frames shrunk by this factor per side")
+        self.af_search = QtWidgets.QComboBox(); self.af_search.addItems([m.value for m in FocusSearch])
+        self.af_search.setToolTip("Golden section needs far fewer frames but assumes a single focus peak")
         self.btn_autofocus = QtWidgets.QPushButton("Run Autofocus")
         a.addWidget(QtWidgets.QLabel("Metric:"), 0, 0); a.addWidget(self.metric_combo, 0, 1)
         a.addWidget(QtWidgets.QLabel("Range (mm):"), 1, 0); a.addWidget(self.af_range, 1, 1)
         a.addWidget(QtWidgets.QLabel("Coarse step (mm):"), 2, 0); a.addWidget(self.af_coarse, 2, 1)
         a.addWidget(QtWidgets.QLabel("Fine step (mm):"), 3, 0); a.addWidget(self.af_fine, 3, 1)
-        a.addWidget(self.btn_autofocus, 4, 0, 1, 2)
+        a.addWidget(QtWidgets.QLabel("Metric scale:"), 4, 0); a.addWidget(self.af_downsample, 4, 1)
+        a.addWidget(QtWidgets.QLabel("Search:"), 5, 0); a.addWidget(self.af_search, 5, 1)
+        a.addWidget(self.btn_autofocus, 6, 0, 1, 2)
         stack_box = QtWidgets.QGroupBox("Focus Stack")
         s = QtWidgets.QGridLayout(stack_box)
         self.stack_range = QtWidgets.QDoubleSpinBox(); self.stack_range.setRange(0.01, 5.0); self.stack_range.setValue(0.5)
@@ -754,30 +1209,20 @@ class MainWindow(QtWidgets.QMainWindow):
         self.gain_spin.setToolTip("Analog gain (1.0–4.0x). Internally scaled ×100 for the SDK.")
         c.addWidget(QtWidgets.QLabel("Gain (AGain):"), row, 0); c.addWidget(self.gain_spin, row, 1); row += 1
 
-        self.brightness_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal); self.brightness_slider.setRange(-255, 255)
-        self.brightness_spin = QtWidgets.QSpinBox(); self.brightness_spin.setRange(-255, 255); self.brightness_spin.setValue(0)
-        self.brightness_slider.setValue(self.brightness_spin.value())
-        c.addWidget(QtWidgets.QLabel("Brightness:"), row, 0); c.addWidget(self.brightness_slider, row, 1); c.addWidget(self.brightness_spin, row, 2); row += 1
-
-        self.contrast_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal); self.contrast_slider.setRange(-255, 255)
-        self.contrast_spin = QtWidgets.QSpinBox(); self.contrast_spin.setRange(-255, 255); self.contrast_spin.setValue(0)
-        self.contrast_slider.setValue(self.contrast_spin.value())
-        c.addWidget(QtWidgets.QLabel("Contrast:"), row, 0); c.addWidget(self.contrast_slider, row, 1); c.addWidget(self.contrast_spin, row, 2); row += 1
-
-        self.saturation_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal); self.saturation_slider.setRange(0, 255)
-        self.saturation_spin = QtWidgets.QSpinBox(); self.saturation_spin.setRange(0, 255); self.saturation_spin.setValue(128)
-        self.saturation_slider.setValue(self.saturation_spin.value())
-        c.addWidget(QtWidgets.QLabel("Saturation:"), row, 0); c.addWidget(self.saturation_slider, row, 1); c.addWidget(self.saturation_spin, row, 2); row += 1
-
-        self.hue_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal); self.hue_slider.setRange(-180, 180)
-        self.hue_spin = QtWidgets.QSpinBox(); self.hue_spin.setRange(-180, 180); self.hue_spin.setValue(0)
-        self.hue_slider.setValue(self.hue_spin.value())
-        c.addWidget(QtWidgets.QLabel("Hue:"), row, 0); c.addWidget(self.hue_slider, row, 1); c.addWidget(self.hue_spin, row, 2); row += 1
-
-        self.gamma_slider = QtWidgets.QSlider(QtCore.Qt.Horizontal); self.gamma_slider.setRange(20, 180)
-        self.gamma_spin = QtWidgets.QSpinBox(); self.gamma_spin.setRange(20, 180); self.gamma_spin.setValue(100)
-        self.gamma_slider.setValue(self.gamma_spin.value())
-        c.addWidget(QtWidgets.QLabel("Gamma:"), row, 0); c.addWidget(self.gamma_slider, row, 1); c.addWidget(self.gamma_spin, row, 2); row += 1
+        # label, attribute prefix, range, default
+        sliders = (
+            ("Brightness", "brightness", -255, 255, 0),
+            ("Contrast", "contrast", -255, 255, 0),
+            ("Saturation", "saturation", 0, 255, 128),
+            ("Hue", "hue", -180, 180, 0),
+            ("Gamma", "gamma", 20, 180, 100),
+        )
+        for label, name, lo, hi, val in sliders:
+            slider = QtWidgets.QSlider(QtCore.Qt.Horizontal); slider.setRange(lo, hi); slider.setValue(val)
+            spin = QtWidgets.QSpinBox(); spin.setRange(lo, hi); spin.setValue(val)
+            setattr(self, f"{name}_slider", slider)
+            setattr(self, f"{name}_spin", spin)
+            c.addWidget(QtWidgets.QLabel(f"{label}:"), row, 0); c.addWidget(slider, row, 1); c.addWidget(spin, row, 2); row += 1
 
         self.depth_combo = QtWidgets.QComboBox()
         c.addWidget(QtWidgets.QLabel("Color depth:"), row, 0); c.addWidget(self.depth_combo, row, 1, 1, 2); row += 1
@@ -814,16 +1259,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.level_rows = QtWidgets.QSpinBox(); self.level_rows.setRange(2, 10); self.level_rows.setValue(3)
         self.level_cols = QtWidgets.QSpinBox(); self.level_cols.setRange(2, 10); self.level_cols.setValue(3)
         self.level_mode = QtWidgets.QComboBox(); self.level_mode.addItems(["Auto", "Manual"])
-        # Coordinate fields for leveling points
-        self.level_x1_spin = QtWidgets.QDoubleSpinBox(); self.level_x1_spin.setDecimals(6); self.level_x1_spin.setRange(-1000.0, 1000.0); self.level_x1_spin.setValue(0.0)
-        self.level_y1_spin = QtWidgets.QDoubleSpinBox(); self.level_y1_spin.setDecimals(6); self.level_y1_spin.setRange(-1000.0, 1000.0); self.level_y1_spin.setValue(0.0)
-        self.btn_level_p1 = QtWidgets.QPushButton("Use pos")
-        self.level_x2_spin = QtWidgets.QDoubleSpinBox(); self.level_x2_spin.setDecimals(6); self.level_x2_spin.setRange(-1000.0, 1000.0); self.level_x2_spin.setValue(0.0)
-        self.level_y2_spin = QtWidgets.QDoubleSpinBox(); self.level_y2_spin.setDecimals(6); self.level_y2_spin.setRange(-1000.0, 1000.0); self.level_y2_spin.setValue(0.0)
-        self.btn_level_p2 = QtWidgets.QPushButton("Use pos")
-        self.level_x3_spin = QtWidgets.QDoubleSpinBox(); self.level_x3_spin.setDecimals(6); self.level_x3_spin.setRange(-1000.0, 1000.0); self.level_x3_spin.setValue(0.0)
-        self.level_y3_spin = QtWidgets.QDoubleSpinBox(); self.level_y3_spin.setDecimals(6); self.level_y3_spin.setRange(-1000.0, 1000.0); self.level_y3_spin.setValue(0.0)
-        self.btn_level_p3 = QtWidgets.QPushButton("Use pos")
+        self.level_af_reduce = QtWidgets.QSpinBox(); self.level_af_reduce.setRange(0, 80); self.level_af_reduce.setSuffix(" %"); self.level_af_reduce.setValue(50)
+        self.level_af_reduce.setToolTip("Shrink the autofocus range after the first point, centred on the previous point's focus")
         self.btn_start_level = QtWidgets.QPushButton("Start Leveling")
         self.btn_apply_level = QtWidgets.QPushButton("Apply Leveling")
         self.btn_disable_level = QtWidgets.QPushButton("Disable Leveling")
@@ -834,21 +1271,27 @@ class MainWindow(QtWidgets.QMainWindow):
         l.addWidget(QtWidgets.QLabel("Rows:"), row, 0); l.addWidget(self.level_rows, row, 1); row += 1
         l.addWidget(QtWidgets.QLabel("Cols:"), row, 0); l.addWidget(self.level_cols, row, 1); row += 1
         l.addWidget(QtWidgets.QLabel("Mode:"), row, 0); l.addWidget(self.level_mode, row, 1); row += 1
-        l.addWidget(QtWidgets.QLabel("P1 X:"), row, 0); l.addWidget(self.level_x1_spin, row, 1); l.addWidget(QtWidgets.QLabel("Y:"), row, 2); l.addWidget(self.level_y1_spin, row, 3); l.addWidget(self.btn_level_p1, row, 4); row += 1
-        l.addWidget(QtWidgets.QLabel("P2 X:"), row, 0); l.addWidget(self.level_x2_spin, row, 1); l.addWidget(QtWidgets.QLabel("Y:"), row, 2); l.addWidget(self.level_y2_spin, row, 3); l.addWidget(self.btn_level_p2, row, 4); row += 1
-        l.addWidget(QtWidgets.QLabel("P3 X:"), row, 0); l.addWidget(self.level_x3_spin, row, 1); l.addWidget(QtWidgets.QLabel("Y:"), row, 2); l.addWidget(self.level_y3_spin, row, 3); l.addWidget(self.btn_level_p3, row, 4); row += 1
-        l.addWidget(self.btn_start_level, row, 0, 1, 5); row += 1
-        l.addWidget(self.btn_apply_level, row, 0, 1, 5); row += 1
-        l.addWidget(self.btn_disable_level, row, 0, 1, 5); row += 1
-        l.addWidget(self.level_status, row, 0, 1, 5); row += 1
+        l.addWidget(QtWidgets.QLabel("AF range reduction:"), row, 0); l.addWidget(self.level_af_reduce, row, 1); row += 1
+        # coordinate fields for leveling points
+        for i in (1, 2, 3):
+            xs, ys = _coord_spin(), _coord_spin()
+            btn = QtWidgets.QPushButton("Use pos")
+            setattr(self, f"level_x{i}_spin", xs)
+            setattr(self, f"level_y{i}_spin", ys)
+            setattr(self, f"btn_level_p{i}", btn)
+            l.addWidget(QtWidgets.QLabel(f"P{i} X/Y:"), row, 0); l.addWidget(xs, row, 1); l.addWidget(ys, row, 2); l.addWidget(btn, row, 3); row += 1
+        l.addWidget(self.btn_start_level, row, 0, 1, 4); row += 1
+        l.addWidget(self.btn_apply_level, row, 0, 1, 4); row += 1
+        l.addWidget(self.btn_disable_level, row, 0, 1, 4); row += 1
+        l.addWidget(self.level_status, row, 0, 1, 4); row += 1
         self.level_equation = QtWidgets.QLabel("")
-        l.addWidget(self.level_equation, row, 0, 1, 5); row += 1
+        l.addWidget(self.level_equation, row, 0, 1, 4); row += 1
         self.level_prompt = QtWidgets.QLabel("")
         self.level_prompt.setVisible(False)
         self.btn_level_continue = QtWidgets.QPushButton("Next")
         self.btn_level_continue.setVisible(False)
-        l.addWidget(self.level_prompt, row, 0, 1, 5); row += 1
-        l.addWidget(self.btn_level_continue, row, 0, 1, 5); row += 1
+        l.addWidget(self.level_prompt, row, 0, 1, 4); row += 1
+        l.addWidget(self.btn_level_continue, row, 0, 1, 4); row += 1
         a.addWidget(lvl_box)
 
         # Raster controls
@@ -857,22 +1300,6 @@ class MainWindow(QtWidgets.QMainWindow):
         self.rows_spin = QtWidgets.QSpinBox(); self.rows_spin.setRange(1, 1000); self.rows_spin.setValue(5)
         self.cols_spin = QtWidgets.QSpinBox(); self.cols_spin.setRange(1, 1000); self.cols_spin.setValue(5)
 
-        # Raster point spin boxes
-        self.rast_x1_spin = QtWidgets.QDoubleSpinBox(); self.rast_x1_spin.setDecimals(6); self.rast_x1_spin.setRange(-1000.0, 1000.0); self.rast_x1_spin.setValue(0.0)
-        self.rast_y1_spin = QtWidgets.QDoubleSpinBox(); self.rast_y1_spin.setDecimals(6); self.rast_y1_spin.setRange(-1000.0, 1000.0); self.rast_y1_spin.setValue(0.0)
-        self.rast_x2_spin = QtWidgets.QDoubleSpinBox(); self.rast_x2_spin.setDecimals(6); self.rast_x2_spin.setRange(-1000.0, 1000.0); self.rast_x2_spin.setValue(4.0)
-        self.rast_y2_spin = QtWidgets.QDoubleSpinBox(); self.rast_y2_spin.setDecimals(6); self.rast_y2_spin.setRange(-1000.0, 1000.0); self.rast_y2_spin.setValue(4.0)
-        self.rast_x3_spin = QtWidgets.QDoubleSpinBox(); self.rast_x3_spin.setDecimals(6); self.rast_x3_spin.setRange(-1000.0, 1000.0); self.rast_x3_spin.setValue(0.0)
-        self.rast_y3_spin = QtWidgets.QDoubleSpinBox(); self.rast_y3_spin.setDecimals(6); self.rast_y3_spin.setRange(-1000.0, 1000.0); self.rast_y3_spin.setValue(0.0)
-        self.rast_x4_spin = QtWidgets.QDoubleSpinBox(); self.rast_x4_spin.setDecimals(6); self.rast_x4_spin.setRange(-1000.0, 1000.0); self.rast_x4_spin.setValue(0.0)
-        self.rast_y4_spin = QtWidgets.QDoubleSpinBox(); self.rast_y4_spin.setDecimals(6); self.rast_y4_spin.setRange(-1000.0, 1000.0); self.rast_y4_spin.setValue(0.0)
-
-        # Raster point buttons
-        self.btn_raster_p1 = QtWidgets.QPushButton("Raster Point 1")
-        self.btn_raster_p2 = QtWidgets.QPushButton("Raster Point 2")
-        self.btn_raster_p3 = QtWidgets.QPushButton("Raster Point 3")
-        self.btn_raster_p4 = QtWidgets.QPushButton("Raster Point 4")
-
         # Raster mode selection
         self.raster_mode_combo = QtWidgets.QComboBox()
         self.raster_mode_combo.addItems(["2-point", "3-point", "4-point"])
@@ -895,29 +1322,17 @@ class MainWindow(QtWidgets.QMainWindow):
         r.addWidget(QtWidgets.QLabel("Cols:"), 0, 4)
         r.addWidget(self.cols_spin, 0, 5)
 
-        r.addWidget(QtWidgets.QLabel("P1 X:"), 1, 0)
-        r.addWidget(self.rast_x1_spin, 1, 1)
-        r.addWidget(QtWidgets.QLabel("Y:"), 1, 2)
-        r.addWidget(self.rast_y1_spin, 1, 3)
-        r.addWidget(self.btn_raster_p1, 1, 4, 1, 2)
-
-        r.addWidget(QtWidgets.QLabel("P2 X:"), 2, 0)
-        r.addWidget(self.rast_x2_spin, 2, 1)
-        r.addWidget(QtWidgets.QLabel("Y:"), 2, 2)
-        r.addWidget(self.rast_y2_spin, 2, 3)
-        r.addWidget(self.btn_raster_p2, 2, 4, 1, 2)
-
-        r.addWidget(QtWidgets.QLabel("P3 X:"), 3, 0)
-        r.addWidget(self.rast_x3_spin, 3, 1)
-        r.addWidget(QtWidgets.QLabel("Y:"), 3, 2)
-        r.addWidget(self.rast_y3_spin, 3, 3)
-        r.addWidget(self.btn_raster_p3, 3, 4, 1, 2)
-
-        r.addWidget(QtWidgets.QLabel("P4 X:"), 4, 0)
-        r.addWidget(self.rast_x4_spin, 4, 1)
-        r.addWidget(QtWidgets.QLabel("Y:"), 4, 2)
-        r.addWidget(self.rast_y4_spin, 4, 3)
-        r.addWidget(self.btn_raster_p4, 4, 4, 1, 2)
+        # raster corner points (P2 defaults to 4, 4)
+        for i, default in ((1, 0.0), (2, 4.0), (3, 0.0), (4, 0.0)):
+            xs, ys = _coord_spin(default), _coord_spin(default)
+            btn = QtWidgets.QPushButton(f"Raster Point {i}")
+            setattr(self, f"rast_x{i}_spin", xs)
+            setattr(self, f"rast_y{i}_spin", ys)
+            setattr(self, f"btn_raster_p{i}", btn)
+            r.addWidget(QtWidgets.QLabel(f"P{i} X/Y:"), i, 0)
+            r.addWidget(xs, i, 1)
+            r.addWidget(ys, i, 2, 1, 2)
+            r.addWidget(btn, i, 4, 1, 2)
 
         r.addWidget(self.chk_raster_capture, 5, 0, 1, 2)
         r.addWidget(self.chk_raster_af, 5, 2, 1, 2)
@@ -939,15 +1354,24 @@ class MainWindow(QtWidgets.QMainWindow):
         s.addStretch(1)
         rightw.addTab(scripts, "Scripts")
 
-        # ---- System monitor tab
-        self.system_tab = SystemMonitorTab()
-        rightw.addTab(self.system_tab, "System")
-        self.system_tab.start()
+        # ---- System monitor tab (built on first visit, see _on_right_tab_changed)
+        self.system_tab = None
+        self._system_page = QtWidgets.QWidget()
+        QtWidgets.QVBoxLayout(self._system_page).setContentsMargins(0, 0, 0, 0)
+        rightw.addTab(self._system_page, "System")
+        rightw.currentChanged.connect(self._on_right_tab_changed)
+        self.right_tabs = rightw
 
         # log pane
         self.log_view = QtWidgets.QPlainTextEdit()
         self.log_view.setReadOnly(True)
         self.log_view.setMaximumBlockCount(8000)
+        # fixed-pitch, unwrapped and without undo history: the cheapest
+        # layout path for a pane that only ever grows by appended lines
+        self.log_view.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+        self.log_view.setWordWrapMode(QtGui.QTextOption.NoWrap)
+        self.log_view.setUndoRedoEnabled(False)
+        self.log_view.setCenterOnScroll(False)
 
         left_right = QtWidgets.QSplitter(QtCore.Qt.Horizontal)
         left_right.addWidget(leftw)
@@ -966,30 +1390,44 @@ class MainWindow(QtWidgets.QMainWindow):
         root = QtWidgets.QVBoxLayout(central)
         root.addWidget(vsplit)
 
-        self._reload_profiles()
-        self._update_raster_mode()
+        # restore the last splitter layout so the first show needs no
+        # size-from-contents pass; moves are written back via the save timer
+        for sp, key in ((left_right, 'ui.splitter_h'), (vsplit, 'ui.splitter_v')):
+            state = self.profiles.get(key, '', expected_type=str)
+            if state:
+                sp.restoreState(QtCore.QByteArray.fromBase64(state.encode('ascii')))
+            sp.splitterMoved.connect(functools.partial(self._on_splitter_moved, sp, key))
 
     def _refresh_lens_combo(self):
-        self.lens_combo.blockSignals(True)
-        self.lens_combo.clear()
-
-        # First add lenses in the preferred order if they exist
+        # First the lenses in the preferred order if they exist, then any
+        # remaining lenses alphabetically
         preset = [
             self.lenses[name] for name in PRESET_LENS_ORDER if name in self.lenses
         ]
-        # Then append any remaining lenses alphabetically
         remaining = sorted(
             [lens for name, lens in self.lenses.items() if name not in PRESET_LENS_ORDER],
             key=lambda l: l.name,
         )
-        for lens in preset + remaining:
-            self.lens_combo.addItem(
-                f"{lens.name} ({lens.um_per_px:.3f} µm/px)", lens.name
-            )
-        idx = self.lens_combo.findData(self.current_lens.name)
-        if idx >= 0:
-            self.lens_combo.setCurrentIndex(idx)
-        self.lens_combo.blockSignals(False)
+        ordered = preset + remaining
+        # item text shows the calibration, so it is part of the key
+        key = tuple((lens.name, lens.um_per_px) for lens in ordered)
+
+        combo = self.lens_combo
+        combo.blockSignals(True)
+        try:
+            if key != getattr(self, "_lens_combo_key", None):
+                combo.setUpdatesEnabled(False)
+                combo.clear()
+                for lens in ordered:
+                    combo.addItem(f"{lens.name} ({lens.um_per_px:.3f} µm/px)", lens.name)
+                combo.setUpdatesEnabled(True)
+                self._lens_combo_key = key
+                self._lens_combo_index = {lens.name: i for i, lens in enumerate(ordered)}
+            idx = self._lens_combo_index.get(self.current_lens.name, -1)
+            if idx >= 0:
+                combo.setCurrentIndex(idx)
+        finally:
+            combo.blockSignals(False)
 
     def _update_leveling_method(self):
         grid = self.level_method.currentText() == "Grid"
@@ -997,15 +1435,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.level_cols.setEnabled(grid)
 
     def _update_raster_mode(self):
-        mode = self.raster_mode_combo.currentText()
-        p3 = mode in ("3-point", "4-point")
-        p4 = mode == "4-point"
+        # items are "2-point", "3-point", "4-point"
+        points = self.raster_mode_combo.currentIndex() + 2
+        p3 = points >= 3
+        p4 = points == 4
         for w in (self.rast_x3_spin, self.rast_y3_spin, self.btn_raster_p3):
             w.setEnabled(p3)
         for w in (self.rast_x4_spin, self.rast_y4_spin, self.btn_raster_p4):
             w.setEnabled(p4)
 
     def _connect_signals(self):
+        self.leveling_status_changed.connect(
+            self._set_leveling_status, QtCore.Qt.QueuedConnection
+        )
+        self.level_prompt_changed.connect(
+            self._set_level_prompt, QtCore.Qt.QueuedConnection
+        )
         self.btn_capture.clicked.connect(self._capture)
         self.chk_reticle.toggled.connect(self.measure_view.set_reticle)
         self.chk_scale_bar.toggled.connect(self._on_scale_bar_toggled)
@@ -1014,9 +1459,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.lens_combo.currentIndexChanged[int].connect(self._on_lens_changed)
         self.btn_clear_screen.clicked.connect(self.measure_view.clear_overlays)
         self.btn_home_all.clicked.connect(self._home_all)
-        self.btn_home_x.clicked.connect(lambda: self._home_axis('x'))
-        self.btn_home_y.clicked.connect(lambda: self._home_axis('y'))
-        self.btn_home_z.clicked.connect(lambda: self._home_axis('z'))
+        self.btn_home_x.clicked.connect(functools.partial(self._home_axis, 'x'))
+        self.btn_home_y.clicked.connect(functools.partial(self._home_axis, 'y'))
+        self.btn_home_z.clicked.connect(functools.partial(self._home_axis, 'z'))
         self._setup_jog_button(self.btn_xm, self.stepx_spin, self.feedx_spin, sx=-1)
         self._setup_jog_button(self.btn_xp, self.stepx_spin, self.feedx_spin, sx=1)
         self._setup_jog_button(self.btn_ym, self.stepy_spin, self.feedy_spin, sy=-1)
@@ -1025,9 +1470,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self._setup_jog_button(self.btn_zp, self.stepz_spin, self.feedz_spin, sz=1)
         self.btn_move_to_coords.clicked.connect(self._move_to_coords)
         self.btn_autofocus.clicked.connect(self._run_autofocus)
-        self.btn_level_p1.clicked.connect(lambda: self._set_level_point(1))
-        self.btn_level_p2.clicked.connect(lambda: self._set_level_point(2))
-        self.btn_level_p3.clicked.connect(lambda: self._set_level_point(3))
+        for i in (1, 2, 3):
+            btn = getattr(self, f"btn_level_p{i}")
+            btn.setProperty("point", i)
+            btn.clicked.connect(self._on_level_point_clicked)
         self.btn_start_level.clicked.connect(self._run_leveling)
         self.btn_apply_level.clicked.connect(self._apply_leveling)
         self.btn_disable_level.clicked.connect(self._disable_leveling)
@@ -1035,10 +1481,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.level_method.currentTextChanged.connect(self._update_leveling_method)
         self.raster_mode_combo.currentTextChanged.connect(self._update_raster_mode)
         self.btn_focus_stack.clicked.connect(self._run_focus_stack)
-        self.btn_raster_p1.clicked.connect(lambda: self._set_raster_point(1))
-        self.btn_raster_p2.clicked.connect(lambda: self._set_raster_point(2))
-        self.btn_raster_p3.clicked.connect(lambda: self._set_raster_point(3))
-        self.btn_raster_p4.clicked.connect(lambda: self._set_raster_point(4))
+        for i in (1, 2, 3, 4):
+            btn = getattr(self, f"btn_raster_p{i}")
+            btn.setProperty("point", i)
+            btn.clicked.connect(self._on_raster_point_clicked)
         self.btn_run_raster.clicked.connect(self._run_raster)
         self.btn_stop.clicked.connect(self._stop_all)
         self.btn_reload_profiles.clicked.connect(self._reload_profiles)
@@ -1053,32 +1499,24 @@ class MainWindow(QtWidgets.QMainWindow):
         self.measure_view.calibration_measured.connect(self._on_calibration_done)
 
         # camera controls
-        self.exp_spin.valueChanged.connect(self._apply_exposure)
+        # spin/slider scrubbing is throttled so SDK writes stay bounded
+        self.exp_spin.valueChanged.connect(self._throttled(self._apply_exposure))
         self.autoexp_chk.toggled.connect(self._apply_exposure)
-        self.gain_spin.valueChanged.connect(lambda v: self._apply_gain(v * 100))
-        self.brightness_slider.valueChanged.connect(self.brightness_spin.setValue)
-        self.brightness_spin.valueChanged.connect(self.brightness_slider.setValue)
-        self.brightness_spin.valueChanged.connect(self._apply_brightness)
-        self.contrast_slider.valueChanged.connect(self.contrast_spin.setValue)
-        self.contrast_spin.valueChanged.connect(self.contrast_slider.setValue)
-        self.contrast_spin.valueChanged.connect(self._apply_contrast)
-        self.saturation_slider.valueChanged.connect(self.saturation_spin.setValue)
-        self.saturation_spin.valueChanged.connect(self.saturation_slider.setValue)
-        self.saturation_spin.valueChanged.connect(self._apply_saturation)
-        self.hue_slider.valueChanged.connect(self.hue_spin.setValue)
-        self.hue_spin.valueChanged.connect(self.hue_slider.setValue)
-        self.hue_spin.valueChanged.connect(self._apply_hue)
-        self.gamma_slider.valueChanged.connect(self.gamma_spin.setValue)
-        self.gamma_spin.valueChanged.connect(self.gamma_slider.setValue)
-        self.gamma_spin.valueChanged.connect(self._apply_gamma)
+        self.gain_spin.valueChanged.connect(self._throttled(self._apply_gain))
+        for name in _IMAGE_CONTROLS:
+            slider = getattr(self, f"{name}_slider")
+            spin = getattr(self, f"{name}_spin")
+            apply = self._throttled(functools.partial(self._apply_image_control, name))
+            slider.valueChanged.connect(_mirror(spin, apply))
+            spin.valueChanged.connect(_mirror(slider, apply))
         self.depth_combo.currentIndexChanged.connect(self._apply_color_depth)
         self.raw_chk.toggled.connect(self._apply_raw)
         self.bin_combo.currentIndexChanged.connect(self._apply_binning)
         self.res_combo.currentIndexChanged.connect(self._apply_resolution)
-        self.btn_roi_full.clicked.connect(lambda: self._apply_roi('full'))
-        self.btn_roi_2048.clicked.connect(lambda: self._apply_roi(2048))
-        self.btn_roi_1024.clicked.connect(lambda: self._apply_roi(1024))
-        self.btn_roi_512.clicked.connect(lambda: self._apply_roi(512))
+        for btn, roi in ((self.btn_roi_full, 'full'), (self.btn_roi_2048, 2048),
+                         (self.btn_roi_1024, 1024), (self.btn_roi_512, 512)):
+            btn.setProperty("roi", roi)
+            btn.clicked.connect(self._on_roi_clicked)
         self.speed_spin.valueChanged.connect(self._apply_speed)
 
         # scripts
@@ -1087,36 +1525,56 @@ class MainWindow(QtWidgets.QMainWindow):
     def _init_persistent_fields(self):
         def bind(spin, key):
             spin.setValue(self.profiles.get(key, spin.value()))
-            spin.valueChanged.connect(lambda v, k=key: (self.profiles.set(k, float(v)), self.profiles.save()))
+            spin.valueChanged.connect(functools.partial(self._on_persistent_spin_changed, key))
         for axis in ('x', 'y', 'z'):
             bind(getattr(self, f'step{axis}_spin'), f'jog.step.{axis}')
             bind(getattr(self, f'feed{axis}_spin'), f'jog.feed.{axis}')
             bind(getattr(self, f'abs{axis}_spin'), f'jog.abs.{axis}')
 
+    # point/ROI buttons share one slot each; the button carries its argument
+    # as a dynamic property
+    def _on_roi_clicked(self):
+        self._apply_roi(self.sender().property("roi"))
+
+    def _on_level_point_clicked(self):
+        self._set_level_point(self.sender().property("point"))
+
+    def _on_raster_point_clicked(self):
+        self._set_raster_point(self.sender().property("point"))
+
+    def _on_splitter_moved(self, splitter, key: str, *_):
+        state = splitter.saveState().toBase64().data().decode('ascii')
+        self.profiles.set(key, state)
+        self._schedule_profile_save()
+
+    def _on_persistent_spin_changed(self, key: str, value: float):
+        self.profiles.set(key, float(value))
+        self._schedule_profile_save()
+
     def _on_capture_dir_changed(self, text: str):
         self.capture_dir = text
         self.profiles.set('capture.dir', text)
-        self.profiles.save()
+        self._schedule_profile_save()
 
     def _on_capture_name_changed(self, text: str):
         self.capture_name = text
         self.profiles.set('capture.name', text)
-        self.profiles.save()
+        self._schedule_profile_save()
 
     def _on_autonumber_toggled(self, checked: bool):
         self.auto_number = checked
         self.profiles.set('capture.auto_number', checked)
-        self.profiles.save()
+        self._schedule_profile_save()
 
     def _on_format_changed(self, text: str):
         self.capture_format = text.lower()
         self.profiles.set('capture.format', self.capture_format)
-        self.profiles.save()
+        self._schedule_profile_save()
 
     def _on_scale_bar_toggled(self, checked: bool):
         self.measure_view.set_scale_bar(checked, self.current_lens.um_per_px)
         self.profiles.set('ui.scale_bar', checked)
-        self.profiles.save()
+        self._schedule_profile_save()
 
     def _on_lens_changed(self, index: int):
         name = self.lens_combo.itemData(index)
@@ -1129,7 +1587,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.current_lens = lens
         self.profiles.set('measurement.current_lens', name)
         self.profiles.set(f'measurement.lenses.{name}.um_per_px', lens.um_per_px)
-        self.profiles.save()
+        self._schedule_profile_save()
         self._update_lens_for_resolution()
 
     def _add_lens(self):
@@ -1156,35 +1614,37 @@ class MainWindow(QtWidgets.QMainWindow):
         d = QtWidgets.QFileDialog.getExistingDirectory(
             self, "Select Capture Directory", self.capture_dir
         )
-        if d:
+        # textChanged drives _on_capture_dir_changed, so re-picking the
+        # current folder must not touch the field
+        if d and d != self.capture_dir_edit.text():
             self.capture_dir_edit.setText(d)
 
     def _setup_jog_button(self, btn, step_spin, feed_spin, sx=0, sy=0, sz=0):
-        def _pressed():
-            step = step_spin.value()
-            feed = feed_spin.value()
-            self._jog(step * sx, step * sy, step * sz, feed, wait_ok=True)
-            self._jog_dir = (sx, sy, sz, step_spin, feed_spin)
-            self._jog_hold_timer.start(1000)
-
-        def _released():
-            self._jog_hold_timer.stop()
-            self._jog_dir = None
-
-        btn.pressed.connect(_pressed)
-        btn.released.connect(_released)
-
-    def _start_jog_repeat(self):
-        if self._jog_dir:
-            self._repeat_jog()
-
-    def _repeat_jog(self, _res=None):
-        if not self._jog_dir:
+        # the first step goes out on press; holding the button repeats it
+        # every 150 ms after a 1 s delay.  Qt re-emits pressed on every repeat
+        # tick, so pressed drives both; clicked also fires on release and
+        # would add a step nobody asked for, so it is left unconnected
+        btn.setAutoRepeat(True)
+        btn.setAutoRepeatDelay(1000)
+        btn.setAutoRepeatInterval(150)
+        btn.pressed.connect(
+            functools.partial(self._jog_step, step_spin, feed_spin, sx, sy, sz)
+        )
+
+    def _jog_step(self, step_spin, feed_spin, sx, sy, sz):
+        # presses are dropped while the previous step is still queued on the
+        # stage, so moves never pile up behind a held button
+        if self._jog_in_flight:
             return
-        sx, sy, sz, step_spin, feed_spin = self._jog_dir
         step = step_spin.value()
         feed = feed_spin.value()
-        self._jog(step * sx, step * sy, step * sz, feed, wait_ok=True, callback=self._repeat_jog)
+        if self.stage_worker:
+            self._jog_in_flight = True
+        self._jog(step * sx, step * sy, step * sz, feed,
+                  callback=self._on_jog_step_done)
+
+    def _on_jog_step_done(self, _res=None):
+        self._jog_in_flight = False
 
     def _move_to_coords(self):
         if not self.stage_worker:
@@ -1198,9 +1658,13 @@ class MainWindow(QtWidgets.QMainWindow):
             z += self.focus_mgr.z_offset(x, y, z)
         feed = max(self.feedx_spin.value(), self.feedy_spin.value(), self.feedz_spin.value())
         log(f"Move to: x={x} y={y} z={z} F={feed}")
-        self.stage_worker.enqueue(self.stage.move_absolute, x, y, z, feed, True)
+        self.stage_worker.enqueue(self.stage.move_absolute, x, y, z, feed)
         self.stage_worker.enqueue(self.stage.wait_for_moves)
-        self.stage_worker.enqueue(self.stage.get_position, callback=self._on_stage_position)
+        self.stage_worker.enqueue(
+            self.stage.get_position,
+            callback=self._on_stage_position,
+            dedup_key="position",
+        )
 
     def _set_movement_controls_enabled(self, enabled: bool):
         controls = [
@@ -1219,9 +1683,35 @@ class MainWindow(QtWidgets.QMainWindow):
         for btn in controls:
             btn.setEnabled(enabled)
 
+    def _on_right_tab_changed(self, index: int):
+        # built on first visit; it starts and stops polling itself as its
+        # tab is shown and hidden
+        if self.right_tabs.widget(index) is not self._system_page:
+            return
+        if self.system_tab is None:
+            self.system_tab = SystemMonitorTab()
+            self._system_page.layout().addWidget(self.system_tab)
+            self.system_tab.show()
+
     @QtCore.Slot(str)
     def _append_log(self, line: str):
-        self.log_view.appendPlainText(line)
+        self._log_buf.append(line)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log(self):
+        """Append buffered log lines to the pane in one block."""
+        if not self._log_buf:
+            return
+        lines, self._log_buf = self._log_buf, []
+        bulk = len(lines) > _LOG_BULK_LINES
+        if bulk:
+            self.log_view.setUpdatesEnabled(False)
+        try:
+            self.log_view.appendPlainText("\n".join(lines))
+        finally:
+            if bulk:
+                self.log_view.setUpdatesEnabled(True)
 
     # --------------------------- CONNECT ---------------------------
 
@@ -1235,13 +1725,33 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stage_thread = QtCore.QThread(self)
         self.stage_worker = SerialWorker(self.stage)
         self.stage_worker.moveToThread(self.stage_thread)
-        self.stage_worker.result.connect(self._dispatch_stage_result)
+        self._home_fns = {
+            'x': self.stage.home_x,
+            'y': self.stage.home_y,
+            'z': self.stage.home_z,
+        }
+        # queued: results arrive on the UI thread as ordinary posted events,
+        # so callbacks may touch widgets and the worker never waits on them
+        self.stage_worker.result.connect(
+            self._dispatch_stage_result, QtCore.Qt.QueuedConnection
+        )
+        self.stage_worker.errored.connect(
+            self._on_stage_error, QtCore.Qt.QueuedConnection
+        )
         self.stage_thread.started.connect(self.stage_worker.loop)
         self.stage_thread.start()
 
+    @QtCore.Slot(object, object)
     def _dispatch_stage_result(self, cb, res):
         if cb:
-            QtCore.QTimer.singleShot(0, lambda r=res: cb(r))
+            cb(res)
+
+    @QtCore.Slot(str)
+    def _on_stage_error(self, msg):
+        log(f"Stage: command failed: {msg}")
+        # a failed command never runs its callback, so a jog step that
+        # raised would otherwise block a held button until release
+        self._jog_in_flight = False
 
     def _show_camera_dialog(self):
         dlg = QtWidgets.QDialog(self)
@@ -1273,19 +1783,63 @@ class MainWindow(QtWidgets.QMainWindow):
         lay = QtWidgets.QVBoxLayout(dlg)
         lst = QtWidgets.QListWidget()
         lay.addWidget(lst)
-        ports = list(list_marlin_ports())
+        status = QtWidgets.QLabel("Scanning for stages…")
+        lay.addWidget(status)
         if self.stage and getattr(self.stage, "port", None):
-            cur = self.stage.port
-            if cur not in ports:
-                ports.insert(0, cur)
-        for port in ports:
-            item = QtWidgets.QListWidgetItem(port)
-            item.setData(QtCore.Qt.UserRole, port)
-            if self.stage and getattr(self.stage, "port", None) == port:
-                item.setCheckState(QtCore.Qt.Checked)
-            lst.addItem(item)
+            self._add_stage_port_item(lst, self.stage.port)
+        # show the previous scan straight away; the new one only patches in
+        # the ports that appeared or went away
+        listed = {lst.item(i).data(QtCore.Qt.UserRole) for i in range(lst.count())}
+        for port in getattr(self, "_last_ports", ()):
+            if port not in listed:
+                self._add_stage_port_item(lst, port)
         lst.itemDoubleClicked.connect(lambda it: self._on_stage_item_double(it, dlg))
-        dlg.exec()
+        # probing waits on every serial port in turn, so it runs off the UI
+        # thread and the list is filled in when it completes
+        self._stage_dialog = (lst, status)
+        if self._port_scan_worker is None:
+            self._port_scan_worker = run_pooled(self._on_stage_ports_scanned, list_marlin_ports)
+        try:
+            dlg.exec()
+        finally:
+            self._stage_dialog = None
+
+    def _add_stage_port_item(self, lst, port):
+        item = QtWidgets.QListWidgetItem(port)
+        item.setData(QtCore.Qt.UserRole, port)
+        if self.stage and getattr(self.stage, "port", None) == port:
+            item.setCheckState(QtCore.Qt.Checked)
+        lst.addItem(item)
+
+    @QtCore.Slot(object, object)
+    def _on_stage_ports_scanned(self, ports, err):
+        self._port_scan_worker = None
+        if err:
+            log(f"UI: stage port scan failed: {err}")
+        else:
+            self._last_ports = list(ports or ())
+        if self._stage_dialog is None:
+            return
+        lst, status = self._stage_dialog
+        connected = getattr(self.stage, "port", None) if self.stage else None
+        listed = set()
+        if not err:
+            # drop ports that went away, keeping the connected stage's
+            for i in reversed(range(lst.count())):
+                port = lst.item(i).data(QtCore.Qt.UserRole)
+                if port in self._last_ports or port == connected:
+                    listed.add(port)
+                else:
+                    lst.takeItem(i)
+        for port in ports or ():
+            if port not in listed:
+                self._add_stage_port_item(lst, port)
+        if err:
+            status.setText(f"Scan failed: {err}")
+        elif lst.count() == 0:
+            status.setText("No stages found")
+        else:
+            status.hide()
 
     def _on_stage_item_double(self, item, dlg):
         port = item.data(QtCore.Qt.UserRole)
@@ -1313,10 +1867,9 @@ class MainWindow(QtWidgets.QMainWindow):
             self._populate_color_depths()
             self._populate_binning()
             self._populate_resolutions()
-            QtCore.QTimer.singleShot(0, self._populate_resolutions)
             self._apply_camera_profile()
             self._sync_cam_controls()
-            self.preview_timer.start()
+            self._sync_preview_timer()
             self.fps_timer.start()
             self._update_camera_control_availability()
             log("UI: camera connected")
@@ -1326,14 +1879,15 @@ class MainWindow(QtWidgets.QMainWindow):
     def _disconnect_camera(self):
         if not self.camera:
             return
+        self._stop_preview_worker()
         try:
             self.camera.stop_stream()
         except Exception:
             pass
         self.camera = None
         self.cam_status.setText("Camera: —")
-        self.preview_timer.stop()
         self.fps_timer.stop()
+        self._auto_refresh_timer.stop()
         self.measure_view.clear_image()
         self.res_combo.clear()
         self.bin_combo.clear()
@@ -1351,11 +1905,20 @@ class MainWindow(QtWidgets.QMainWindow):
                 return None
             return StageMarlin(p)
 
-        self._conn_thread, self._conn_worker = run_async(connect_stage)
-        self._conn_worker.finished.connect(self._on_stage_connect)
+        self._conn_worker = run_pooled(self._on_stage_connect, connect_stage)
 
     @QtCore.Slot(object, object)
     def _on_stage_connect(self, stage, err):
+        worker = self.sender()
+        if worker is not None and worker is not self._conn_worker:
+            # the connect was cancelled by _disconnect_stage while probing
+            if stage is not None:
+                try:
+                    stage.ser.close()
+                except Exception:
+                    pass
+            return
+        self._conn_worker = None
         if err or not stage:
             if err:
                 log(f"UI: stage connect failed: {err}")
@@ -1378,17 +1941,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.stage_bounds = None
             log("UI: stage connected (async)")
             self._attach_stage_worker()
-        thread = self._conn_thread
-        self._conn_thread = self._conn_worker = None
-        if thread and thread != QtCore.QThread.currentThread():
-            thread.wait()
 
     def _disconnect_stage(self):
-        if self._conn_thread:
-            self._conn_thread.quit()
-            self._conn_thread.wait()
-            self._conn_thread = None
-            self._conn_worker = None
+        self._conn_worker = None
         if self.stage_worker:
             self.stage_worker.stop()
         if self.stage_thread:
@@ -1396,6 +1951,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.stage_thread.wait(2000)
             self.stage_thread = None
             self.stage_worker = None
+        self._home_fns = {}
         if self.stage:
             try:
                 self.stage.ser.close()
@@ -1404,6 +1960,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.stage = None
         self.stage_status.setText("Stage: —")
         self.stage_pos.setText("Pos: —")
+        self._last_stage_text = None
         self.stage_bounds = None
 
     def _on_stage_position(self, pos):
@@ -1444,63 +2001,80 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         if self.stage_bounds:
             b = self.stage_bounds
-            limits_line = (
-                f"Limits: X[{b['xmin']:.6f},{b['xmax']:.6f}] "
-                f"Y[{b['ymin']:.6f},{b['ymax']:.6f}] "
-                f"Z[{b['zmin']:.6f},{b['zmax']:.6f}]"
-            )
+            key = tuple(b[k] for k in _BOUND_KEYS)
+            cached = getattr(self, "_limits_line", None)
+            if cached is None or cached[0] != key:
+                cached = self._limits_line = (key, _LIMITS_FMT.format(*key))
+            limits_line = cached[1]
         else:
             limits_line = "Limits: —"
 
-        self.stage_pos.setText(f"{coords_line}\n{limits_line}")
+        # position callbacks keep arriving while the stage is idle; only
+        # touch the label when the text actually changes
+        text = f"{coords_line}\n{limits_line}"
+        if text != getattr(self, "_last_stage_text", None):
+            self.stage_pos.setText(text)
+            self._last_stage_text = text
 
     # --------------------------- PREVIEW ---------------------------
 
-    def _on_preview(self):
-        if not self.camera:
-            return
-        frame = self.camera.get_latest_frame()
-        if frame is not None:
-            processed = frame
+    def _cuda_available(self) -> bool:
+        """Return whether OpenCV sees a CUDA device, probing only once."""
+        has_cuda = getattr(self, "_has_cuda", None)
+        if has_cuda is None:
             try:
                 has_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
             except Exception:
                 has_cuda = False
-            if has_cuda:
-                try:
-                    gpu = cv2.cuda_GpuMat()
-                    gpu.upload(frame)
-                    if frame.ndim == 3 and frame.shape[2] == 3:
-                        gpu = cv2.cuda.cvtColor(gpu, cv2.COLOR_BGR2RGB)
-                    processed = gpu.download()
-                except Exception:
-                    processed = (
-                        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        if frame.ndim == 3 and frame.shape[2] == 3
-                        else frame
-                    )
-            else:
-                processed = (
-                    cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    if frame.ndim == 3 and frame.shape[2] == 3
-                    else frame
-                )
-            qimg = numpy_to_qimage(processed)
-            self.measure_view.set_image(qimg)
+            self._has_cuda = has_cuda
+        return has_cuda
 
-        if self.autoexp_chk.isChecked():
-            try:
-                self.exp_spin.blockSignals(True)
-                self.gain_spin.blockSignals(True)
-                ms = float(self.camera.get_exposure_ms())
-                gain = float(self.camera.get_gain())
-                self.exp_spin.setValue(ms)
-                self.gain_spin.setValue(gain)
-            except Exception:
-                pass
-            finally:
-                self.exp_spin.blockSignals(False)
-                self.gain_spin.blockSignals(False)
+    def _on_preview(self):
+        """Draw the frame prepared by the preview worker."""
+        worker = getattr(self, "_preview_worker", None)
+        if worker is None or not self.camera:
+            return
+        item = worker.take()
+        if item is not None:
+            # the pixels stay referenced until set_image has copied them
+            # into the pixmap
+            qimg, source_size, _pixels = item
+            if source_size:
+                self.measure_view.set_image(qimg, source_size)
+            else:
+                self.measure_view.set_image(qimg)
+
+    def _start_preview_worker(self):
+        thread = QtCore.QThread(self)
+        worker = PreviewWorker(self.camera, self._preview_min_ms)
+        worker.set_view_size(*self.measure_view.preview_size())
+        worker.moveToThread(thread)
+        worker.frameReady.connect(self._on_preview, QtCore.Qt.QueuedConnection)
+        # direct: the size is a plain tuple the worker reads on its next tick
+        self.measure_view.viewport_resized.connect(
+            worker.set_view_size, QtCore.Qt.DirectConnection
+        )
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+        self._preview_thread = thread
+        self._preview_worker = worker
+        return worker
+
+    def _stop_preview_worker(self):
+        worker = getattr(self, "_preview_worker", None)
+        if worker is None:
+            return
+        thread = self._preview_thread
+        self._preview_thread = None
+        self._preview_worker = None
+        # blocking: the timer must be stopped from its own thread before
+        # that thread's event loop exits
+        QtCore.QMetaObject.invokeMethod(
+            worker, "stop", QtCore.Qt.BlockingQueuedConnection
+        )
+        thread.quit()
+        thread.wait(2000)
 
     def _update_fps(self):
         if self.camera:
@@ -1512,7 +2086,7 @@ class MainWindow(QtWidgets.QMainWindow):
     # --------------------------- CAMERA APPLY ---------------------------
 
     def _populate_speed_levels(self):
-        if not self.camera or not hasattr(self.camera, "get_speed_range"):
+        if not self.camera or not self._camera_caps()["get_speed_range"]:
             self.speed_spin.setEnabled(False)
             return
         self.speed_spin.blockSignals(True)
@@ -1529,7 +2103,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.speed_spin.blockSignals(False)
 
     def _populate_color_depths(self):
-        if not self.camera or not hasattr(self.camera, "list_color_depths"):
+        if not self.camera or not self._camera_caps()["list_color_depths"]:
             self.depth_combo.clear()
             self.depth_combo.setEnabled(False)
             return
@@ -1540,7 +2114,7 @@ class MainWindow(QtWidgets.QMainWindow):
             for d in depths:
                 self.depth_combo.addItem(f"{d}-bit", d)
             cur = depths[0] if depths else None
-            if hasattr(self.camera, "get_color_depth"):
+            if self._camera_caps()["get_color_depth"]:
                 try:
                     cur = int(self.camera.get_color_depth())
                 except Exception:
@@ -1555,7 +2129,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.depth_combo.blockSignals(False)
 
     def _populate_binning(self):
-        if not self.camera or not hasattr(self.camera, "list_binning_factors"):
+        if not self.camera or not self._camera_caps()["list_binning_factors"]:
             self.bin_combo.clear()
             self.bin_combo.setEnabled(False)
             return
@@ -1566,7 +2140,7 @@ class MainWindow(QtWidgets.QMainWindow):
             for f in factors:
                 self.bin_combo.addItem(f"{f}×", f)
             cur = 1
-            if hasattr(self.camera, "get_binning"):
+            if self._camera_caps()["get_binning"]:
                 cur = int(self.camera.get_binning())
             pos = self.bin_combo.findData(cur)
             if pos >= 0:
@@ -1581,12 +2155,15 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self.res_combo.blockSignals(True)
         res = list(self.camera.list_resolutions())
-        self.res_combo.clear()
-        for idx, w, h in res:
-            self.res_combo.addItem(f"{w}×{h}", idx)
+        # binning and profile changes repopulate; rebuild only on a new list
+        if res != getattr(self, "_res_combo_items", None) or self.res_combo.count() != len(res):
+            self.res_combo.clear()
+            for idx, w, h in res:
+                self.res_combo.addItem(f"{w}×{h}", idx)
+            self._res_combo_items = res
         current = 0
         try:
-            if hasattr(self.camera, "get_resolution_index"):
+            if self._camera_caps()["get_resolution_index"]:
                 current = int(self.camera.get_resolution_index())
         except Exception:
             current = 0
@@ -1603,108 +2180,79 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.camera:
             return
         p = self.profiles
-        # Exposure and auto-exposure
+        spins = [
+            (self.exp_spin, 'camera.exposure_ms'),
+            (self.gain_spin, 'camera.gain'),
+            (self.brightness_spin, 'camera.brightness'),
+            (self.contrast_spin, 'camera.contrast'),
+            (self.saturation_spin, 'camera.saturation'),
+            (self.hue_spin, 'camera.hue'),
+            (self.gamma_spin, 'camera.gamma'),
+            (self.speed_spin, 'camera.usb_speed'),
+        ]
         auto = p.get('camera.auto_exposure', self.autoexp_chk.isChecked(), expected_type=bool)
-        ms = p.get('camera.exposure_ms', self.exp_spin.value(), expected_type=(int, float))
-        self.autoexp_chk.blockSignals(True)
-        self.autoexp_chk.setChecked(auto)
-        self.autoexp_chk.blockSignals(False)
-        self.exp_spin.blockSignals(True)
-        self.exp_spin.setValue(ms)
-        self.exp_spin.blockSignals(False)
+        raw = p.get('camera.raw', self.raw_chk.isChecked(), expected_type=bool)
+        depth = p.get('camera.color_depth', self.depth_combo.currentData(), expected_type=(int, float))
+        bin_val = p.get('camera.binning', self.bin_combo.currentData(), expected_type=(int, float))
+        # fill in every control with signals held back, then push each
+        # setting to the camera exactly once below
+        with _signals_blocked(
+            self.autoexp_chk, self.raw_chk, self.depth_combo, self.bin_combo,
+            *(w for w, _ in spins),
+        ):
+            self.autoexp_chk.setChecked(auto)
+            self.raw_chk.setChecked(raw)
+            for w, key in spins:
+                w.setValue(p.get(key, w.value(), expected_type=(int, float)))
+            pos = self.depth_combo.findData(depth)
+            if pos >= 0:
+                self.depth_combo.setCurrentIndex(pos)
+            pos = self.bin_combo.findData(bin_val)
+            if pos >= 0:
+                self.bin_combo.setCurrentIndex(pos)
         self._apply_exposure()
-        # Gain
-        gain = p.get('camera.gain', self.gain_spin.value(), expected_type=(int, float))
-        self.gain_spin.blockSignals(True)
-        self.gain_spin.setValue(gain)
-        self.gain_spin.blockSignals(False)
         if not auto:
             self._apply_gain()
-        # Brightness
-        val = p.get('camera.brightness', self.brightness_spin.value(), expected_type=(int, float))
-        self.brightness_spin.blockSignals(True)
-        self.brightness_spin.setValue(val)
-        self.brightness_spin.blockSignals(False)
-        self._apply_brightness()
-        # Contrast
-        val = p.get('camera.contrast', self.contrast_spin.value(), expected_type=(int, float))
-        self.contrast_spin.blockSignals(True)
-        self.contrast_spin.setValue(val)
-        self.contrast_spin.blockSignals(False)
-        self._apply_contrast()
-        # Saturation
-        val = p.get('camera.saturation', self.saturation_spin.value(), expected_type=(int, float))
-        self.saturation_spin.blockSignals(True)
-        self.saturation_spin.setValue(val)
-        self.saturation_spin.blockSignals(False)
-        self._apply_saturation()
-        # Hue
-        val = p.get('camera.hue', self.hue_spin.value(), expected_type=(int, float))
-        self.hue_spin.blockSignals(True)
-        self.hue_spin.setValue(val)
-        self.hue_spin.blockSignals(False)
-        self._apply_hue()
-        # Gamma
-        val = p.get('camera.gamma', self.gamma_spin.value(), expected_type=(int, float))
-        self.gamma_spin.blockSignals(True)
-        self.gamma_spin.setValue(val)
-        self.gamma_spin.blockSignals(False)
-        self._apply_gamma()
-        # Color depth
-        depth = p.get('camera.color_depth', self.depth_combo.currentData(), expected_type=(int, float))
-        self.depth_combo.blockSignals(True)
-        pos = self.depth_combo.findData(depth)
-        if pos >= 0:
-            self.depth_combo.setCurrentIndex(pos)
-        self.depth_combo.blockSignals(False)
+        for name in _IMAGE_CONTROLS:
+            self._apply_image_control(name)
         self._apply_color_depth(self.depth_combo.currentIndex())
-        # RAW mode
-        raw = p.get('camera.raw', self.raw_chk.isChecked(), expected_type=bool)
-        self.raw_chk.blockSignals(True)
-        self.raw_chk.setChecked(raw)
-        self.raw_chk.blockSignals(False)
         self._apply_raw(raw)
-        # Binning
-        bin_val = p.get('camera.binning', self.bin_combo.currentData(), expected_type=(int, float))
-        self.bin_combo.blockSignals(True)
-        pos = self.bin_combo.findData(bin_val)
-        if pos >= 0:
-            self.bin_combo.setCurrentIndex(pos)
-        self.bin_combo.blockSignals(False)
         self._apply_binning(self.bin_combo.currentIndex())
-        # Resolution
+        # binning repopulates the resolution list, so pick from the new one
         res_idx = p.get('camera.resolution_index', self.res_combo.currentData(), expected_type=(int, float))
-        self.res_combo.blockSignals(True)
-        pos = self.res_combo.findData(res_idx)
-        if pos >= 0:
-            self.res_combo.setCurrentIndex(pos)
-        self.res_combo.blockSignals(False)
+        with _signals_blocked(self.res_combo):
+            pos = self.res_combo.findData(res_idx)
+            if pos >= 0:
+                self.res_combo.setCurrentIndex(pos)
         self._apply_resolution(self.res_combo.currentIndex())
-        # USB speed level
-        val = p.get('camera.usb_speed', self.speed_spin.value(), expected_type=(int, float))
-        self.speed_spin.blockSignals(True)
-        self.speed_spin.setValue(val)
-        self.speed_spin.blockSignals(False)
         self._apply_speed()
+
+    def _camera_caps(self, cam=None):
+        """Return ``{method: bool}`` for the optional methods of ``cam``.
+
+        ``cam`` defaults to the connected camera.  The ``hasattr`` probes run
+        once per camera object and are reused until the camera changes.
+        """
+        cam = self.camera if cam is None else cam
+        cached = getattr(self, "_cam_caps", None)
+        if cached is None or cached[0] is not cam:
+            caps = {n: cam is not None and hasattr(cam, n) for n in _CAMERA_CAPS}
+            cached = self._cam_caps = (cam, caps)
+        return cached[1]
+
     def _update_camera_control_availability(self, cam=None):
         cam = cam if cam is not None else self.camera
-        has = lambda attr: cam is not None and hasattr(cam, attr)
+        caps = self._camera_caps(cam)
         auto = self.autoexp_chk.isChecked()
-        self.autoexp_chk.setEnabled(has("set_exposure_ms"))
-        self.exp_spin.setEnabled(has("set_exposure_ms") and not auto)
-        self.gain_spin.setEnabled(has("set_gain") and not auto)
-        self.brightness_spin.setEnabled(has("set_brightness"))
-        self.brightness_slider.setEnabled(has("set_brightness"))
-        self.contrast_spin.setEnabled(has("set_contrast"))
-        self.contrast_slider.setEnabled(has("set_contrast"))
-        self.saturation_spin.setEnabled(has("set_saturation"))
-        self.saturation_slider.setEnabled(has("set_saturation"))
-        self.hue_spin.setEnabled(has("set_hue"))
-        self.hue_slider.setEnabled(has("set_hue"))
-        self.gamma_spin.setEnabled(has("set_gamma"))
-        self.gamma_slider.setEnabled(has("set_gamma"))
-        self.raw_chk.setEnabled(has("set_raw_fast_mono"))
-        roi = has("set_center_roi")
+        self.autoexp_chk.setEnabled(caps["set_exposure_ms"])
+        self.exp_spin.setEnabled(caps["set_exposure_ms"] and not auto)
+        self.gain_spin.setEnabled(caps["set_gain"] and not auto)
+        for name in _IMAGE_CONTROLS:
+            on = caps[f"set_{name}"]
+            getattr(self, f"{name}_spin").setEnabled(on)
+            getattr(self, f"{name}_slider").setEnabled(on)
+        self.raw_chk.setEnabled(caps["set_raw_fast_mono"])
+        roi = caps["set_center_roi"]
         self.btn_roi_full.setEnabled(roi)
         self.btn_roi_2048.setEnabled(roi)
         self.btn_roi_1024.setEnabled(roi)
@@ -1713,41 +2261,24 @@ class MainWindow(QtWidgets.QMainWindow):
     def _sync_cam_controls(self):
         if not self.camera:
             return
-        try:
-            if hasattr(self.camera, "get_brightness"):
-                val = int(self.camera.get_brightness())
-                self.brightness_spin.setValue(val)
-                self.brightness_slider.setValue(val)
-        except Exception:
-            pass
-        try:
-            if hasattr(self.camera, "get_contrast"):
-                val = int(self.camera.get_contrast())
-                self.contrast_spin.setValue(val)
-                self.contrast_slider.setValue(val)
-        except Exception:
-            pass
-        try:
-            if hasattr(self.camera, "get_saturation"):
-                val = int(self.camera.get_saturation())
-                self.saturation_spin.setValue(val)
-                self.saturation_slider.setValue(val)
-        except Exception:
-            pass
-        try:
-            if hasattr(self.camera, "get_hue"):
-                val = int(self.camera.get_hue())
-                self.hue_spin.setValue(val)
-                self.hue_slider.setValue(val)
-        except Exception:
-            pass
-        try:
-            if hasattr(self.camera, "get_gamma"):
-                val = int(self.camera.get_gamma())
-                self.gamma_spin.setValue(val)
-                self.gamma_slider.setValue(val)
-        except Exception:
-            pass
+        caps = self._camera_caps()
+        for name in _IMAGE_CONTROLS:
+            if not caps[f"get_{name}"]:
+                continue
+            try:
+                val = int(getattr(self.camera, f"get_{name}")())
+            except Exception:
+                continue
+            spin = getattr(self, f"{name}_spin")
+            slider = getattr(self, f"{name}_slider")
+            # values come from the camera, so don't write them back
+            with _signals_blocked(spin, slider):
+                spin.setValue(val)
+                slider.setValue(val)
+
+    def _throttled(self, fn, interval_ms: int = 50) -> Throttle:
+        """Return a leading+trailing rate limiter around camera slot ``fn``."""
+        return Throttle(fn, interval_ms, self)
 
     def _apply_exposure(self):
         if not self.camera: return
@@ -1757,19 +2288,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self.exp_spin.setEnabled(not auto)
         self.gain_spin.setEnabled(not auto)
         if auto:
-            try:
-                self.exp_spin.blockSignals(True)
-                self.gain_spin.blockSignals(True)
-                ms = float(self.camera.get_exposure_ms())
-                gain = float(self.camera.get_gain())
+            self._refresh_auto_exposure()
+            self._auto_refresh_timer.start()
+        else:
+            self._auto_refresh_timer.stop()
+        self._update_camera_control_availability()
+
+    def _refresh_auto_exposure(self):
+        """Show the exposure and gain the camera's auto-exposure settled on."""
+        if not self.camera or not self.autoexp_chk.isChecked():
+            self._auto_refresh_timer.stop()
+            return
+        try:
+            ms = float(self.camera.get_exposure_ms())
+            gain = float(self.camera.get_gain())
+            with _signals_blocked(self.exp_spin, self.gain_spin):
                 self.exp_spin.setValue(ms)
                 self.gain_spin.setValue(gain)
-            except Exception:
-                pass
-            finally:
-                self.exp_spin.blockSignals(False)
-                self.gain_spin.blockSignals(False)
-        self._update_camera_control_availability()
+        except Exception:
+            pass
 
     def _apply_gain(self, again=None):
         if not self.camera:
@@ -1778,30 +2315,13 @@ class MainWindow(QtWidgets.QMainWindow):
             again = self.gain_spin.value() * 100
         self.camera.set_gain(int(again))
 
-    def _apply_brightness(self):
-        if not self.camera: return
-        if hasattr(self.camera, "set_brightness"):
-            self.camera.set_brightness(int(self.brightness_spin.value()))
-
-    def _apply_contrast(self):
-        if not self.camera: return
-        if hasattr(self.camera, "set_contrast"):
-            self.camera.set_contrast(int(self.contrast_spin.value()))
-
-    def _apply_saturation(self):
-        if not self.camera: return
-        if hasattr(self.camera, "set_saturation"):
-            self.camera.set_saturation(int(self.saturation_spin.value()))
-
-    def _apply_hue(self):
-        if not self.camera: return
-        if hasattr(self.camera, "set_hue"):
-            self.camera.set_hue(int(self.hue_spin.value()))
-
-    def _apply_gamma(self):
-        if not self.camera: return
-        if hasattr(self.camera, "set_gamma"):
-            self.camera.set_gamma(int(self.gamma_spin.value()))
+    def _apply_image_control(self, name: str):
+        """Write ``<name>_spin`` to the camera's ``set_<name>`` if it has one."""
+        if not self.camera:
+            return
+        if self._camera_caps()[f"set_{name}"]:
+            spin = getattr(self, f"{name}_spin")
+            getattr(self.camera, f"set_{name}")(int(spin.value()))
 
     def _apply_color_depth(self, i: int):
         if not self.camera:
@@ -1884,7 +2404,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.camera.set_center_roi(side, side)
 
     def _apply_speed(self):
-        if not self.camera or not hasattr(self.camera, "set_speed_level"):
+        if not self.camera or not self._camera_caps()["set_speed_level"]:
             return
         self.camera.set_speed_level(int(self.speed_spin.value()))
 
@@ -1899,7 +2419,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.stage_worker.enqueue(self.stage.home_all)
         self.stage_worker.enqueue(self.stage.wait_for_moves)
         self.stage_worker.enqueue(
-            self.stage.get_position, callback=self._on_stage_position
+            self.stage.get_position,
+            callback=self._on_stage_position,
+            dedup_key="position",
         )
 
     def _home_axis(self, axis: str):
@@ -1907,20 +2429,16 @@ class MainWindow(QtWidgets.QMainWindow):
             log("Home ignored: stage not connected")
             QtWidgets.QMessageBox.warning(self, "Stage", "Stage not connected.")
             return
-        if axis == 'x':
-            fn = self.stage.home_x
-        elif axis == 'y':
-            fn = self.stage.home_y
-        else:
-            fn = self.stage.home_z
         log(f"Home axis: {axis.upper()}")
-        self.stage_worker.enqueue(fn)
+        self.stage_worker.enqueue(self._home_fns[axis])
         self.stage_worker.enqueue(self.stage.wait_for_moves)
         self.stage_worker.enqueue(
-            self.stage.get_position, callback=self._on_stage_position
+            self.stage.get_position,
+            callback=self._on_stage_position,
+            dedup_key="position",
         )
 
-    def _jog(self, dx=0, dy=0, dz=0, feed=0, *, wait_ok=True, callback=None):
+    def _jog(self, dx=0, dy=0, dz=0, feed=0, *, callback=None):
         if not self.stage_worker:
             log("Jog ignored: stage not connected")
             QtWidgets.QMessageBox.warning(self, "Stage", "Stage not connected.")
@@ -1941,7 +2459,6 @@ class MainWindow(QtWidgets.QMainWindow):
                 y,
                 z,
                 f,
-                wait_ok,
                 callback=callback,
             )
         else:
@@ -1951,12 +2468,13 @@ class MainWindow(QtWidgets.QMainWindow):
                 dy,
                 dz,
                 f,
-                wait_ok,
                 callback=callback,
             )
         self.stage_worker.enqueue(self.stage.wait_for_moves)
         self.stage_worker.enqueue(
-            self.stage.get_position, callback=self._on_stage_position
+            self.stage.get_position,
+            callback=self._on_stage_position,
+            dedup_key="position",
         )
 
     # --------------------------- CAPTURE / MODES ---------------------------
@@ -1995,7 +2513,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self, "Capture", "Filename cannot be empty."
             )
             return
-        if re.search(r"[\\/:*?\"<>|]", name):
+        if _RE_ILLEGAL_NAME.search(name):
             log("Capture aborted: illegal characters in filename")
             QtWidgets.QMessageBox.critical(
                 self,
@@ -2006,39 +2524,39 @@ class MainWindow(QtWidgets.QMainWindow):
 
         def do_capture():
             self.stage.wait_for_moves()
-            time.sleep(0.03)
-            try:
-                has_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
-            except Exception:
-                has_cuda = False
+            settled = time.monotonic()
+            # Cameras with a frame ring buffer hand back the first frame
+            # exposed after the move; others need a fixed settle delay.
+            ring = self._camera_caps()["get_frame_after"]
+            if not ring:
+                time.sleep(0.03)
+            has_cuda = self._cuda_available()
             try:
-                img = self.camera.snap(use_cuda=has_cuda)
+                if ring:
+                    img = self.camera.snap(use_cuda=has_cuda, after=settled)
+                else:
+                    img = self.camera.snap(use_cuda=has_cuda)
             except TypeError:
                 img = self.camera.snap()
+            if img is not None and self.chk_scale_bar.isChecked():
+                # the bar and label only touch a few kB of the frame, so they
+                # are drawn on the host copy; a device round-trip would move
+                # the whole frame over the bus twice to change those pixels.
+                # snap() hands back a frame of our own, so RGB frames are
+                # drawn on in place rather than copied.
+                try:
+                    img = draw_scale_bar(
+                        img,
+                        self.current_lens.um_per_px,
+                        out=img if img.ndim == 3 else None,
+                    )
+                except Exception as e:
+                    log(f"Scale bar draw error: {e}")
             if img is not None:
-                if has_cuda:
-                    try:
-                        gpu = cv2.cuda_GpuMat()
-                        gpu.upload(img)
-                        if self.chk_scale_bar.isChecked():
-                            img = draw_scale_bar(gpu, self.current_lens.um_per_px)
-                        else:
-                            img = gpu.download()
-                    except Exception as e:
-                        log(f"CUDA capture path failed: {e}; falling back to CPU")
-                        has_cuda = False
-                        if self.chk_scale_bar.isChecked():
-                            try:
-                                img = draw_scale_bar(img, self.current_lens.um_per_px)
-                            except Exception as e:
-                                log(f"Scale bar draw error: {e}")
-                else:
-                    if self.chk_scale_bar.isChecked():
-                        try:
-                            img = draw_scale_bar(img, self.current_lens.um_per_px)
-                        except Exception as e:
-                            log(f"Scale bar draw error: {e}")
-                pos = self.stage.get_position()
+                # moves refresh the cached position through the stage worker,
+                # so the snapshot spares a serial round-trip per capture
+                last = getattr(self, "_last_pos", None) or {}
+                pos = (last.get("x"), last.get("y"), last.get("z"))
                 meta = {
                     "Camera": self.camera.name(),
                     "Position": pos,
@@ -2048,6 +2566,13 @@ class MainWindow(QtWidgets.QMainWindow):
                     "Gain": getattr(self.camera, "get_gain", lambda: None)(),
                     "Time": datetime.datetime.now().isoformat(),
                 }
+                # encode off-thread so the next capture can start while this
+                # one is still being written; the write reports its own result
+                background = (
+                    {"background": True, "on_done": _log_capture_write}
+                    if isinstance(self.image_writer, ImageWriter)
+                    else {}
+                )
                 self.image_writer.save_single(
                     img,
                     directory=directory,
@@ -2055,18 +2580,22 @@ class MainWindow(QtWidgets.QMainWindow):
                     auto_number=auto_num,
                     fmt=self.capture_format,
                     metadata=meta,
+                    **background,
                 )
             return True
 
         log("Capture: starting")
-        t, w = run_async(do_capture)
-        self._last_thread, self._last_worker = t, w
-        w.finished.connect(lambda res, err: log("Capture: done" if not err else f"Capture error: {err}"))
+        run_pooled(
+            lambda res, err: log("Capture: done" if not err else f"Capture error: {err}"),
+            do_capture,
+        )
 
     @QtCore.Slot(object, object)
     def _on_autofocus_done(self, best, err):
         self.btn_autofocus.setEnabled(True)
         self._autofocusing = False
+        self._af_stop = None
+        self._update_stop_button()
         if err:
             log(f"Autofocus error: {err}")
             QtWidgets.QMessageBox.critical(self, "Autofocus", str(err))
@@ -2076,10 +2605,25 @@ class MainWindow(QtWidgets.QMainWindow):
                 self, "Autofocus", f"Best Z offset (relative): {best:.6f} mm"
             )
 
-    @QtCore.Slot()
-    def _cleanup_autofocus_thread(self):
-        self._af_thread = None
-        self._af_worker = None
+    def _session_autofocus(self, downsample: int):
+        """Return the session :class:`AutoFocus` for the current devices.
+
+        It is rebuilt when the stage or camera changed.  A job started while
+        another autofocus job is still running gets its own instance, since
+        the scratch buffers cannot be shared between threads.
+        """
+        busy = (
+            getattr(self, "_autofocusing", False)
+            or getattr(self, "_leveling", False)
+            or getattr(self, "_stack_stop", None) is not None
+        )
+        af = getattr(self, "_autofocus", None)
+        if busy or af is None or af.stage is not self.stage or af.camera is not self.camera:
+            af = AutoFocus(self.stage, self.camera, downsample)
+            if not busy:
+                self._autofocus = af
+        af.metric_downsample = downsample
+        return af
 
     def _run_autofocus(self):
         if self._autofocusing:
@@ -2096,31 +2640,35 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         metric = FocusMetric(self.metric_combo.currentText())
+        af = self._session_autofocus(self.af_downsample.value())
         self._autofocusing = True
         self.btn_autofocus.setEnabled(False)
 
+        search = FocusSearch(self.af_search.currentText())
+        stop = self._af_stop = threading.Event()
+
         def do_af():
-            af = AutoFocus(self.stage, self.camera)
-            best_z = af.coarse_to_fine(
-                metric=metric,
-                z_range_mm=float(self.af_range.value()),
-                coarse_step_mm=float(self.af_coarse.value()),
-                fine_step_mm=float(self.af_fine.value()),
-                feed_mm_per_min=self.feedz_spin.value(),
-            )
+            # frames are only scored, so colour would be wasted bandwidth
+            with mono_frames(af.camera):
+                best_z = af.coarse_to_fine(
+                    metric=metric,
+                    z_range_mm=float(self.af_range.value()),
+                    coarse_step_mm=float(self.af_coarse.value()),
+                    fine_step_mm=float(self.af_fine.value()),
+                    feed_mm_per_min=self.feedz_spin.value(),
+                    search=search,
+                    stop_event=stop,
+                )
             return best_z
 
         log(f"Autofocus: metric={metric.value}")
-        t, w = run_async(do_af)
-        self._af_thread, self._af_worker = t, w
-        self._af_thread.finished.connect(self._cleanup_autofocus_thread)
-        w.finished.connect(self._on_autofocus_done)
+        run_pooled(self._on_autofocus_done, do_af)
+        self._update_stop_button()
 
     @QtCore.Slot()
-    def _cleanup_leveling_thread(self):
+    def _cleanup_leveling(self):
         self._set_movement_controls_enabled(True)
-        self._level_thread = None
-        self._level_worker = None
+        self._level_stop = None
         self._leveling = False
         self._level_continue_event.set()
         self.level_prompt.hide()
@@ -2129,7 +2677,7 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @QtCore.Slot(object, object)
     def _on_leveling_done(self, model, err):
-        self._set_movement_controls_enabled(True)
+        self._cleanup_leveling()
         self.btn_start_level.setEnabled(True)
         if err:
             log(f"Leveling error: {err}")
@@ -2218,11 +2766,18 @@ class MainWindow(QtWidgets.QMainWindow):
         z_range = float(self.af_range.value())
         coarse = float(self.af_coarse.value())
         fine = float(self.af_fine.value())
+        # after the first point only a narrowed sweep around the previous
+        # point's focus is needed; the bed does not jump between neighbours
+        reduce_pct = self.level_af_reduce.value()
+        near_range = max(2 * coarse, z_range * (1 - reduce_pct / 100.0))
+        af = self._session_autofocus(self.af_downsample.value()) if auto_mode else None
+        search = FocusSearch(self.af_search.currentText())
         feed_xy = self.feedx_spin.value()
         feed_z = self.feedz_spin.value()
         stage = self.stage
         camera = self.camera
         self._leveling = True
+        stop = self._level_stop = threading.Event()
         self.btn_start_level.setEnabled(False)
         self._set_leveling_status("Starting...")
 
@@ -2237,88 +2792,58 @@ class MainWindow(QtWidgets.QMainWindow):
             ys_vals = [y1, y2, y3]
             xmin, xmax = min(xs_vals), max(xs_vals)
             ymin, ymax = min(ys_vals), max(ys_vals)
+            last_z = None  # focus Z of the previous point
             if method == "Three-point":
                 coords = [(x1, y1), (x2, y2), (x3, y3)]
-                total = len(coords)
-                pts = []
-                for idx, (x, y) in enumerate(coords, 1):
-                    QtCore.QMetaObject.invokeMethod(
-                        self,
-                        "_set_leveling_status",
-                        QtCore.Qt.QueuedConnection,
-                        QtCore.Q_ARG(str, f"Point {idx}/{total}"),
-                    )
-                    stage.move_absolute(x=x, y=y, feed_mm_per_min=feed_xy)
-                    stage.wait_for_moves()
-                    if auto_mode:
-                        af = AutoFocus(stage, camera)
-                        _ = af.coarse_to_fine(
-                            metric=metric,
-                            z_range_mm=z_range,
-                            coarse_step_mm=coarse,
-                            fine_step_mm=fine,
-                            feed_mm_per_min=feed_z,
-                        )
-                    else:
-                        self._level_continue_event.clear()
-                        msg = (
-                            f"Manually focus at point {idx} of {total} then press Next to continue."
-                        )
-                        QtCore.QMetaObject.invokeMethod(
-                            self,
-                            "_set_level_prompt",
-                            QtCore.Qt.QueuedConnection,
-                            QtCore.Q_ARG(str, msg),
-                        )
-                        self._level_continue_event.wait()
-                    pos = stage.get_position()
-                    if pos:
-                        x_meas, y_meas, z = pos
-                    else:
-                        x_meas, y_meas, z = x, y, 0.0
-                    pts.append((x_meas, y_meas, z))
             else:
                 xs = np.linspace(xmin, xmax, cols)
                 ys = np.linspace(ymin, ymax, rows)
-                coords = [(x, y) for y in ys for x in xs]
-                total = len(coords)
-                pts = []
-                for idx, (x, y) in enumerate(coords, 1):
-                    QtCore.QMetaObject.invokeMethod(
-                        self,
-                        "_set_leveling_status",
-                        QtCore.Qt.QueuedConnection,
-                        QtCore.Q_ARG(str, f"Point {idx}/{total}"),
+                # serpentine order: odd rows run backwards so the stage
+                # never travels back across the grid between rows
+                gx, gy = np.meshgrid(xs, ys)
+                gx[1::2] = gx[1::2, ::-1]
+                coords = np.column_stack([gx.ravel(), gy.ravel()])
+            total = len(coords)
+            status_strs = [f"Point {i}/{total}" for i in range(1, total + 1)]
+            if not auto_mode:
+                prompt_strs = [
+                    f"Manually focus at point {i} of {total} then press Next to continue."
+                    for i in range(1, total + 1)
+                ]
+            pts = []
+            last_xy = None
+            for idx, (x, y) in enumerate(coords):
+                if stop.is_set():
+                    raise RuntimeError("operation cancelled")
+                self.leveling_status_changed.emit(status_strs[idx])
+                if (
+                    last_xy is None
+                    or abs(x - last_xy[0]) + abs(y - last_xy[1]) >= _STAGE_RES_MM
+                ):
+                    stage.move_absolute(x=x, y=y, feed_mm_per_min=feed_xy, wait=True)
+                last_xy = (x, y)
+                if auto_mode:
+                    af.coarse_to_fine(
+                        metric=metric,
+                        z_range_mm=z_range if last_z is None else near_range,
+                        coarse_step_mm=coarse,
+                        fine_step_mm=fine,
+                        feed_mm_per_min=feed_z,
+                        center_z=last_z,
+                        search=search,
+                        stop_event=stop,
                     )
-                    stage.move_absolute(x=x, y=y, feed_mm_per_min=feed_xy)
-                    stage.wait_for_moves()
-                    if auto_mode:
-                        af = AutoFocus(stage, camera)
-                        _ = af.coarse_to_fine(
-                            metric=metric,
-                            z_range_mm=z_range,
-                            coarse_step_mm=coarse,
-                            fine_step_mm=fine,
-                            feed_mm_per_min=feed_z,
-                        )
-                    else:
-                        self._level_continue_event.clear()
-                        msg = (
-                            f"Manually focus at point {idx} of {total} then press Next to continue."
-                        )
-                        QtCore.QMetaObject.invokeMethod(
-                            self,
-                            "_set_level_prompt",
-                            QtCore.Qt.QueuedConnection,
-                            QtCore.Q_ARG(str, msg),
-                        )
-                        self._level_continue_event.wait()
-                    pos = stage.get_position()
-                    if pos:
-                        x_meas, y_meas, z = pos
-                    else:
-                        x_meas, y_meas, z = x, y, 0.0
-                    pts.append((x_meas, y_meas, z))
+                else:
+                    self._level_continue_event.clear()
+                    self.level_prompt_changed.emit(prompt_strs[idx])
+                    self._level_continue_event.wait()
+                pos = stage.get_position()
+                if pos:
+                    x_meas, y_meas, z = pos
+                    last_z = z
+                else:
+                    x_meas, y_meas, z = x, y, 0.0
+                pts.append((x_meas, y_meas, z))
             model = SurfaceModel(kind)
             model.fit(pts)
             area = Area(
@@ -2329,24 +2854,21 @@ class MainWindow(QtWidgets.QMainWindow):
             self.focus_mgr.areas.clear()
             self.focus_mgr.add_area(area)
             return model
+        def do_auto_level():
+            with mono_frames(camera):
+                return do_level()
+
         # Allow manual stage movement while leveling so users can position
         # the stage if needed. Previously movement controls were disabled
         # here which prevented manual adjustments during the leveling
         # process.
-        t, w = run_async(do_level)
-        self._level_thread, self._level_worker = t, w
-        self._level_thread.finished.connect(self._cleanup_leveling_thread)
-        w.finished.connect(self._on_leveling_done)
-        self._update_stop_button()
-
-    @QtCore.Slot()
-    def _cleanup_focus_stack_thread(self):
-        self._stack_thread = None
-        self._stack_worker = None
+        run_pooled(self._on_leveling_done, do_auto_level if auto_mode else do_level)
         self._update_stop_button()
 
     @QtCore.Slot(object, object)
     def _on_focus_stack_done(self, best_idx, err):
+        self._stack_stop = None
+        self._update_stop_button()
         self.btn_focus_stack.setEnabled(True)
         if err:
             log(f"Focus stack error: {err}")
@@ -2370,29 +2892,39 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         rng = float(self.stack_range.value())
         feed = self.feedz_spin.value()
-        writer = ImageWriter(self.capture_dir)
-        stack_dir = writer.run_dir
-        self._last_stack_dir = stack_dir
+        capture_dir = self.capture_dir
+        fmt = self.capture_format
+        lens_name = self.current_lens.name
+        self._last_stack_dir = None
         self.btn_focus_stack.setEnabled(False)
+        af = self._session_autofocus(self.af_downsample.value())
+        stop = self._stack_stop = threading.Event()
 
         def do_stack():
-            af = AutoFocus(self.stage, self.camera)
-            return af.focus_stack(
-                rng,
-                step,
-                writer,
-                directory=stack_dir,
-                metric=FocusMetric.LAPLACIAN,
-                feed_mm_per_min=feed,
-                fmt=self.capture_format,
-                lens_name=self.current_lens.name,
-            )
+            # creating the run directory touches the disk, so it happens
+            # here rather than on the UI thread
+            writer = ImageWriter(capture_dir)
+            stack_dir = self._last_stack_dir = writer.run_dir
+            log(f"Focus stack: range={rng} step={step} dir={stack_dir}")
+            try:
+                return af.focus_stack(
+                    rng,
+                    step,
+                    writer,
+                    directory=stack_dir,
+                    metric=FocusMetric.LAPLACIAN,
+                    feed_mm_per_min=feed,
+                    fmt=fmt,
+                    lens_name=lens_name,
+                    stop_event=stop,
+                    background_writes=True,
+                )
+            finally:
+                # frames were encoded off-thread; wait for them (and surface
+                # any write error) before reporting the stack as done
+                writer.close()
 
-        log(f"Focus stack: range={rng} step={step} dir={stack_dir}")
-        t, w = run_async(do_stack)
-        self._stack_thread, self._stack_worker = t, w
-        self._stack_thread.finished.connect(self._cleanup_focus_stack_thread)
-        w.finished.connect(self._on_focus_stack_done)
+        run_pooled(self._on_focus_stack_done, do_stack)
         self._update_stop_button()
 
     def _set_raster_point(self, idx: int):
@@ -2427,7 +2959,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not (self.stage and self.camera):
             log("Raster ignored: stage or camera not connected")
             return
-        if self._raster_thread or self._raster_runner:
+        if self._raster_runner:
             log("Raster ignored: raster already running")
             QtWidgets.QMessageBox.warning(
                 self, "Raster", "A raster operation is already in progress."
@@ -2538,7 +3070,7 @@ class MainWindow(QtWidgets.QMainWindow):
             log("Raster aborted: filename empty")
             QtWidgets.QMessageBox.critical(self, "Raster", "Filename cannot be empty.")
             return
-        if re.search(r"[\\/:*?\"<>|]", name):
+        if _RE_ILLEGAL_NAME.search(name):
             log("Raster aborted: illegal characters in filename")
             QtWidgets.QMessageBox.critical(
                 self,
@@ -2557,11 +3089,14 @@ class MainWindow(QtWidgets.QMainWindow):
             auto_number=auto_num,
             fmt=fmt,
             position_cb=lambda pos: self.stage_worker.enqueue(
-                self.stage.get_position, callback=self._on_stage_position
+                self.stage.get_position,
+                callback=self._on_stage_position,
+                dedup_key="position",
             ),
             lens_name=self.current_lens.name,
             lens_um_per_px=self.current_lens.um_per_px,
             scale_bar_um_per_px=self.current_lens.um_per_px if self.chk_scale_bar.isChecked() else None,
+            background_writes=isinstance(self.image_writer, ImageWriter),
         )
         self._raster_runner = runner
 
@@ -2571,46 +3106,45 @@ class MainWindow(QtWidgets.QMainWindow):
 
         log("Raster: starting")
         self._set_movement_controls_enabled(False)
-        t, w = run_async(do_raster)
-        self._raster_thread, self._raster_worker = t, w
         self.btn_run_raster.setEnabled(False)
+        run_pooled(self._on_raster_finished, do_raster)
         self._update_stop_button()
-        w.finished.connect(self._on_raster_finished)
 
     def _stop_all(self):
+        # jobs notice the request at their next step and finish through
+        # their done handlers; nothing here waits on them
         self._set_movement_controls_enabled(False)
         if self._raster_runner:
             log("Raster: stop requested")
             self._raster_runner.stop()
-            if self._raster_thread:
-                self._raster_thread.quit()
-                self._raster_thread.wait()
-        if self._level_thread:
+        if self._level_stop:
             log("Leveling: stop requested")
-            self._level_thread.requestInterruption()
+            self._level_stop.set()
             self._level_continue_event.set()
-        if self._stack_thread:
+        if self._stack_stop:
             log("Focus stack: stop requested")
-            self._stack_thread.requestInterruption()
+            self._stack_stop.set()
+        if self._af_stop:
+            log("Autofocus: stop requested")
+            self._af_stop.set()
 
     def _update_stop_button(self):
-        active = bool(self._raster_runner or self._level_thread or self._stack_thread)
+        active = bool(
+            self._raster_runner or self._level_stop or self._stack_stop or self._af_stop
+        )
         self.btn_stop.setEnabled(active)
 
     @QtCore.Slot(object, object)
     def _on_raster_finished(self, res, err):
-        thread = self._raster_thread
-        if thread and thread.isRunning():
-            thread.wait()
         self._raster_runner = None
-        self._raster_thread = None
-        self._raster_worker = None
         self._set_movement_controls_enabled(True)
         self.btn_run_raster.setEnabled(True)
         self._update_stop_button()
         if self.stage_worker:
             self.stage_worker.enqueue(
-                self.stage.get_position, callback=self._on_stage_position
+                self.stage.get_position,
+                callback=self._on_stage_position,
+                dedup_key="position",
             )
         log("Raster: done" if not err else f"Raster error: {err}")
 
@@ -2626,9 +3160,10 @@ class MainWindow(QtWidgets.QMainWindow):
             return True
 
         log("Script: Z-stack example")
-        t, w = run_async(do_script)
-        self._last_thread, self._last_worker = t, w
-        w.finished.connect(lambda res, err: log("Script: done" if not err else f"Script error: {err}"))
+        run_pooled(
+            lambda res, err: log("Script: done" if not err else f"Script error: {err}"),
+            do_script,
+        )
 
     # --------------------------- MEASUREMENT ---------------------------
 
@@ -2662,14 +3197,14 @@ class MainWindow(QtWidgets.QMainWindow):
             self.current_lens.um_per_px = um_per_px
             res_key = self._current_res_key() or "default"
             self.current_lens.calibrations[res_key] = um_per_px
-            self.profiles.set(
-                f"measurement.lenses.{self.current_lens.name}.calibrations.{res_key}",
-                um_per_px,
-            )
-            self.profiles.set(
-                f"measurement.lenses.{self.current_lens.name}.um_per_px", um_per_px
-            )
-            self.profiles.save()
+            with self.profiles.transaction():
+                self.profiles.set(
+                    f"measurement.lenses.{self.current_lens.name}.calibrations.{res_key}",
+                    um_per_px,
+                )
+                self.profiles.set(
+                    f"measurement.lenses.{self.current_lens.name}.um_per_px", um_per_px
+                )
             self._refresh_lens_combo()
             self.measure_view.set_scale_bar(
                 self.chk_scale_bar.isChecked(), um_per_px
@@ -2709,48 +3244,99 @@ class MainWindow(QtWidgets.QMainWindow):
             (self.speed_spin, "camera.usb_speed"),
             (self.lens_combo, "measurement.current_lens"),
             (self.chk_scale_bar, "ui.scale_bar"),
+            (self.level_af_reduce, "ui.leveling.af_reduce_pct"),
+            (self.af_search, "ui.autofocus.search"),
         ]
 
     # --------------------------- PROFILES ---------------------------
 
+    def _save_profiles(self):
+        timer = getattr(self, "_profile_save_timer", None)
+        if timer is not None:
+            timer.stop()
+        self.profiles.save()
+
+    def _schedule_profile_save(self):
+        """Save the profile once edits pause instead of on every change."""
+        timer = getattr(self, "_profile_save_timer", None)
+        if timer is None:  # window still being built
+            self.profiles.save()
+        else:
+            timer.start()
+
     def _reload_profiles(self):
+        timer = getattr(self, "_profile_save_timer", None)
+        if timer is not None and timer.isActive():
+            self._save_profiles()
         self.profiles = Profiles.load_or_create()
         self.profile_combo.clear()
         self.profile_combo.addItems(self.profiles.list_profile_names())
 
     # --------------------------- CLOSE ---------------------------
 
+    def _sync_preview_timer(self):
+        """Run the preview worker only while a camera is shown on screen."""
+        if not hasattr(self, "_preview_worker"):  # window still being built
+            return
+        active = (
+            bool(getattr(self, "camera", None))
+            and self.isVisible()
+            and not self.isMinimized()
+        )
+        worker = self._preview_worker
+        if active:
+            if worker is None:
+                worker = self._start_preview_worker()
+            QtCore.QMetaObject.invokeMethod(
+                worker, "start", QtCore.Qt.QueuedConnection
+            )
+        elif worker is not None:
+            QtCore.QMetaObject.invokeMethod(
+                worker, "stop", QtCore.Qt.QueuedConnection
+            )
+
+    def showEvent(self, e: QtGui.QShowEvent) -> None:
+        super().showEvent(e)
+        self._sync_preview_timer()
+
+    def hideEvent(self, e: QtGui.QHideEvent) -> None:
+        super().hideEvent(e)
+        self._sync_preview_timer()
+
+    def changeEvent(self, e: QtCore.QEvent) -> None:
+        super().changeEvent(e)
+        if e.type() == QtCore.QEvent.WindowStateChange:
+            self._sync_preview_timer()
+
     def closeEvent(self, e: QtGui.QCloseEvent) -> None:
-        for w, path in self._persistent_widgets():
-            if isinstance(w, QtWidgets.QAbstractSpinBox):
-                val = w.value()
-            elif isinstance(w, QtWidgets.QCheckBox):
-                val = w.isChecked()
-            elif isinstance(w, QtWidgets.QComboBox):
-                data = w.currentData()
-                val = data if data is not None else w.currentText()
-            elif isinstance(w, QtWidgets.QLineEdit):
-                val = w.text()
-            else:
-                continue
-            self.profiles.set(path, val)
-        self.profiles.save()
+        widgets = getattr(self, "_persistent_widget_cache", None)
+        for w, path in widgets or self._persistent_widgets():
+            getter = _profile_getter(type(w))
+            if getter is not None:
+                self.profiles.set(path, getter(w))
+        self._save_profiles()
         try:
             self._stop_all()
-            if self._raster_thread:
-                self._raster_thread.quit()
-                self._raster_thread.wait()
             if self.stage_worker:
                 self.stage_worker.stop()
             if self.stage_thread:
                 self.stage_thread.quit()
                 self.stage_thread.wait(2000)
+            self._stop_preview_worker()
+            # let pooled jobs (stopped above) finish before the app tears down
+            QtCore.QThreadPool.globalInstance().waitForDone(2000)
             if self.camera:
                 try:
                     self.camera.stop_stream()
                 except Exception:
                     pass
-            if hasattr(self, "system_tab"):
+            if getattr(self, "system_tab", None) is not None:
                 self.system_tab.stop()
+            writer = getattr(self, "image_writer", None)
+            if isinstance(writer, ImageWriter):
+                try:
+                    writer.close()
+                except Exception as err:
+                    log(f"Image writer error: {err}")
         finally:
             return super().closeEvent(e)
@@ -27,7 +27,11 @@ except Exception as exc:  # pragma: no cover - library or device missing
 
 
 class SystemMonitorTab(QtWidgets.QWidget):
-    """Display simple CPU/GPU utilization metrics."""
+    """Display simple CPU/GPU utilization metrics.
+
+    Polling follows visibility: it runs while the tab is shown and stops as
+    soon as it is hidden (another tab selected, window minimized).
+    """
 
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
         super().__init__(parent)
@@ -49,9 +53,19 @@ class SystemMonitorTab(QtWidgets.QWidget):
             self.gpu_bar = QtWidgets.QProgressBar()
             self.gpu_bar.setRange(0, 100)
 
-            self.gpu_mem_label = QtWidgets.QLabel("GPU Memory: 0 MiB / 0 MiB")
+            # total memory never changes; read it once so a tick only has to
+            # ask the driver for what does
+            try:
+                self.gpu_mem_total = int(
+                    nvmlDeviceGetMemoryInfo(_NVML_HANDLE).total / 1024**2
+                )
+            except NVMLError:
+                self.gpu_mem_total = 0
+            self.gpu_mem_label = QtWidgets.QLabel(
+                f"GPU Memory: 0 MiB / {self.gpu_mem_total} MiB"
+            )
             self.gpu_mem_bar = QtWidgets.QProgressBar()
-            self.gpu_mem_bar.setRange(0, 100)
+            self.gpu_mem_bar.setRange(0, self.gpu_mem_total or 100)
 
             layout.addWidget(self.gpu_label)
             layout.addWidget(self.gpu_bar)
@@ -66,16 +80,30 @@ class SystemMonitorTab(QtWidgets.QWidget):
         layout.addStretch(1)
 
         self.timer = QtCore.QTimer(self)
-        self.timer.setInterval(1000)
+        self.timer.setInterval(2000)
         self.timer.timeout.connect(self.update_metrics)
 
     # ------------------------------------------------------------------
+    def showEvent(self, event) -> None:
+        self.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event) -> None:
+        self.pause()
+        super().hideEvent(event)
+
     def start(self) -> None:
+        if self.timer.isActive():
+            return
         self.update_metrics()
         self.timer.start()
 
-    def stop(self) -> None:
+    def pause(self) -> None:
+        """Stop polling while hidden; :meth:`start` resumes it."""
         self.timer.stop()
+
+    def stop(self) -> None:
+        self.pause()
         if _NVML_AVAILABLE:
             try:  # pragma: no cover - defensive cleanup
                 nvmlShutdown()
@@ -84,6 +112,8 @@ class SystemMonitorTab(QtWidgets.QWidget):
 
     # ------------------------------------------------------------------
     def update_metrics(self) -> None:
+        if not self.isVisible():
+            return
         cpu = self.proc.cpu_percent(None) / psutil.cpu_count()
         self.cpu_bar.setValue(int(cpu))
         self.cpu_label.setText(f"CPU Usage: {cpu:.1f}%")
@@ -98,8 +128,10 @@ class SystemMonitorTab(QtWidgets.QWidget):
 
                 # Memory info in MiB
                 used = int(mem.used / 1024**2)
-                total = int(mem.total / 1024**2)
-                self.gpu_mem_bar.setMaximum(total)
+                if not self.gpu_mem_total:  # the initial read failed
+                    self.gpu_mem_total = int(mem.total / 1024**2)
+                    self.gpu_mem_bar.setMaximum(self.gpu_mem_total)
+                total = self.gpu_mem_total
                 self.gpu_mem_bar.setValue(used)
                 self.gpu_mem_label.setText(
                     f"GPU Memory: {used} MiB / {total} MiB"
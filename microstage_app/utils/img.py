@@ -1,5 +1,6 @@
 import math
 import subprocess
+from functools import lru_cache
 
 import numpy as np
 from PySide6 import QtGui
@@ -13,28 +14,55 @@ VERT_SCALE = 2  # line thickness multiplier
 TEXT_SCALE = 4  # font size multiplier
 
 
-def _has_cuda() -> bool:
-    try:
-        return cv2.cuda.getCudaEnabledDeviceCount() > 0
-    except Exception:
-        return False
+@lru_cache(maxsize=1)
+def _default_font_size() -> int:
+    return ImageFont.load_default().size
 
 
-def _draw_scale_bar_cpu(img: np.ndarray, um_per_px: float,
-                        *, draw_line: bool = True) -> np.ndarray:
-    """CPU implementation of the scale bar drawing."""
+@lru_cache(maxsize=8)
+def _resolve_font(family, size: int):
+    """Return the scale bar font for ``family`` at ``size``.
+
+    Resolving a family means an ``fc-match`` subprocess and a FreeType face
+    load, so results (including the default-font fallback, whose warning is
+    then only logged once) are cached per family and size.
+    """
+    if family is not None:
+        font_path = ""
+        try:
+            res = subprocess.run(
+                ["fc-match", "-f", "%{file}\n", family],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            font_path = res.stdout.strip()
+            return ImageFont.truetype(font_path, size)
+        except Exception as e:
+            log(
+                f"WARNING: failed to load scale bar font {font_path or family}: {e}; using default font"
+            )
+    # the default font is only built when it is actually needed
+    return ImageFont.load_default().font_variant(size=size)
 
-    h, w, _ = img.shape
 
+@lru_cache(maxsize=32)
+def _scale_bar_layout(w: int, h: int, um_per_px: float):
+    """Return ``(x0, y0, length_px, label)`` for a ``w`` x ``h`` frame.
+
+    Pure in its arguments, which stay fixed during a live preview, so the
+    nice-length search and label formatting run once per geometry.
+    """
     # Compute a "nice" length that fits within ~20% of the image width
     max_um = 0.2 * w * um_per_px
     exp = math.floor(math.log10(max_um)) if max_um > 0 else 0
-    nice_um = 10 ** exp
-    for m in (5, 2, 1):
-        candidate = m * (10 ** exp)
-        if candidate <= max_um:
-            nice_um = candidate
-            break
+    scale = 10 ** exp
+    if 5 * scale <= max_um:
+        nice_um = 5 * scale
+    elif 2 * scale <= max_um:
+        nice_um = 2 * scale
+    else:
+        nice_um = scale
 
     # Scale the length and clamp to image bounds
     length_px = int(round(nice_um / um_per_px))
@@ -46,125 +74,162 @@ def _draw_scale_bar_cpu(img: np.ndarray, um_per_px: float,
     margin = 20
     x0 = int(round(w - margin - length_px))
     y0 = int(round(h - margin))
-
-    pil = Image.fromarray(img)
-    draw = ImageDraw.Draw(pil)
-    if draw_line:
-        draw.line(
-            [(x0, y0), (x0 + length_px, y0)],
-            fill=(255, 255, 255),
-            width=2 * VERT_SCALE,
-        )
-
     label = (
         f"{nice_um/1000:.2f} mm" if nice_um >= 1000 else f"{nice_um:.0f} µm"
     )
+    return x0, y0, length_px, label
 
-    base_font = ImageFont.load_default()
-    font_size = base_font.size * TEXT_SCALE
-    font = base_font.font_variant(size=font_size)
 
-    qapp = QtGui.QGuiApplication.instance()
-    font_path = ""
-    if qapp is not None:
-        family = qapp.font().family()
-        try:
-            res = subprocess.run(
-                ["fc-match", "-f", "%{file}\n", family],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
-            font_path = res.stdout.strip()
-            font = ImageFont.truetype(font_path, font_size)
-        except Exception as e:
-            log(
-                f"WARNING: failed to load scale bar font {font_path or family}: {e}; using default font"
-            )
+@lru_cache(maxsize=32)
+def _label_mask(label: str, font):
+    """Rasterize ``label`` once; return ``(keep, add, bbox)`` for blending.
 
-    bbox = draw.textbbox((0, 0), label, font=font)
-    th = bbox[3] - bbox[1]
-    draw.text(
-        (x0, y0 - (7 * TEXT_SCALE) - th),
-        label,
-        fill=(255, 255, 255),
-        font=font,
-    )
+    PIL's rounded blend towards white is
+    ``(dst * (255 - a) + 255 * a + 128) / 255`` for coverage ``a``, so the
+    two per-pixel factors ``keep = 255 - a`` and ``add = 255 * a + 128``
+    are stored rather than the mask itself.  Both are read-only ``uint16``
+    arrays shaped ``(rows, cols, 1)`` so they broadcast over colour
+    channels.  ``bbox`` is the text box relative to the drawing origin, so
+    the arrays go to ``origin + bbox[:2]`` and the label height is
+    ``bbox[3] - bbox[1]``.
+    """
+    bbox = ImageDraw.Draw(Image.new("L", (1, 1))).textbbox((0, 0), label, font=font)
+    pil = Image.new("L", (max(1, bbox[2] - bbox[0]), max(1, bbox[3] - bbox[1])))
+    ImageDraw.Draw(pil).text((-bbox[0], -bbox[1]), label, fill=255, font=font)
+    a = np.asarray(pil, dtype=np.uint16)[:, :, None]
+    keep = 255 - a
+    add = 255 * a + 128
+    keep.flags.writeable = False
+    add.flags.writeable = False
+    return keep, add, bbox
+
+
+def _draw_scale_bar_cpu(img: np.ndarray, um_per_px: float) -> np.ndarray:
+    """CPU implementation of the scale bar drawing.
+
+    Draws into ``img`` in place and returns it; only the bar and label
+    regions are touched, so callers pass a frame they own.
+    """
+
+    h, w, _ = img.shape
+    x0, y0, length_px, label = _scale_bar_layout(w, h, um_per_px)
+
+    # same pixels PIL draws for a horizontal line of this width
+    half = VERT_SCALE
+    xa, xb = sorted((x0, x0 + length_px))
+    img[max(0, y0 - half + 1):y0 + half + 1, max(0, xa):xb + 1] = 255
 
-    return np.array(pil)
+    font_size = _default_font_size() * TEXT_SCALE
+    qapp = QtGui.QGuiApplication.instance()
+    family = qapp.font().family() if qapp is not None else None
+    font = _resolve_font(family, font_size)
 
-def numpy_to_qimage(img: np.ndarray) -> QtGui.QImage:
-    if img.ndim == 2:
+    # the glyphs are rasterized once per label and font, then blended
+    # towards white over just the label's box
+    keep, add, bbox = _label_mask(label, font)
+    th = bbox[3] - bbox[1]
+    tx = x0 + bbox[0]
+    ty = y0 - (7 * TEXT_SCALE) - th + bbox[1]
+    mh, mw = keep.shape[:2]
+    cx0, cy0 = max(0, tx), max(0, ty)
+    cx1, cy1 = min(w, tx + mw), min(h, ty + mh)
+    if cx0 < cx1 and cy0 < cy1:
+        rows = slice(cy0 - ty, cy1 - ty)
+        cols = slice(cx0 - tx, cx1 - tx)
+        region = img[cy0:cy1, cx0:cx1]
+        # one uint16 scratch buffer; the /255 is (t + (t >> 8)) >> 8
+        t = np.multiply(region, keep[rows, cols], dtype=np.uint16)
+        t += add[rows, cols]
+        t += t >> 8
+        np.right_shift(t, 8, out=region, casting="unsafe")
+
+    return img
+
+def _row_buffer(img: np.ndarray):
+    """Return a flat buffer from ``img``'s first pixel to its last.
+
+    Row-strided views are not C-contiguous, so their ``.data`` cannot be
+    exported; this 1-D view over the same memory can, and Qt skips the
+    padding between rows through ``bytesPerLine``.
+    """
+    if img.flags.c_contiguous:
+        return img.data
+    span = img.strides[0] * (img.shape[0] - 1) + img.strides[1] * img.shape[1]
+    return np.lib.stride_tricks.as_strided(
+        img, shape=(span // img.itemsize,), strides=(img.itemsize,)
+    ).data
+
+
+def numpy_to_qimage(img: np.ndarray, copy: bool = True,
+                    bgr: bool = False) -> QtGui.QImage:
+    """Wrap ``img`` in a :class:`QtGui.QImage`.
+
+    With ``copy=False`` the QImage shares ``img``'s memory instead of owning a
+    copy; the caller must keep ``img`` alive (and C-contiguous) for as long as
+    the image is used.  ``bgr=True`` marks a 3-channel ``img`` as OpenCV BGR
+    order, which Qt reads natively so no channel swap is needed.
+
+    Rows are addressed through ``img.strides[0]``, so row-strided views such
+    as crops wrap without a copy; only arrays whose pixels are not packed
+    within a row are made contiguous first.  With ``copy=False`` the
+    returned image also holds a reference to its backing array.
+    """
+    if img.ndim in (2, 3):
+        packed = img.itemsize * (img.shape[2] if img.ndim == 3 else 1)
+        if img.strides[1] != packed or (img.ndim == 3 and img.strides[2] != img.itemsize):
+            img = np.ascontiguousarray(img)
+    if img.ndim == 2 and img.dtype == np.uint16:
+        # 16-bit mono/RAW frames are handed to Qt as-is; the paint engine does
+        # the tone mapping so no 16->8 pass is needed on the preview path.
         h, w = img.shape
-        qimg = QtGui.QImage(img.data, w, h, w, QtGui.QImage.Format_Grayscale8)
-        return qimg.copy()
+        qimg = QtGui.QImage(
+            _row_buffer(img), w, h, img.strides[0], QtGui.QImage.Format_Grayscale16
+        )
+    elif img.ndim == 2:
+        h, w = img.shape
+        qimg = QtGui.QImage(
+            _row_buffer(img), w, h, img.strides[0], QtGui.QImage.Format_Grayscale8
+        )
     elif img.ndim == 3 and img.shape[2] == 3:
         h, w, _ = img.shape
-        qimg = QtGui.QImage(img.data, w, h, 3*w, QtGui.QImage.Format_RGB888)
-        return qimg.copy()
+        fmt = QtGui.QImage.Format_BGR888 if bgr else QtGui.QImage.Format_RGB888
+        qimg = QtGui.QImage(_row_buffer(img), w, h, img.strides[0], fmt)
     else:
         raise ValueError(f"Unsupported image shape: {img.shape}")
+    if copy:
+        return qimg.copy()
+    qimg._backing = img
+    return qimg
 
 
-def draw_scale_bar(img, um_per_px: float):
-    """Draw a scale bar on ``img`` using GPU acceleration when available.
+def draw_scale_bar(img, um_per_px: float, *, out=None):
+    """Draw a scale bar and its label on the host frame ``img``.
 
-    ``img`` may be a :class:`numpy.ndarray` or ``cv2.cuda_GpuMat``. In the GPU
-    path, the line is rendered on the device and text is overlaid after
-    downloading the frame.
+    The result is a new RGB array unless ``out`` is given: an ``(h, w, 3)``
+    ``uint8`` array to draw into instead, which may be ``img`` itself when
+    the caller owns the frame.  With ``um_per_px <= 0`` nothing is drawn and
+    ``img`` is returned as-is.
     """
 
     if um_per_px <= 0:
-        return img if isinstance(img, np.ndarray) else img.download()
-
-    has_cuda = _has_cuda()
-
-    if has_cuda and isinstance(img, cv2.cuda_GpuMat):
-        w, h = img.size()
-        h = int(h)
-        w = int(w)
-
-        # Compute geometry
-        max_um = 0.2 * w * um_per_px
-        exp = math.floor(math.log10(max_um)) if max_um > 0 else 0
-        nice_um = 10 ** exp
-        for m in (5, 2, 1):
-            candidate = m * (10 ** exp)
-            if candidate <= max_um:
-                nice_um = candidate
-                break
-
-        length_px = int(round(nice_um / um_per_px))
-        max_length = w - 40
-        if length_px > max_length:
-            length_px = max_length
-            nice_um = length_px * um_per_px
-
-        margin = 20
-        x0 = int(round(w - margin - length_px))
-        y0 = int(round(h - margin))
-        thickness = 2 * VERT_SCALE
-        y1 = max(0, y0 - thickness)
-        roi = img.rowRange(y1, y0).colRange(x0, x0 + length_px)
-        roi.setTo((255, 255, 255))
-
-        arr = img.download()
-        return _draw_scale_bar_cpu(arr, um_per_px, draw_line=False)
+        return img
 
     if isinstance(img, np.ndarray):
         if img.ndim == 2:
-            if has_cuda:
-                try:
-                    gm = cv2.cuda_GpuMat()
-                    gm.upload(img)
-                    gm = cv2.cuda.cvtColor(gm, cv2.COLOR_GRAY2RGB)
-                    arr = gm.download()
-                except Exception:
-                    arr = np.repeat(img[:, :, None], 3, axis=2)
+            # the bar is drawn into the result, so it has to be a real
+            # buffer rather than a broadcast view
+            if out is None:
+                arr = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB)
             else:
-                arr = np.repeat(img[:, :, None], 3, axis=2)
+                arr = cv2.cvtColor(img, cv2.COLOR_GRAY2RGB, dst=out)
         elif img.ndim == 3 and img.shape[2] == 3:
-            arr = img
+            if out is None:
+                # one copy so the caller's frame is left untouched
+                arr = img.copy()
+            else:
+                if out is not img:
+                    np.copyto(out, img)
+                arr = out
         else:
             raise ValueError(f"Unsupported image shape: {img.shape}")
         return _draw_scale_bar_cpu(arr, um_per_px)
@@ -1,4 +1,4 @@
-import sys, threading, datetime
+import sys, threading, time, queue, atexit
 from PySide6 import QtCore
 
 class LogBus(QtCore.QObject):
@@ -6,8 +6,66 @@ class LogBus(QtCore.QObject):
 
 LOG = LogBus()
 
+# Console output is written by one background thread so callers on hot
+# paths (frame loops, serial replies) only pay for a queue put; whatever
+# has queued up by the time it wakes goes out in a single write + flush.
+_lines = queue.SimpleQueue()
+
+def _write_console(text: str):
+    """Write a batch of lines to stdout as one encoded block.
+
+    The batch is encoded once and handed to the binary buffer beneath the
+    text layer, so the text wrapper does no per-line work.  Characters the
+    console cannot show become ``?`` rather than failing the whole batch.
+    """
+    out = sys.stdout
+    raw = getattr(out, "buffer", None)
+    if raw is None:
+        out.write(text)
+        out.flush()
+        return
+    out.flush()  # keep order with anything print()ed through the text layer
+    raw.write(text.encode(getattr(out, "encoding", None) or "utf-8", "replace"))
+    raw.flush()
+
+def _drain():
+    while True:
+        batch = [_lines.get()]
+        while True:
+            try:
+                batch.append(_lines.get_nowait())
+            except queue.Empty:
+                break
+        text = "".join(line + "\n" for line in batch if line is not None)
+        if text:
+            try:
+                _write_console(text)
+            except Exception:
+                pass  # no console (e.g. pythonw); the UI pane still has it
+        if None in batch:
+            return
+
+_writer = threading.Thread(target=_drain, name="log-writer", daemon=True)
+_writer.start()
+
+@atexit.register
+def _flush_on_exit():
+    _lines.put(None)
+    _writer.join(1.0)
+
+# (second, "HH:MM:SS") of the last stamp; strftime only runs once a second
+_stamp = (None, "")
+
+def _timestamp() -> str:
+    global _stamp
+    t = time.time()
+    sec = int(t)
+    stamp = _stamp
+    if stamp[0] != sec:
+        stamp = _stamp = (sec, time.strftime('%H:%M:%S', time.localtime(sec)))
+    return f"{stamp[1]}.{int((t - sec) * 1000):03d}"
+
 def log(msg: str):
-    ts = datetime.datetime.now().strftime('%H:%M:%S.%f')[:-3]
-    line = f"[{ts}] {msg}"
-    print(line, file=sys.stdout, flush=True)
+    line = f"[{_timestamp()}] {msg}"
+    _lines.put(line)
     LOG.message.emit(line)
\ No newline at end of file
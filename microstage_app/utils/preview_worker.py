@@ -0,0 +1,128 @@
+import threading
+
+import cv2
+import numpy as np
+from PySide6 import QtCore
+
+from .img import numpy_to_qimage
+
+
+def prepare_preview(frame, view_size, dst=None):
+    """Return ``(qimg, source_size, pixels)`` for displaying ``frame``.
+
+    Frames larger than ``view_size`` are shrunk to fit it with
+    ``cv2.resize`` (INTER_AREA) so paints and pixmap memory scale with the
+    displayed pixels rather than the sensor's; ``source_size`` is then the
+    original ``(w, h)``, otherwise None.  The shrunk frame is written into
+    ``dst`` when it already has the right shape and dtype, so a caller can
+    recycle buffers instead of allocating one per frame.  ``qimg`` wraps
+    ``pixels`` without a copy, so keep ``pixels`` alive until the image has
+    been drawn.
+    """
+    vw, vh = view_size
+    h, w = frame.shape[:2]
+    source_size = None
+    if vw > 0 and vh > 0 and (w > vw or h > vh):
+        scale = min(vw / w, vh / h)
+        size = (max(1, int(w * scale)), max(1, int(h * scale)))
+        shape = (size[1], size[0]) + frame.shape[2:]
+        if dst is None or dst.shape != shape or dst.dtype != frame.dtype:
+            dst = np.empty(shape, dtype=frame.dtype)
+        frame = cv2.resize(frame, size, dst=dst, interpolation=cv2.INTER_AREA)
+        source_size = (w, h)
+    # Qt reads BGR frames natively, so the frame is wrapped as-is
+    return numpy_to_qimage(frame, copy=False, bgr=True), source_size, frame
+
+
+class PreviewWorker(QtCore.QObject):
+    """Pull camera frames and build preview QImages off the GUI thread.
+
+    Move the worker to its own QThread and call ``start``/``stop`` through
+    queued invocations so its timer lives in that thread.  Only the newest
+    prepared frame is kept: ``frameReady`` fires when it is stored and no
+    new frame is fetched until the GUI collects it with :meth:`take`, so a
+    busy GUI skips frames instead of queueing them.
+
+    Ticks are also dropped while the worker is slower than the render rate:
+    after each frame it idles for at least as long as that frame took to
+    prepare (a smoothed cost that backs off at once and recovers
+    gradually), so processing never saturates its thread.
+
+    Downscaled frames alternate between two recycled buffers: the GUI is
+    done reading one by the time it takes the next, so the worker never
+    writes into pixels that are still being drawn.
+    """
+    frameReady = QtCore.Signal()
+
+    def __init__(self, camera, min_interval_ms: int = 16):
+        super().__init__()
+        self.camera = camera
+        self.min_interval_ms = min_interval_ms
+        self.view_size = (0, 0)  # device pixels, see set_view_size()
+        self._lock = threading.Lock()
+        self._latest = None
+        self._timer = None
+        self._clock = QtCore.QElapsedTimer()
+        self._clock.start()
+        self._last_ms = -min_interval_ms  # start of the last prepared frame
+        self._done_ms = 0  # end of the last prepared frame
+        self._cost_ms = 0.0  # smoothed fetch + prepare time
+        self._bufs = [None, None]  # downscale targets, used in turn
+        self._buf = 0
+
+    def set_view_size(self, w: int, h: int):
+        """Set the display size frames are downscaled to.
+
+        Called directly from the GUI thread; the tuple is swapped atomically
+        and picked up by the next tick.
+        """
+        self.view_size = (w, h)
+
+    @QtCore.Slot()
+    def start(self):
+        if self._timer is None:
+            self._timer = QtCore.QTimer(self)
+            # poll at twice the render rate so a new frame is picked up
+            # within half a refresh
+            self._timer.setInterval(max(1, self.min_interval_ms // 2))
+            self._timer.timeout.connect(self.tick)
+        self._timer.start()
+
+    @QtCore.Slot()
+    def stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+
+    def take(self):
+        """Return and clear the pending ``(qimg, source_size, pixels)``."""
+        with self._lock:
+            item, self._latest = self._latest, None
+        return item
+
+    @QtCore.Slot()
+    def tick(self):
+        with self._lock:
+            if self._latest is not None:
+                return
+        now = self._clock.elapsed()
+        if now - self._last_ms < self.min_interval_ms:
+            return
+        if now - self._done_ms < self._cost_ms:
+            return
+        frame = self.camera.get_latest_frame()
+        if frame is None:
+            return
+        self._last_ms = now
+        item = prepare_preview(frame, self.view_size, self._bufs[self._buf])
+        if item[1] is not None:
+            self._bufs[self._buf] = item[2]
+            self._buf ^= 1
+        self._done_ms = self._clock.elapsed()
+        cost = self._done_ms - now
+        if cost > self._cost_ms:
+            self._cost_ms = float(cost)
+        else:
+            self._cost_ms = 0.75 * self._cost_ms + 0.25 * cost
+        with self._lock:
+            self._latest = item
+        self.frameReady.emit()
@@ -1,5 +1,7 @@
+import threading
+from collections import deque
+
 from PySide6 import QtCore
-from queue import Queue, Empty
 
 class SerialWorker(QtCore.QObject):
     finished = QtCore.Signal()
@@ -9,28 +11,67 @@ class SerialWorker(QtCore.QObject):
     def __init__(self, stage):
         super().__init__()
         self.stage = stage
-        self._q = Queue()
+        # pending [fn, args, kwargs, callback, dedup_key, on_worker] entries,
+        # plus the latest pending entry for each dedup key
+        self._q = deque()
+        self._keyed = {}
+        self._cv = threading.Condition()
         self._running = True
 
     @QtCore.Slot()
     def loop(self):
         try:
-            while self._running:
-                try:
-                    fn, args, kwargs, cb = self._q.get(timeout=0.1)
-                except Empty:
-                    continue
+            while True:
+                with self._cv:
+                    while self._running and not self._q:
+                        self._cv.wait()
+                    if not self._running:
+                        break
+                    entry = self._q.popleft()
+                    key = entry[4]
+                    if key is not None and self._keyed.get(key) is entry:
+                        del self._keyed[key]
+                fn, args, kwargs, cb, _, on_worker = entry
+                if fn is None:
+                    continue  # superseded by a later request with its key
                 try:
                     res = fn(*args, **kwargs)
-                    if cb:
+                    if cb and on_worker:
+                        cb(res)
+                    elif cb:
                         self.result.emit(cb, res)
                 except Exception as e:
                     self.errored.emit(str(e))
         finally:
             self.finished.emit()
 
-    def enqueue(self, fn, *args, callback=None, **kwargs):
-        self._q.put((fn, args, kwargs, callback))
+    def enqueue(self, fn, *args, callback=None, dedup_key=None, priority=0,
+                callback_thread="gui", **kwargs):
+        """Queue ``fn(*args, **kwargs)`` for the worker thread.
+
+        A pending request with the same ``dedup_key`` is dropped in favour of
+        this one, so bursts of e.g. position polls collapse to the latest.
+        ``priority > 0`` jumps the queue.  ``callback`` gets the result on
+        the GUI thread through :attr:`result`; with
+        ``callback_thread="worker"`` it is called inline on the serial
+        thread instead, for callbacks that do not touch widgets.
+        """
+        if callback_thread not in ("gui", "worker"):
+            raise ValueError(f"callback_thread must be 'gui' or 'worker', not {callback_thread!r}")
+        entry = [fn, args, kwargs, callback, dedup_key, callback_thread == "worker"]
+        with self._cv:
+            if dedup_key is not None:
+                old = self._keyed.get(dedup_key)
+                if old is not None:
+                    old[0] = None
+                self._keyed[dedup_key] = entry
+            if priority > 0:
+                self._q.appendleft(entry)
+            else:
+                self._q.append(entry)
+            self._cv.notify()
 
     def stop(self):
-        self._running = False
+        with self._cv:
+            self._running = False
+            self._cv.notify()
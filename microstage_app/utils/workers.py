@@ -13,14 +13,54 @@ class FuncWorker(QtCore.QObject):
         except Exception as e:
             self.finished.emit(None, e)
 
-def run_async(fn, *args, **kwargs):
-    """Run fn(*) on a fresh QThread; return (thread, worker). Caller must keep refs until finished."""
-    thread = QtCore.QThread()
+_pooled = set()  # workers in flight on the pool, released once delivered
+
+
+def run_pooled(done, fn, *args, **kwargs):
+    """Run fn(*) on the global QThreadPool and deliver done(result, error).
+
+    Used for every one-shot background job (probes, captures, autofocus,
+    leveling, stacks, rasters) so no QThread is spun up per call; long jobs
+    are cancelled through their own stop events. The worker stays on the
+    calling thread, so ``done`` is invoked there through a queued signal; it
+    is connected before the job is submitted so fast jobs cannot finish
+    unobserved. The worker is kept alive until then; it is returned so
+    callers can tell results apart via ``sender()``.
+    """
     worker = FuncWorker(fn, *args, **kwargs)
-    worker.moveToThread(thread)
-    thread.started.connect(worker.run)
-    worker.finished.connect(thread.quit)
-    thread.finished.connect(worker.deleteLater)
-    thread.finished.connect(thread.deleteLater)
-    thread.start()
-    return thread, worker
+    worker.finished.connect(done)
+    worker.finished.connect(lambda *_: _pooled.discard(worker))
+    _pooled.add(worker)
+    QtCore.QThreadPool.globalInstance().start(worker.run)
+    return worker
+
+
+class Throttle(QtCore.QObject):
+    """Rate-limit ``fn`` to one call per ``interval_ms`` (leading + trailing).
+
+    The first call runs immediately; calls arriving inside the interval are
+    collapsed into a single trailing call once it expires. ``fn`` takes no
+    arguments and is expected to read the current widget state itself, so
+    the trailing call always lands on the final value.
+    """
+    def __init__(self, fn, interval_ms: int = 50, parent=None):
+        super().__init__(parent)
+        self._fn = fn
+        self._pending = False
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def __call__(self, *_):
+        if self._timer.isActive():
+            self._pending = True
+            return
+        self._fn()
+        self._timer.start()
+
+    def _on_timeout(self):
+        if self._pending:
+            self._pending = False
+            self._fn()
+            self._timer.start()
@@ -0,0 +1,53 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6 import QtWidgets
+
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "ui: run with QTimer.singleShot inline and the window's FPS timer disabled"
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_timers(request, monkeypatch):
+    """Run ``singleShot`` callbacks inline for tests marked ``ui``.
+
+    Unmarked tests keep real timers; they are the ones that spin an event
+    loop and wait on a timeout.
+    """
+    if request.node.get_closest_marker("ui") is None:
+        return
+    from PySide6 import QtCore
+
+    monkeypatch.setattr(QtCore.QTimer, "singleShot", lambda ms, fn: fn())
+
+
+@pytest.fixture
+def window(request, qapp, monkeypatch):
+    """A fresh MainWindow that skips the startup port scan and is closed after.
+
+    Under the ``ui`` marker ``fps_timer.start`` is disabled once the window
+    is built, so starting the camera later never starts the FPS timer.
+    """
+    from microstage_app.ui import main_window
+
+    monkeypatch.setattr(main_window.MainWindow, "_auto_connect_async", lambda self: None)
+    win = main_window.MainWindow()
+    if request.node.get_closest_marker("ui") is not None:
+        win.fps_timer.start = lambda *a, **k: None
+    yield win
+    win.fps_timer.stop()
+    win.close()
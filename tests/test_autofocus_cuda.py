@@ -1,12 +1,7 @@
-import sys
-from pathlib import Path
 import numpy as np
 import cv2
 import pytest
 
-# Ensure repository root on import path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from microstage_app.control.autofocus import metric_value, FocusMetric
 
 
@@ -1,19 +1,11 @@
-import os
-import sys
-from pathlib import Path
-
 import pytest
 from PySide6 import QtWidgets
 
-# Ensure repository root is on the import path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from microstage_app.ui.main_window import MainWindow
 from microstage_app.control.profiles import Profiles
 
 
 def test_camera_settings_persist(tmp_path):
-    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
     profile_path = tmp_path / "profiles.yaml"
     orig_path = Profiles.PATH
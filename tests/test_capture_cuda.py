@@ -1,24 +1,41 @@
-import sys
-from pathlib import Path
 import types
 
 import numpy as np
 import cv2
 import pytest
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 from microstage_app.ui import main_window
 
 
-def _run_capture(monkeypatch, frame, gpu):
-    mw = main_window.MainWindow.__new__(main_window.MainWindow)
+class FakeGpuMat:
+    uploads = None  # shapes uploaded, recorded while a test collects them
+
+    def __init__(self, mat=None):
+        self.mat = mat
+    def upload(self, arr):
+        if FakeGpuMat.uploads is not None:
+            FakeGpuMat.uploads.append(arr.shape)
+        self.mat = arr.copy()
+    def download(self):
+        return self.mat.copy()
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    shapes = []
+    monkeypatch.setattr(FakeGpuMat, "uploads", shapes)
+    return shapes
+
+
+def _run_capture(monkeypatch, frame, gpu, mw=None, scale_bar=True):
+    if mw is None:
+        mw = main_window.MainWindow.__new__(main_window.MainWindow)
     mw.stage = types.SimpleNamespace(wait_for_moves=lambda: None, get_position=lambda: {})
     saved = {}
     def fake_save(img, **kwargs):
         saved['img'] = img
     mw.image_writer = types.SimpleNamespace(save_single=fake_save)
-    mw.chk_scale_bar = types.SimpleNamespace(isChecked=lambda: True)
+    mw.chk_scale_bar = types.SimpleNamespace(isChecked=lambda: scale_bar)
     mw.current_lens = types.SimpleNamespace(um_per_px=1.0, name='lens')
     mw.capture_dir = '/tmp'
     mw.capture_name = 'test'
@@ -26,21 +43,6 @@ def _run_capture(monkeypatch, frame, gpu):
     mw.capture_format = 'png'
 
     if gpu:
-        class FakeGpuMat:
-            def __init__(self, mat=None):
-                self.mat = mat
-            def upload(self, arr):
-                self.mat = arr.copy()
-            def download(self):
-                return self.mat
-            def size(self):
-                return (self.mat.shape[1], self.mat.shape[0])
-            def rowRange(self, y1, y2):
-                return FakeGpuMat(self.mat[y1:y2])
-            def colRange(self, x1, x2):
-                return FakeGpuMat(self.mat[:, x1:x2])
-            def setTo(self, color):
-                self.mat[...] = color
         def fake_cvtColor(gm, code):
             out = FakeGpuMat()
             out.mat = cv2.cvtColor(gm.mat, code)
@@ -53,6 +55,8 @@ def _run_capture(monkeypatch, frame, gpu):
 
     def fake_snap(use_cuda=False):
         assert use_cuda == gpu
+        if frame.ndim == 2:
+            return frame.copy()
         if use_cuda:
             gm = cv2.cuda_GpuMat()
             gm.upload(frame)
@@ -62,18 +66,13 @@ def _run_capture(monkeypatch, frame, gpu):
     mw.camera = types.SimpleNamespace(name=lambda: 'cam', snap=fake_snap,
                                       get_exposure_ms=lambda: None, get_gain=lambda: None)
 
-    class DummySignal:
-        def connect(self, cb):
-            cb(True, None)
-    class DummyWorker:
-        finished = DummySignal()
-    def fake_run_async(func):
+    def fake_run_pooled(done, func):
         func()
-        return None, DummyWorker()
-    monkeypatch.setattr(main_window, 'run_async', fake_run_async)
+        done(True, None)
+    monkeypatch.setattr(main_window, 'run_pooled', fake_run_pooled)
 
     mw._capture()
-    return saved['img']
+    return saved.get('img')
 
 
 def test_capture_cpu(monkeypatch):
@@ -86,3 +85,27 @@ def test_capture_gpu(monkeypatch):
     frame = np.array([[[0, 0, 255], [255, 0, 0]]], dtype=np.uint8)
     out = _run_capture(monkeypatch, frame, gpu=True)
     assert np.array_equal(out, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+
+
+def test_capture_gpu_draws_scale_bar_on_host(monkeypatch, uploads):
+    frame = np.zeros((40, 200, 3), dtype=np.uint8)
+    out = _run_capture(monkeypatch, frame, gpu=True)
+    # only the camera's colour conversion goes through the device
+    assert uploads == [frame.shape]
+    assert out.max() == 255
+    assert np.array_equal(out, _run_capture(monkeypatch, frame, gpu=False))
+
+
+def test_capture_gpu_skips_upload_without_scale_bar(monkeypatch, uploads):
+    frame = np.array([[[0, 0, 255], [255, 0, 0]]], dtype=np.uint8)
+    out = _run_capture(monkeypatch, frame, gpu=True, scale_bar=False)
+    assert np.array_equal(out, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    assert uploads == [frame.shape]
+
+
+def test_capture_gpu_keeps_mono_frames_on_host(monkeypatch, uploads):
+    frame = np.full((40, 200), 7, dtype=np.uint8)
+    out = _run_capture(monkeypatch, frame, gpu=True)
+    assert uploads == []
+    assert out.shape == (40, 200, 3)
+    assert out.max() == 255
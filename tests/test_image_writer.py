@@ -1,5 +1,3 @@
-from pathlib import Path
-import sys
 import json
 
 import numpy as np
@@ -7,8 +5,6 @@ import pytest
 import tifffile
 from PIL import Image
 
-# Ensure the repository root is on sys.path so ``microstage_app`` is importable
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 from microstage_app.io.storage import ImageWriter
 
 
@@ -0,0 +1,97 @@
+from PySide6 import QtCore, QtWidgets
+from PySide6.QtTest import QTest
+
+from microstage_app.ui import main_window
+
+
+class RecordingWorker:
+    def __init__(self):
+        self.calls = []
+
+    def enqueue(self, fn, *args, callback=None, **kwargs):
+        self.calls.append((fn, args, callback))
+
+
+class FakeStage:
+    def move_relative(self, *args):
+        pass
+
+    def wait_for_moves(self):
+        pass
+
+    def get_position(self):
+        pass
+
+
+def _moves(worker, stage):
+    return [c for c in worker.calls if c[0] == stage.move_relative]
+
+
+def _window(monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(main_window.MainWindow, "_auto_connect_async", lambda self: None)
+    win = main_window.MainWindow()
+    win.stage = FakeStage()
+    win.stage_worker = RecordingWorker()
+    win.leveling_enabled = False
+    win.stepx_spin.setValue(0.5)
+    return win
+
+
+def test_jog_button_auto_repeats_one_step_at_a_time(monkeypatch):
+    win = _window(monkeypatch)
+
+    btn = win.btn_xp
+    assert btn.autoRepeat()
+    assert btn.autoRepeatDelay() == 1000
+
+    # a plain click jogs once, on press; the release adds nothing
+    btn.click()
+    moves = _moves(win.stage_worker, win.stage)
+    assert len(moves) == 1
+    assert moves[0][1][:3] == (0.5, 0, 0)
+
+    # a repeat tick while the previous step is still queued is dropped
+    win._jog_step(win.stepx_spin, win.feedx_spin, 1, 0, 0)
+    assert len(_moves(win.stage_worker, win.stage)) == 1
+
+    # once the stage reports the step done, the next tick jogs again
+    moves[0][2](None)
+    win._jog_step(win.stepx_spin, win.feedx_spin, 1, 0, 0)
+    assert len(_moves(win.stage_worker, win.stage)) == 2
+
+    # a step that fails reports through errored, not its callback
+    win._jog_step(win.stepx_spin, win.feedx_spin, 1, 0, 0)
+    assert len(_moves(win.stage_worker, win.stage)) == 2
+    win._on_stage_error("move failed")
+    win._jog_step(win.stepx_spin, win.feedx_spin, 1, 0, 0)
+    assert len(_moves(win.stage_worker, win.stage)) == 3
+
+    win.stage_worker = None
+    win.fps_timer.stop()
+    win.close()
+
+
+def test_jog_button_hold_never_overshoots(monkeypatch):
+    win = _window(monkeypatch)
+    btn = win.btn_xp
+    btn.setAutoRepeatDelay(200)
+    win.show()
+
+    # the stage never finishes the first step, so neither the repeat ticks
+    # nor the release may queue another one
+    QTest.mousePress(btn, QtCore.Qt.LeftButton)
+    assert len(_moves(win.stage_worker, win.stage)) == 1
+    QTest.qWait(400)
+    QTest.mouseRelease(btn, QtCore.Qt.LeftButton)
+    assert len(_moves(win.stage_worker, win.stage)) == 1
+
+    # once it does finish, a fresh press jogs straight away
+    _moves(win.stage_worker, win.stage)[0][2](None)
+    QTest.mousePress(btn, QtCore.Qt.LeftButton)
+    QTest.mouseRelease(btn, QtCore.Qt.LeftButton)
+    assert len(_moves(win.stage_worker, win.stage)) == 2
+
+    win.stage_worker = None
+    win.fps_timer.stop()
+    win.close()
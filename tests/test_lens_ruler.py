@@ -1,10 +1,6 @@
 import sys, types
-from pathlib import Path
 import pytest
 
-# Ensure repository root is on the import path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
 # Provide a minimal cv2 stub so the measure module can be imported
 cv2_stub = types.SimpleNamespace(
     RETR_EXTERNAL=0,
@@ -0,0 +1,158 @@
+from types import SimpleNamespace
+
+import pytest
+from microstage_app.ui import main_window
+
+
+class StageMock:
+    def __init__(self):
+        self.x = self.y = 0.0
+        self.z = 2.0
+        self.moves = []  # (x, y) of every XY move
+
+    def move_absolute(self, x=None, y=None, z=None, feed_mm_per_min=0.0, wait=False):
+        if x is not None:
+            self.moves.append((x, y))
+        self.x = self.x if x is None else x
+        self.y = self.y if y is None else y
+        self.z = self.z if z is None else z
+
+    def wait_for_moves(self):
+        pass
+
+    def get_position(self):
+        return (self.x, self.y, self.z)
+
+
+@pytest.fixture
+def leveling(window, monkeypatch):
+    """``window`` set up for auto three-point leveling on a mock stage.
+
+    Each autofocus records its keyword arguments in ``calls`` and then runs
+    ``on_focus``; pooled jobs are collected in ``jobs`` instead of started.
+    """
+    rig = SimpleNamespace(
+        win=window, stage=StageMock(), instances=[], calls=[], jobs=[],
+        on_focus=lambda: None,
+    )
+
+    class DummyAF:
+        def __init__(self, stage, camera, metric_downsample=1):
+            rig.instances.append(metric_downsample)
+
+        def coarse_to_fine(self, metric=None, **kwargs):
+            rig.calls.append(kwargs)
+            rig.on_focus()
+
+    monkeypatch.setattr(main_window, "AutoFocus", DummyAF)
+    monkeypatch.setattr(main_window, "run_pooled", lambda done, fn: rig.jobs.append(fn))
+    window.stage = rig.stage
+    window.camera = object()
+    window.level_mode.setCurrentText("Auto")
+    window.level_method.setCurrentText("Three-point")
+    yield rig
+    window._cleanup_leveling()
+
+
+def _set_points(win, points):
+    for i, (x, y) in enumerate(points, 1):
+        getattr(win, f"level_x{i}_spin").setValue(x)
+        getattr(win, f"level_y{i}_spin").setValue(y)
+
+
+def test_leveling_reuses_autofocus_and_narrows_range(leveling):
+    win, stage = leveling.win, leveling.stage
+    win.af_range.setValue(0.5)
+    win.af_coarse.setValue(0.01)
+    win.level_af_reduce.setValue(60)
+    _set_points(win, [(0, 0), (10, 0), (0, 10)])
+
+    def focus_higher():
+        stage.z += 0.1  # focus found a little higher each time
+
+    leveling.on_focus = focus_higher
+    win._run_leveling()
+    leveling.jobs[0]()
+    calls = leveling.calls
+    assert leveling.instances == [win.af_downsample.value()]
+    assert [c["center_z"] for c in calls] == [None, 2.1, 2.2]
+    assert calls[0]["z_range_mm"] == 0.5
+    assert calls[1]["z_range_mm"] == pytest.approx(0.2)
+    assert calls[2]["z_range_mm"] == pytest.approx(0.2)
+
+
+def test_stop_cancels_leveling_between_points(leveling):
+    win = leveling.win
+    leveling.on_focus = win._stop_all
+    win._run_leveling()
+    assert win.btn_stop.isEnabled()
+    with pytest.raises(RuntimeError, match="cancelled"):
+        leveling.jobs[0]()
+    assert len(leveling.calls) == 1
+
+
+def test_grid_leveling_visits_points_in_serpentine_order(leveling):
+    win = leveling.win
+    win.level_method.setCurrentText("Grid")
+    win.level_cols.setValue(5)
+    win.level_rows.setValue(4)
+    _set_points(win, [(0, 0), (40, 0), (0, 30)])
+
+    win._run_leveling()
+    leveling.jobs[0]()
+    visited = leveling.stage.moves
+    assert len(visited) == 20
+    rows = [visited[i:i + 5] for i in range(0, 20, 5)]
+    for r, pts in enumerate(rows):
+        xs = [p[0] for p in pts]
+        assert xs == ([0, 10, 20, 30, 40] if r % 2 == 0 else [40, 30, 20, 10, 0])
+        assert {p[1] for p in pts} == {10.0 * r}
+
+
+def test_repeated_leveling_point_is_probed_in_place(leveling):
+    win, stage = leveling.win, leveling.stage
+    _set_points(win, [(0, 0), (10, 0), (10, 0)])
+    focused = []
+
+    def focus():
+        focused.append((stage.x, stage.y))
+        stage.z += 0.1
+
+    leveling.on_focus = focus
+    win._run_leveling()
+    leveling.jobs[0]()
+    assert stage.moves == [(0, 0), (10, 0)]
+    assert focused == [(0, 0), (10, 0), (10, 0)]
+
+
+def test_leveling_status_updates_are_queued_to_the_ui(leveling, qapp):
+    win = leveling.win
+    seen = []
+    win.leveling_status_changed.connect(seen.append)
+    win._run_leveling()
+    leveling.jobs[0]()
+    assert seen == ["Point 1/3", "Point 2/3", "Point 3/3"]
+    # the label only changes once the queued updates are delivered
+    assert win.level_status.text() == "Starting..."
+    qapp.processEvents()
+    assert win.level_status.text() == "Point 3/3"
+
+
+def test_session_autofocus_reused_until_devices_change():
+    win = main_window.MainWindow.__new__(main_window.MainWindow)
+    win.stage, win.camera = object(), object()
+    win._autofocusing = win._leveling = False
+    win._stack_stop = None
+
+    af = win._session_autofocus(4)
+    assert win._session_autofocus(2) is af
+    assert af.metric_downsample == 2
+
+    # a second job while one is running must not share the scratch buffers
+    win._leveling = True
+    assert win._session_autofocus(2) is not af
+    win._leveling = False
+
+    win.camera = object()
+    fresh = win._session_autofocus(2)
+    assert fresh is not af and fresh.camera is win.camera
@@ -1,41 +1,18 @@
-import os
-import sys
-from pathlib import Path
-
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from PySide6 import QtWidgets
 from microstage_app.ui import main_window
 
 
-class DummySignal:
-    def connect(self, *args, **kwargs):
-        pass
-
-
-class DummyThread:
-    finished = DummySignal()
-
-
-class DummyWorker:
-    finished = DummySignal()
-
-
-def dummy_run_async(fn, *args, **kwargs):
-    # Return dummy thread/worker without executing fn to keep test fast and
-    # avoid modal dialogs.
-    return DummyThread(), DummyWorker()
+def dummy_run_pooled(done, fn, *args, **kwargs):
+    # Don't execute fn to keep test fast and avoid modal dialogs.
+    return None
 
 
-def test_manual_controls_remain_enabled_during_leveling(monkeypatch):
-    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
-    win = main_window.MainWindow()
+def test_manual_controls_remain_enabled_during_leveling(monkeypatch, window):
+    win = window
     win.stage = object()
     win.level_mode.setCurrentText("Manual")
     win.level_method.setCurrentText("Three-point")
 
-    monkeypatch.setattr(main_window, "run_async", dummy_run_async)
+    monkeypatch.setattr(main_window, "run_pooled", dummy_run_pooled)
 
     # Movement controls should be enabled before and after starting leveling.
     assert win.btn_xp.isEnabled()
@@ -49,5 +26,5 @@ def test_manual_controls_remain_enabled_during_leveling(monkeypatch):
     assert win.btn_home_x.isEnabled()
 
     # Cleanup should still leave movement controls enabled.
-    win._cleanup_leveling_thread()
+    win._cleanup_leveling()
     assert win.btn_xp.isEnabled()
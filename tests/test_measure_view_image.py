@@ -0,0 +1,112 @@
+from PySide6 import QtWidgets, QtGui, QtCore
+
+from microstage_app.ui.main_window import MeasureView
+from microstage_app.utils.img import TEXT_SCALE
+
+
+def _frame(w, h):
+    img = QtGui.QImage(w, h, QtGui.QImage.Format_RGB888)
+    img.fill(QtCore.Qt.black)
+    return img
+
+
+def test_set_image_refits_only_on_geometry_change(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    view = MeasureView()
+    fits = []
+    orig_fit = MeasureView.fitInView
+    monkeypatch.setattr(
+        MeasureView, "fitInView", lambda self, *a: (fits.append(a), orig_fit(self, *a))
+    )
+
+    view.set_image(_frame(64, 48))
+    view.set_image(_frame(64, 48))
+    assert len(fits) == 1
+    assert view._pixmap.pixmap().size() == QtCore.QSize(64, 48)
+
+    view.set_image(_frame(32, 24), source_size=(64, 48))
+    assert len(fits) == 2
+    assert view.sceneRect() == QtCore.QRectF(0, 0, 64, 48)
+    view.close()
+
+
+def test_scale_bar_overlay_is_cached(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    view = MeasureView()
+    view.set_image(_frame(200, 100))
+    view.set_scale_bar(True, 1.0)
+    calls = []
+    orig_draw = MeasureView._draw_scale_bar
+    monkeypatch.setattr(
+        MeasureView, "_draw_scale_bar", lambda self, *a: (calls.append(1), orig_draw(self, *a))
+    )
+
+    def paint():
+        target = QtGui.QImage(200, 100, QtGui.QImage.Format_RGB32)
+        painter = QtGui.QPainter(target)
+        view.drawForeground(painter, QtCore.QRectF(target.rect()))
+        painter.end()
+
+    paint()
+    paint()
+    assert len(calls) == 1
+    view.set_scale_bar(True, 2.0)
+    paint()
+    assert len(calls) == 2
+    view.close()
+
+
+def test_set_image_skips_repeated_frames():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    view = MeasureView()
+    view.set_image(_frame(64, 48))
+    key = view._pixmap.pixmap().cacheKey()
+    view.set_image(_frame(64, 48))
+    assert view._pixmap.pixmap().cacheKey() == key
+
+    changed = _frame(64, 48)
+    changed.fill(QtCore.Qt.white)
+    view.set_image(changed)
+    assert view._pixmap.pixmap().cacheKey() != key
+    key = view._pixmap.pixmap().cacheKey()
+
+    # only the top row differs; the middle row matches the frame on screen
+    top = _frame(64, 48)
+    top.fill(QtCore.Qt.white)
+    top.setPixelColor(0, 0, QtCore.Qt.black)
+    view.set_image(top)
+    assert view._pixmap.pixmap().cacheKey() != key
+    view.close()
+
+
+def test_resize_fit_is_deferred(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    view = MeasureView()
+    view.set_image(_frame(64, 48))
+    fits = []
+    monkeypatch.setattr(view, "_fit_to_view", lambda: fits.append(1))
+    view._fit_timer.timeout.disconnect()
+    view._fit_timer.timeout.connect(view._fit_to_view)
+    for w in (300, 310, 320):
+        view.resize(w, 200)
+        view.resizeEvent(QtGui.QResizeEvent(QtCore.QSize(w, 200), QtCore.QSize()))
+    assert fits == []
+    assert view._fit_timer.isActive()
+    view._fit_timer.timeout.emit()
+    assert fits == [1]
+    view.close()
+
+
+def test_scalebar_font_follows_view_font():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    view = MeasureView()
+    font = QtGui.QFont(view.font())
+    font.setPointSizeF(7.0)
+    view.setFont(font)
+    assert view._scalebar_font.pointSizeF() == 7.0 * TEXT_SCALE
+    view.close()
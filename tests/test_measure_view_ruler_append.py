@@ -1,32 +1,26 @@
-import os
-import sys
-from pathlib import Path
-
-# Ensure offscreen platform for Qt on headless environments
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from functools import lru_cache
 
 from PySide6 import QtWidgets, QtGui, QtCore
-
-# Add repository root to path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+from PySide6.QtTest import QTest
 
 from microstage_app.ui.main_window import MeasureView
 
 
+@lru_cache(maxsize=None)
 def _mouse_event(event_type, pos, button, buttons):
+    # Qt 6 events are immutable, so identical events are built once and
+    # re-sent; the handlers only read them
     return QtGui.QMouseEvent(event_type, QtCore.QPointF(*pos), button, buttons, QtCore.Qt.NoModifier)
 
 
 def _draw_line(view: MeasureView, start, end):
-    view.mousePressEvent(_mouse_event(QtCore.QEvent.MouseButtonPress, start, QtCore.Qt.LeftButton, QtCore.Qt.LeftButton))
-    view.mouseMoveEvent(_mouse_event(QtCore.QEvent.MouseMove, end, QtCore.Qt.NoButton, QtCore.Qt.LeftButton))
-    view.mouseReleaseEvent(_mouse_event(QtCore.QEvent.MouseButtonRelease, end, QtCore.Qt.LeftButton, QtCore.Qt.LeftButton))
+    vp = view.viewport()
+    QTest.mousePress(vp, QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, QtCore.QPoint(*start))
+    QTest.mouseMove(vp, QtCore.QPoint(*end))
+    QTest.mouseRelease(vp, QtCore.Qt.LeftButton, QtCore.Qt.NoModifier, QtCore.QPoint(*end))
 
 
-def test_start_ruler_appends_lines():
-    # Ensure a QApplication exists
-    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
-
+def test_start_ruler_appends_lines(qapp):
     view = MeasureView()
     view.start_ruler(1.0)
     _draw_line(view, (0, 0), (10, 0))
@@ -35,3 +29,42 @@ def test_start_ruler_appends_lines():
     view.start_ruler(1.0)
     _draw_line(view, (0, 10), (10, 10))
     assert len(view._lines) == 2
+
+
+def test_live_ruler_is_a_single_scene_item(qapp):
+    view = MeasureView()
+    view.start_ruler(1.0)
+    view.mousePressEvent(_mouse_event(QtCore.QEvent.MouseButtonPress, (0, 0), QtCore.Qt.LeftButton, QtCore.Qt.LeftButton))
+    ax, ay = view._anchor
+    n_items = len(view.scene().items())
+    view._update_live_line((ax + 260, ay))
+    assert view._live_line.tick_count() == 5
+    view._update_live_line((ax + 120, ay))
+    assert view._live_line.tick_count() == 2
+    assert len(view.scene().items()) == n_items
+    assert view._live_line.boundingRect().contains(QtCore.QPointF(ax + 100, ay + 5))
+
+    view.clear_overlays()
+    assert view._live_line is None
+
+
+def test_mouse_moves_are_coalesced(monkeypatch, qapp):
+    view = MeasureView()
+    view.start_ruler(1.0)
+    view.mousePressEvent(_mouse_event(QtCore.QEvent.MouseButtonPress, (0, 0), QtCore.Qt.LeftButton, QtCore.Qt.LeftButton))
+    updates = []
+    monkeypatch.setattr(view, "_update_live_line", updates.append)
+    for x in (10, 20, 30):
+        view.mouseMoveEvent(_mouse_event(QtCore.QEvent.MouseMove, (x, 0), QtCore.Qt.NoButton, QtCore.Qt.LeftButton))
+    assert updates == []
+    qapp.processEvents()
+    assert len(updates) == 1
+
+
+def test_live_label_is_simple_text(qapp):
+    view = MeasureView()
+    view.start_ruler(2.0)
+    _draw_line(view, (0, 0), (0, 0))
+    text = view._lines[-1]["text"]
+    assert isinstance(text, QtWidgets.QGraphicsSimpleTextItem)
+    assert text.text() == "0.0 px / 0.0 µm"
@@ -1,28 +1,48 @@
-import sys
-from pathlib import Path
+import time
 import types
 
 import numpy as np
-import cv2
 import pytest
 
-# Ensure repository root on import path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+cv2 = pytest.importorskip("cv2")
+if not hasattr(cv2, "cuda"):
+    # the GPU paths are faked by patching cv2.cuda, so the module must exist
+    pytest.skip("cv2.cuda missing", allow_module_level=True)
+
+from PySide6 import QtCore, QtWidgets
 
 from microstage_app.ui import main_window
+from microstage_app.utils import preview_worker
 
 
-def _run_preview(monkeypatch, frame, gpu):
+@pytest.fixture
+def qt_app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _fake_qimage(arr, copy=True, bgr=False):
+    # stand-in QImage: the pixels as Qt would display them (RGB order)
+    return arr[..., ::-1] if bgr and arr.ndim == 3 else arr
+
+
+def _make_window(frame, set_image):
     mw = main_window.MainWindow.__new__(main_window.MainWindow)
     mw.camera = types.SimpleNamespace(get_latest_frame=lambda: frame)
+    viewport = types.SimpleNamespace(width=lambda: 900, height=lambda: 650)
+    mw.measure_view = types.SimpleNamespace(set_image=set_image, viewport=lambda: viewport)
+    mw._preview_worker = preview_worker.PreviewWorker(mw.camera)
+    mw._preview_worker.set_view_size(900, 650)
+    return mw
+
+
+def _run_preview(monkeypatch, frame, gpu):
     captured = {}
-    mw.measure_view = types.SimpleNamespace(set_image=lambda img: captured.setdefault("img", img))
-    mw.autoexp_chk = types.SimpleNamespace(isChecked=lambda: False)
-    mw.exp_spin = None
-    mw.gain_spin = None
-    monkeypatch.setattr(main_window, "numpy_to_qimage", lambda arr: arr)
+    mw = _make_window(frame, lambda img: captured.setdefault("img", img))
+    monkeypatch.setattr(preview_worker, "numpy_to_qimage", _fake_qimage)
     if gpu:
         class FakeGpuMat:
+            __slots__ = ("mat",)
+
             def __init__(self):
                 self.mat = None
             def upload(self, arr):
@@ -30,26 +50,271 @@ def _run_preview(monkeypatch, frame, gpu):
             def download(self):
                 return self.mat
         def fake_cvtColor(gm, code):
-            converted = cv2.cvtColor(gm.mat, code)
+            assert code == cv2.COLOR_BGR2RGB
             out = FakeGpuMat()
-            out.mat = converted
+            out.mat = np.ascontiguousarray(gm.mat[..., ::-1])
             return out
         monkeypatch.setattr(cv2, "cuda_GpuMat", FakeGpuMat)
         monkeypatch.setattr(cv2.cuda, "getCudaEnabledDeviceCount", lambda: 1)
         monkeypatch.setattr(cv2.cuda, "cvtColor", fake_cvtColor, raising=False)
     else:
         monkeypatch.setattr(cv2.cuda, "getCudaEnabledDeviceCount", lambda: 0)
+    mw._preview_worker.tick()
     main_window.MainWindow._on_preview(mw)
     return captured["img"]
 
 
-def test_preview_cpu(monkeypatch):
-    frame = np.array([[[0, 0, 255], [255, 0, 0]]], dtype=np.uint8)
-    res = _run_preview(monkeypatch, frame, gpu=False)
-    assert np.array_equal(res, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+@pytest.mark.parametrize("gpu", [False, True], ids=["cpu", "gpu"])
+@pytest.mark.parametrize("shape", [(1, 2, 3), (48, 64, 3), (649, 899, 3)])
+def test_preview_shows_frames_in_rgb(monkeypatch, gpu, shape):
+    # frames up to the view size are shown as-is, only reordered to RGB
+    frame = np.arange(np.prod(shape), dtype=np.uint32).reshape(shape).astype(np.uint8)
+    res = _run_preview(monkeypatch, frame, gpu=gpu)
+    assert np.array_equal(res, frame[..., ::-1])
+
+
+def test_preview_downscales_large_frames(monkeypatch):
+    frame = np.zeros((2000, 3000, 3), dtype=np.uint8)
+    captured = {}
+
+    def set_image(img, source_size=None):
+        captured["img"] = img
+        captured["source_size"] = source_size
+
+    mw = _make_window(frame, set_image)
+    monkeypatch.setattr(preview_worker, "numpy_to_qimage", _fake_qimage)
+    mw._preview_worker.tick()
+    main_window.MainWindow._on_preview(mw)
+    assert captured["img"].shape == (600, 900, 3)
+    assert captured["source_size"] == (3000, 2000)
+
+
+def test_preview_fits_frames_slightly_larger_than_view():
+    frame = np.zeros((1200, 1600, 3), dtype=np.uint8)
+    _qimg, source_size, pixels = preview_worker.prepare_preview(frame, (800, 800))
+    assert pixels.shape == (600, 800, 3)
+    assert source_size == (1600, 1200)
+    _qimg, source_size, pixels = preview_worker.prepare_preview(frame, (1600, 1200))
+    assert pixels is frame and source_size is None
+
+
+def test_preview_worker_recycles_downscale_buffers():
+    frame = np.zeros((400, 600, 3), dtype=np.uint8)
+    worker = preview_worker.PreviewWorker(types.SimpleNamespace(get_latest_frame=lambda: frame), 16)
+    worker.set_view_size(300, 200)
+    now = {"ms": 0}
+    worker._clock = types.SimpleNamespace(elapsed=lambda: now["ms"])
+    pixels = []
+    for ms in (0, 20, 40):
+        now["ms"] = ms
+        worker.tick()
+        pixels.append(worker.take()[2])
+    assert pixels[0].shape == (200, 300, 3)
+    assert pixels[1] is not pixels[0]
+    assert pixels[2] is pixels[0]
+    # a new view size needs new buffers
+    worker.set_view_size(150, 100)
+    now["ms"] = 60
+    worker.tick()
+    assert worker.take()[2].shape == (100, 150, 3)
+
+
+def test_view_resize_updates_worker_size(qt_app):
+    view = main_window.MeasureView()
+    worker = preview_worker.PreviewWorker(types.SimpleNamespace(get_latest_frame=lambda: None))
+    view.viewport_resized.connect(worker.set_view_size)
+    view.resize(400, 300)
+    view.show()
+    qt_app.processEvents()
+    assert worker.view_size == view.preview_size()
+    assert worker.view_size[0] > 0 and worker.view_size[1] > 0
+    view.close()
+
+
+def test_preview_worker_keeps_only_latest_frame():
+    frames = []
+
+    def grab():
+        frames.append(np.zeros((2, 2, 3), dtype=np.uint8))
+        return frames[-1]
+
+    worker = preview_worker.PreviewWorker(types.SimpleNamespace(get_latest_frame=grab), 16)
+    ready = []
+    worker.frameReady.connect(lambda: ready.append(1))
+    now = {"ms": 0}
+    worker._clock = types.SimpleNamespace(elapsed=lambda: now["ms"])
+    worker.tick()
+    assert len(frames) == 1 and ready == [1]
+    assert worker.take()[2] is frames[0]
+    assert worker.take() is None
+    # renders are gated to the display refresh rate
+    now["ms"] = 8
+    worker.tick()
+    assert len(frames) == 1
+    now["ms"] = 17
+    worker.tick()
+    assert len(frames) == 2 and ready == [1, 1]
+    # nothing is fetched while the GUI has not collected the pending frame
+    now["ms"] = 100
+    worker.tick()
+    assert len(frames) == 2
+    assert worker.take()[2] is frames[1]
+
 
+def test_preview_worker_backs_off_when_frames_are_slow(monkeypatch):
+    now = {"ms": 0}
+    cost = {"ms": 50}
+    frames = []
 
-def test_preview_gpu(monkeypatch):
+    def grab():
+        frames.append(now["ms"])
+        return np.zeros((2, 2, 3), dtype=np.uint8)
+
+    def prepare(frame, view_size, dst=None):
+        now["ms"] += cost["ms"]
+        return None, None, frame
+
+    monkeypatch.setattr(preview_worker, "prepare_preview", prepare)
+    worker = preview_worker.PreviewWorker(types.SimpleNamespace(get_latest_frame=grab), 16)
+    worker._clock = types.SimpleNamespace(elapsed=lambda: now["ms"])
+
+    def run_until(ms):
+        while now["ms"] < ms:
+            worker.tick()
+            worker.take()
+            now["ms"] += 8
+
+    run_until(1000)
+    # each 50 ms frame is followed by at least 50 ms of idle time
+    assert all(b - a >= 100 for a, b in zip(frames, frames[1:]))
+    cost["ms"] = 0
+    n = len(frames)
+    run_until(3000)
+    # once frames are cheap again the worker recovers to the render rate
+    assert frames[-1] - frames[-2] <= 16
+    assert len(frames) - n > 50
+
+
+def test_preview_worker_builds_images_off_gui_thread(qt_app):
+    app = qt_app
+    frame = np.zeros((4, 6, 3), dtype=np.uint8)
+    threads = []
+
+    def grab():
+        threads.append(QtCore.QThread.currentThread())
+        return frame
+
+    thread = QtCore.QThread()
+    worker = preview_worker.PreviewWorker(types.SimpleNamespace(get_latest_frame=grab), 16)
+    worker.moveToThread(thread)
+    thread.start()
+    try:
+        QtCore.QMetaObject.invokeMethod(worker, "start", QtCore.Qt.QueuedConnection)
+        deadline = time.monotonic() + 2
+        item = None
+        while item is None and time.monotonic() < deadline:
+            app.processEvents()
+            item = worker.take()
+        assert item is not None
+        qimg, source_size, _pixels = item
+        assert (qimg.width(), qimg.height()) == (6, 4)
+        assert source_size is None
+        assert threads[0] is not app.thread()
+    finally:
+        QtCore.QMetaObject.invokeMethod(worker, "stop", QtCore.Qt.BlockingQueuedConnection)
+        thread.quit()
+        thread.wait(2000)
+
+
+def test_preview_timer_follows_window_visibility(monkeypatch):
+    state = {"active": False, "visible": True, "minimized": False}
+
+    def invoke(obj, name, conn):
+        state["active"] = name == "start"
+
+    monkeypatch.setattr(QtCore.QMetaObject, "invokeMethod", invoke)
+    mw = types.SimpleNamespace(
+        _preview_worker=object(),
+        camera=object(),
+        isVisible=lambda: state["visible"],
+        isMinimized=lambda: state["minimized"],
+    )
+    sync = main_window.MainWindow._sync_preview_timer
+    sync(mw)
+    assert state["active"]
+    state["minimized"] = True
+    sync(mw)
+    assert not state["active"]
+    state["minimized"] = False
+    sync(mw)
+    assert state["active"]
+    mw.camera = None
+    sync(mw)
+    assert not state["active"]
+
+
+def test_cuda_probe_is_cached(monkeypatch):
+    calls = []
+
+    def count():
+        calls.append(1)
+        return 0
+
+    monkeypatch.setattr(cv2.cuda, "getCudaEnabledDeviceCount", count)
+    mw = main_window.MainWindow.__new__(main_window.MainWindow)
+    for _ in range(3):
+        assert mw._cuda_available() is False
+    assert len(calls) == 1
+
+
+def test_preview_skips_gpu_round_trip(monkeypatch):
+    class NoGpuMat:
+        def __init__(self):
+            raise AssertionError("preview must not upload to the GPU")
+
+    monkeypatch.setattr(cv2, "cuda_GpuMat", NoGpuMat)
+    monkeypatch.setattr(cv2.cuda, "getCudaEnabledDeviceCount", lambda: 1)
     frame = np.array([[[0, 0, 255], [255, 0, 0]]], dtype=np.uint8)
-    res = _run_preview(monkeypatch, frame, gpu=True)
-    assert np.array_equal(res, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    captured = {}
+    mw = _make_window(frame, lambda img: captured.setdefault("img", img))
+    monkeypatch.setattr(preview_worker, "numpy_to_qimage", _fake_qimage)
+    mw._preview_worker.tick()
+    main_window.MainWindow._on_preview(mw)
+    assert np.array_equal(captured["img"], frame[..., ::-1])
+
+
+def test_auto_exposure_polled_on_its_own_timer(monkeypatch, qt_app):
+    monkeypatch.setattr(main_window.MainWindow, "_auto_connect_async", lambda self: None)
+    win = main_window.MainWindow()
+    reads = []
+
+    class FakeCam:
+        def set_exposure_ms(self, ms, auto):
+            pass
+
+        def get_exposure_ms(self):
+            reads.append("exp")
+            return 12.0
+
+        def get_gain(self):
+            reads.append("gain")
+            return 2.0
+
+    win.camera = FakeCam()
+    win._preview_worker = types.SimpleNamespace(take=lambda: None)
+    win.autoexp_chk.setChecked(True)
+    assert win._auto_refresh_timer.isActive()
+    assert win.exp_spin.value() == 12.0
+    reads.clear()
+    # preview frames no longer touch the camera's exposure settings
+    for _ in range(5):
+        win._on_preview()
+    assert reads == []
+    win._auto_refresh_timer.timeout.emit()
+    assert reads == ["exp", "gain"]
+    win.autoexp_chk.setChecked(False)
+    assert not win._auto_refresh_timer.isActive()
+    win._preview_worker = None
+    win.camera = None
+    win.fps_timer.stop()
+    win.close()
@@ -1,27 +1,15 @@
 import gc
-import os
-import sys
-import time
-from pathlib import Path
+import threading
+import weakref
 
 import pytest
 from PySide6.QtCore import QThread
 
-# Ensure repository root is on the import path
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-# Stub out the image utilities to avoid heavy Qt GUI imports during tests
-import types
-
-img_stub = types.ModuleType("microstage_app.utils.img")
-img_stub.draw_scale_bar = lambda img, um_per_px: img
-sys.modules["microstage_app.utils.img"] = img_stub
-
+# The real image utilities are imported: these runs draw no scale bar, and
+# replacing the module in sys.modules would leak the stub into every test
+# module collected afterwards.
 from microstage_app.control.raster import RasterRunner, RasterConfig
 
-# Use offscreen platform to avoid GUI requirements
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-
 
 class StageStub:
     def __init__(self):
@@ -64,25 +52,39 @@ def test_raster_config_stack_defaults():
     assert cfg.stack_step_mm == 0.01
 
 
-def test_raster_thread_stop(capsys):
-    stage = StageStub()
-    cam = CameraStub()
-    writer = WriterStub()
-    cfg = RasterConfig(rows=3, cols=3, capture=False)
+@pytest.fixture
+def raster_rig():
+    return StageStub(), CameraStub(), WriterStub()
+
+
+@pytest.mark.parametrize("rows,cols", [(3, 3), (5, 5), (10, 10)])
+def test_raster_thread_stop(capsys, raster_rig, rows, cols):
+    stage, cam, writer = raster_rig
+    cfg = RasterConfig(rows=rows, cols=cols, capture=False)
     runner = RasterRunner(stage, cam, writer, cfg)
 
+    started = threading.Event()
+
     class RunnerThread(QThread):
         def run(self):
+            started.set()
             runner.run()
 
     thread = RunnerThread()
     thread.start()
-    time.sleep(0.05)
+    assert started.wait(1.0)
     runner.stop()
     assert thread.wait(1000)
 
-    # Ensure thread is cleaned up and no QThread warnings are emitted
+    # Ensure thread is cleaned up and no QThread warnings are emitted;
+    # only the youngest generation is collected, and only if it is needed
+    wref = weakref.ref(thread)
     del thread
-    gc.collect()
+    for _ in range(10):
+        if wref() is None:
+            break
+        gc.collect(0)
+    else:
+        pytest.fail("raster thread leaked")
     captured = capsys.readouterr()
     assert "QThread" not in captured.err
@@ -0,0 +1,37 @@
+import types
+
+from microstage_app.ui import main_window
+
+
+def _window():
+    mw = main_window.MainWindow.__new__(main_window.MainWindow)
+    texts = []
+    mw.stage_pos = types.SimpleNamespace(setText=texts.append)
+    mw._last_pos = {"x": None, "y": None, "z": None}
+    mw.stage_bounds = {
+        "xmin": 0.0, "xmax": 100.0, "ymin": 0.0, "ymax": 50.0,
+        "zmin": -1.0, "zmax": 20.0,
+    }
+    return mw, texts
+
+
+def test_idle_position_updates_leave_label_alone():
+    mw, texts = _window()
+    for _ in range(3):
+        mw._on_stage_position((1.0, 2.0, 3.0))
+    assert texts == [
+        "Pos: X1.000000 Y2.000000 Z3.000000\n"
+        "Limits: X[0.000000,100.000000] Y[0.000000,50.000000] Z[-1.000000,20.000000]"
+    ]
+    mw._on_stage_position((None, None, 4.0))
+    assert len(texts) == 2
+    assert texts[-1].startswith("Pos: X1.000000 Y2.000000 Z4.000000\n")
+
+
+def test_limits_line_follows_bounds_changes():
+    mw, texts = _window()
+    mw._on_stage_position((1.0, 2.0, 3.0))
+    mw.stage_bounds = dict(mw.stage_bounds, xmax=120.0)
+    mw._on_stage_position((1.0, 2.0, 3.0))
+    assert len(texts) == 2
+    assert "X[0.000000,120.000000]" in texts[-1]
@@ -1,11 +1,4 @@
-import os
-import sys
-from pathlib import Path
-
-os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from PySide6 import QtWidgets, QtCore
+import pytest
 from microstage_app.ui import main_window
 
 
@@ -26,25 +19,47 @@ class FakeCam:
         pass
 
 
-def test_widgets_disabled_when_capability_missing(monkeypatch):
-    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
-    win = main_window.MainWindow()
+@pytest.mark.ui
+def test_widgets_disabled_when_capability_missing(monkeypatch, window):
+    win = window
 
     monkeypatch.setattr(main_window, "create_camera", lambda dev_id=None: FakeCam())
-    monkeypatch.setattr(main_window.MainWindow, "_populate_speed_levels", lambda self: None)
-    monkeypatch.setattr(main_window.MainWindow, "_apply_speed", lambda self: None)
-    monkeypatch.setattr(main_window.MainWindow, "_populate_color_depths", lambda self: None)
-    monkeypatch.setattr(main_window.MainWindow, "_populate_binning", lambda self: None)
-    monkeypatch.setattr(main_window.MainWindow, "_populate_resolutions", lambda self: None)
-    monkeypatch.setattr(main_window.MainWindow, "_apply_camera_profile", lambda self: None)
-    monkeypatch.setattr(main_window.MainWindow, "_sync_cam_controls", lambda self: None)
-    monkeypatch.setattr(QtCore.QTimer, "singleShot", lambda ms, func: func())
-
-    win.preview_timer.start = lambda *a, **k: None
-    win.fps_timer.start = lambda *a, **k: None
+    for name in (
+        "_populate_speed_levels",
+        "_apply_speed",
+        "_populate_color_depths",
+        "_populate_binning",
+        "_populate_resolutions",
+        "_apply_camera_profile",
+        "_sync_cam_controls",
+    ):
+        monkeypatch.setattr(main_window.MainWindow, name, lambda self: None)
 
     win._connect_camera()
 
     assert win.exp_spin.isEnabled()
     assert not win.brightness_spin.isEnabled()
     assert not win.brightness_slider.isEnabled()
+
+
+def test_camera_caps_probed_once_per_camera():
+    misses = []
+
+    class CountingCam(FakeCam):
+        def __getattr__(self, name):
+            misses.append(name)
+            raise AttributeError(name)
+
+    win = main_window.MainWindow.__new__(main_window.MainWindow)
+    win.camera = CountingCam()
+    caps = win._camera_caps()
+    assert caps["set_exposure_ms"] and not caps["set_brightness"]
+    probes = len(misses)
+    for _ in range(3):
+        win._camera_caps()
+    assert len(misses) == probes
+
+    win.camera = FakeCam()
+    assert win._camera_caps() is not caps
+    win.camera = None
+    assert not any(win._camera_caps().values())